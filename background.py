@@ -4,6 +4,7 @@ Gestion du fond avec nuages et ciel
 import pygame
 import random
 from config import *
+from render_cache import draw_gradient
 
 class Cloud:
     def __init__(self, x, y):
@@ -49,12 +50,7 @@ class Background:
     def draw(self, screen):
         """Dessine le fond avec dégradé violet/bleu nuit et nuages"""
         # Fond dégradé violet/bleu nuit moderne
-        for y in range(SCREEN_HEIGHT):
-            ratio = y / SCREEN_HEIGHT
-            r = int(GRADIENT_START[0] * (1 - ratio) + GRADIENT_END[0] * ratio)
-            g = int(GRADIENT_START[1] * (1 - ratio) + GRADIENT_END[1] * ratio)
-            b = int(GRADIENT_START[2] * (1 - ratio) + GRADIENT_END[2] * ratio)
-            pygame.draw.line(screen, (r, g, b), (0, y), (screen.get_width(), y))
+        draw_gradient(screen)
         
         # Dessiner les nuages
         for cloud in self.clouds:
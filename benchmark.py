@@ -0,0 +1,878 @@
+"""
+Mesures de performance de Cyber Jump (sans fenêtre)
+Usage :
+    python benchmark.py                 # lance tous les scénarios
+    python benchmark.py gradient        # lance un scénario précis
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from config import *
+
+
+def _time_frames(draw, frames):
+    """Exécute draw() frames fois et retourne le temps moyen par frame en ms"""
+    draw()  # échauffement (remplit les caches)
+    start = time.perf_counter()
+    for _ in range(frames):
+        draw()
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def _report(label, before_ms, after_ms):
+    """Affiche une ligne avant/après"""
+    gain = before_ms / after_ms if after_ms > 0 else float("inf")
+    print(f"  {label:<34} avant {before_ms:8.3f} ms   après {after_ms:8.3f} ms   x{gain:6.1f}")
+
+
+# ---------------------------------------------------------------------------
+# Dégradé de fond
+# ---------------------------------------------------------------------------
+
+def _legacy_gradient(screen):
+    """Ancien dégradé : une ligne par rangée de pixels, recalculé à chaque frame"""
+    for y in range(SCREEN_HEIGHT):
+        ratio = y / SCREEN_HEIGHT
+        r = int(GRADIENT_START[0] * (1 - ratio) + GRADIENT_END[0] * ratio)
+        g = int(GRADIENT_START[1] * (1 - ratio) + GRADIENT_END[1] * ratio)
+        b = int(GRADIENT_START[2] * (1 - ratio) + GRADIENT_END[2] * ratio)
+        pygame.draw.line(screen, (r, g, b), (0, y), (screen.get_width(), y))
+
+
+def bench_gradient(frames=300):
+    """Dégradé plein écran et split-screen : boucle de lignes vs surface en cache"""
+    from render_cache import draw_gradient
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    half_w = SCREEN_WIDTH // 2
+    left = screen.subsurface((0, 0, half_w, SCREEN_HEIGHT))
+    right = screen.subsurface((half_w, 0, half_w, SCREEN_HEIGHT))
+
+    print(f"Dégradé de fond ({frames} frames)")
+    _report("plein écran",
+            _time_frames(lambda: _legacy_gradient(screen), frames),
+            _time_frames(lambda: draw_gradient(screen), frames))
+    _report("split-screen PvP (2 moitiés)",
+            _time_frames(lambda: (_legacy_gradient(left), _legacy_gradient(right)), frames),
+            _time_frames(lambda: (draw_gradient(left), draw_gradient(right)), frames))
+
+
+# ---------------------------------------------------------------------------
+# Sprite du joueur
+# ---------------------------------------------------------------------------
+
+def bench_player(frames=300):
+    """Dessin de 2 joueurs sur 2 moitiés d'écran : primitives à chaque frame vs sprite pré-rendu"""
+    import player as player_module
+    from player import Player
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    players = [Player(200, 300, 1), Player(260, 300, 2)]
+    players[0].ground_shield_timer = 120
+
+    def draw_uncached():
+        for _ in range(2):
+            for p in players:
+                player_module._BODY_SPRITES.clear()
+                player_module._AURA_LAYERS.clear()
+                p.draw(screen)
+
+    def draw_cached():
+        for _ in range(2):
+            for p in players:
+                p.draw(screen)
+
+    print(f"Sprite du joueur, 2 joueurs x 2 moitiés ({frames} frames)")
+    _report("robot + halo", _time_frames(draw_uncached, frames), _time_frames(draw_cached, frames))
+
+
+# ---------------------------------------------------------------------------
+# Ennemis et boss
+# ---------------------------------------------------------------------------
+
+def bench_enemies(frames=300):
+    """30 sbires du boss à l'écran : primitives à chaque frame vs atlas d'animation"""
+    import enemy as enemy_module
+    from enemy import Enemy
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pad = enemy_module.SPRITE_PADDING
+    minions = [Enemy(60 + (i % 15) * 70, 200 + (i // 15) * 300, 0, SCREEN_WIDTH, flying=i % 2 == 1)
+               for i in range(30)]
+    for i, e in enumerate(minions):
+        e.animation_frame = i * 0.7
+        e.walk_animation = int(e.animation_frame) % 4
+
+    def draw_primitives():
+        for e in minions:
+            frame = screen.subsurface((e.rect.x - pad, e.rect.y - pad, e.rect.width + 2 * pad, e.rect.height + 2 * pad))
+            blink = int(e.animation_frame * 0.5) % 20 < 1
+            enemy_module._draw_frame(frame, e.color, e.flying, e.direction > 0, e.walk_animation, blink)
+
+    def draw_atlas():
+        for e in minions:
+            e.draw(screen)
+
+    print(f"Ennemis, 30 sbires ({frames} frames)")
+    _report("corps des ennemis", _time_frames(draw_primitives, frames), _time_frames(draw_atlas, frames))
+
+
+# ---------------------------------------------------------------------------
+# Décor statique du niveau
+# ---------------------------------------------------------------------------
+
+def bench_static_layer(frames=300):
+    """Décor d'un niveau parkour en défilement : plateformes dessinées vs colonnes pré-rendues"""
+    from level import Level
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    level = Level(level_id=3)
+    cameras = [int(i * (level.end_x - SCREEN_WIDTH) / frames) for i in range(frames)]
+    state = {"i": 0}
+
+    def next_camera():
+        state["i"] = (state["i"] + 1) % frames
+        return cameras[state["i"]]
+
+    def draw_platforms():
+        camera_x = next_camera()
+        for platform in level.platforms:
+            if platform.rect.right - camera_x > 0 and platform.rect.left - camera_x < SCREEN_WIDTH:
+                platform.draw(screen, camera_x)
+        level.draw_checkpoints(screen, camera_x)
+        level.draw_goal(screen, camera_x)
+
+    def draw_chunks():
+        level.static_layer.draw(screen, next_camera())
+
+    start = time.perf_counter()
+    Level(level_id=3)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"Décor statique, niveau 4 ({level.static_layer.num_chunks} colonnes, construction {build_ms:.1f} ms)")
+    _report("plateformes + checkpoints + drapeau", _time_frames(draw_platforms, frames), _time_frames(draw_chunks, frames))
+
+
+# ---------------------------------------------------------------------------
+# Écrans statiques (menu)
+# ---------------------------------------------------------------------------
+
+def bench_menu_idle(frames=300):
+    """Menu principal affiché 5 s avec un changement de sélection par seconde, écran 1080p"""
+    from menu import Menu
+    from presentation import Presenter
+    presenter = Presenter()
+    presenter.open_display((1920, 1080))
+    display = presenter.display
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    menu = Menu(screen)
+    state = {"frame": 0}
+
+    def step():
+        state["frame"] += 1
+        if state["frame"] % FPS == 0:
+            menu.selected_option = (menu.selected_option + 1) % len(menu.options)
+
+    def draw_always():
+        step()
+        menu.draw()
+        scaled = pygame.transform.smoothscale(screen, display.get_size())
+        display.blit(scaled, (0, 0))
+        pygame.display.flip()
+
+    def draw_presenter():
+        step()
+        key = ("menu", menu.selected_option)
+        if presenter.needs_redraw(key):
+            menu.draw()
+            presenter.present_static(screen, key)
+
+    print(f"Menu au repos, 1920x1080 ({frames} frames)")
+    _report("dessin + mise à l'échelle", _time_frames(draw_always, frames), _time_frames(draw_presenter, frames))
+    print(f"  présentations : {presenter.stats}")
+
+
+# ---------------------------------------------------------------------------
+# Mise à l'échelle vers la fenêtre
+# ---------------------------------------------------------------------------
+
+def bench_upscale(frames=120):
+    """Coût de présentation d'une frame pour chaque mode de mise à l'échelle, en 1080p et 1440p"""
+    from presentation import Presenter
+    from background import Background
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    Background().draw(screen)
+    presenter = Presenter("smoothscale")
+    for size in ((1920, 1080), (2560, 1440)):
+        print(f"Mise à l'échelle 1200x800 -> {size[0]}x{size[1]} ({frames} frames)")
+        presenter.set_mode("smoothscale")
+        presenter.open_display(size)
+
+        def legacy():
+            scaled = pygame.transform.smoothscale(screen, presenter.size)
+            presenter.display.blit(scaled, (0, 0))
+            pygame.display.flip()
+
+        print(f"  {'ancien (smoothscale + allocation)':<34} {_time_frames(legacy, frames):8.3f} ms")
+        for mode in UPSCALE_MODES:
+            presenter.set_mode(mode)
+            presenter.open_display(size)
+            if presenter.mode != mode:
+                print(f"  {mode:<34} indisponible")
+                continue
+            ms = _time_frames(lambda: presenter.present(screen), frames)
+            print(f"  {mode:<34} {ms:8.3f} ms")
+    presenter.set_mode("smoothscale")
+
+
+# ---------------------------------------------------------------------------
+# Textes du HUD
+# ---------------------------------------------------------------------------
+
+def bench_text(frames=300):
+    """HUD d'une course : police chargée + texte rendu à chaque frame vs caches partagés"""
+    from render_cache import get_font, text_cache
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    state = {"frame": 0}
+
+    def lines():
+        state["frame"] += 1
+        seconds = state["frame"] // FPS
+        return [(48, f"{seconds // 60:02d}:{seconds % 60:02d}", WHITE),
+                (32, "Manche 3/5", YELLOW),
+                (24, "Joueur 1 : 12 pts", CYAN),
+                (24, "Joueur 2 : 9 pts", GREEN),
+                (24, "GOAL", WHITE)]
+
+    def draw_uncached():
+        for y, (size, text, color) in enumerate(lines()):
+            screen.blit(pygame.font.Font(None, size).render(text, True, color), (20, 20 + y * 40))
+
+    def draw_cached():
+        for y, (size, text, color) in enumerate(lines()):
+            screen.blit(get_font(size).render(text, True, color), (20, 20 + y * 40))
+
+    print(f"Textes du HUD, 5 lignes ({frames} frames)")
+    _report("police + rendu du texte", _time_frames(draw_uncached, frames), _time_frames(draw_cached, frames))
+    print(f"  cache de textes : {text_cache.stats()}")
+
+
+# ---------------------------------------------------------------------------
+# Surfaces d'effets (bulles, voiles)
+# ---------------------------------------------------------------------------
+
+def bench_effects(frames=300):
+    """2 joueurs avec 8 bulles chacun + teintes du split-screen : allocation vs pool"""
+    from effect_pool import effect_pool
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    half_w = SCREEN_WIDTH // 2
+    bubbles = [(100 + i * 30 + j * half_w, 300, 3 + i * 0.7, 60 - i * 5) for i in range(8) for j in range(2)]
+
+    def draw_allocating():
+        for x, y, size, life in bubbles:
+            alpha = min(255, int(255 * life / 60))
+            surf = pygame.Surface((int(size * 2), int(size * 2)), pygame.SRCALPHA)
+            pygame.draw.circle(surf, (200, 230, 255, alpha), (int(size), int(size)), int(size))
+            screen.blit(surf, (int(x - size), int(y - size)))
+        for x, color in ((0, BLUE), (half_w, GREEN)):
+            tint = pygame.Surface((half_w, SCREEN_HEIGHT))
+            tint.set_alpha(25)
+            tint.fill(color)
+            screen.blit(tint, (x, 0))
+
+    def draw_pooled():
+        for x, y, size, life in bubbles:
+            alpha = min(255, int(255 * life / 60))
+            screen.blit(effect_pool.disc(size, (200, 230, 255), alpha), (int(x - size), int(y - size)))
+        for x, color in ((0, BLUE), (half_w, GREEN)):
+            screen.blit(effect_pool.fill((half_w, SCREEN_HEIGHT), color, 25), (x, 0))
+
+    print(f"Effets, 16 bulles + 2 teintes ({frames} frames)")
+    _report("bulles + teintes", _time_frames(draw_allocating, frames), _time_frames(draw_pooled, frames))
+    print(f"  pool d'effets : {effect_pool.stats}")
+
+
+# ---------------------------------------------------------------------------
+# Particules
+# ---------------------------------------------------------------------------
+
+def _legacy_burst(particles, count):
+    """Ancienne représentation : une liste de dictionnaires"""
+    import math
+    import random
+    for _ in range(count):
+        angle = random.uniform(0, 2 * math.pi)
+        speed = random.uniform(2, 6)
+        particles.append({"x": 600, "y": 400, "vx": math.cos(angle) * speed,
+                          "vy": math.sin(angle) * speed - 4, "size": random.randint(4, 10),
+                          "color": YELLOW, "life": random.randint(15, 25)})
+
+
+def _legacy_update(particles):
+    for p in particles[:]:
+        p["x"] += p["vx"]
+        p["y"] += p["vy"]
+        p["vy"] += 0.3
+        p["life"] -= 1
+        p["size"] = max(1, p["size"] - 0.3)
+        if p["life"] <= 0:
+            particles.remove(p)
+
+
+def bench_particles(frames=300, bursts=32):
+    """Intégration d'éclats d'étoiles (bursts x 16 particules, une salve par frame) :
+    listes de dictionnaires vs colonnes NumPy vs listes par particule (sans NumPy)"""
+    import random
+    from particles import ParticleSystem, HAS_NUMPY, emit_collect_burst
+
+    def legacy():
+        particles = []
+
+        def step():
+            if len(particles) < bursts * 16:
+                _legacy_burst(particles, 16)
+            _legacy_update(particles)
+        return step
+
+    def columns(use_numpy):
+        system = ParticleSystem(bursts * 16, gravity=0.3, growth=-0.3, fade_frames=15, use_numpy=use_numpy)
+
+        def step():
+            if len(system) < bursts * 16:
+                emit_collect_burst(system, 600, 400, [YELLOW])
+            system.update()
+        return step
+
+    print(f"Particules, jusqu'à {bursts * 16} éclats ({frames} frames)")
+    random.seed(0)
+    before = _time_frames(legacy(), frames)
+    random.seed(0)
+    _report("intégration (sans NumPy)", before, _time_frames(columns(False), frames))
+    if HAS_NUMPY:
+        random.seed(0)
+        _report("intégration (NumPy)", before, _time_frames(columns(True), frames))
+
+
+# ---------------------------------------------------------------------------
+# Culling des entités
+# ---------------------------------------------------------------------------
+
+def bench_culling(frames=300, count=2000):
+    """Recherche des ennemis visibles sur un très long niveau : test de chaque ennemi vs index trié"""
+    from level import Level
+    from enemy import Enemy
+    level = Level(level_id=0)
+    level.enemies = [Enemy(200 + i * 50, 400, 150 + i * 50, 300 + i * 50, flying=i % 3 == 0)
+                     for i in range(count)]
+    length = 200 + count * 50
+    state = {"camera": 0}
+
+    def next_camera():
+        state["camera"] = (state["camera"] + 37) % length
+        return state["camera"]
+
+    def linear():
+        camera_x = next_camera()
+        return [e for e in level.enemies
+                if e.rect.right - camera_x > 0 and e.rect.left - camera_x < SCREEN_WIDTH]
+
+    def indexed():
+        camera_x = next_camera()
+        return level.visible_enemies(camera_x, camera_x + SCREEN_WIDTH)
+
+    print(f"Culling, {count} ennemis ({frames} frames)")
+    _report("ennemis visibles", _time_frames(linear, frames), _time_frames(indexed, frames))
+
+
+# ---------------------------------------------------------------------------
+# Collisions avec les plateformes
+# ---------------------------------------------------------------------------
+
+def bench_collision(frames=300, count=600):
+    """2 joueurs + 40 ennemis sur un niveau de count plateformes : liste complète vs grille"""
+    from platform import Platform
+    from player import Player
+    from enemy import Enemy
+    from spatial_index import SpatialHash
+    platforms = [Platform(0, SCREEN_HEIGHT - 50, count * 150)]
+    platforms += [Platform(200 + i * 150, 250 + (i * 97) % 400, 100) for i in range(count)]
+    grid = SpatialHash(platforms)
+
+    def scenario(source):
+        players = [Player(300, 300, 1), Player(5000, 300, 2)]
+        enemies = [Enemy(400 + i * 300, SCREEN_HEIGHT - 50 - ENEMY_HEIGHT, 350 + i * 300, 550 + i * 300)
+                   for i in range(40)]
+
+        def step():
+            for p in players:
+                p.move_right()
+                p.update(source)
+            for e in enemies:
+                e.update(source)
+        return step
+
+    print(f"Collisions, {len(platforms)} plateformes ({frames} frames)")
+    _report("2 joueurs + 40 ennemis", _time_frames(scenario(platforms), frames), _time_frames(scenario(grid), frames))
+
+
+# ---------------------------------------------------------------------------
+# Pool d'ennemis
+# ---------------------------------------------------------------------------
+
+def bench_enemy_pool(frames=300, count=500):
+    """count patrouilleurs (1/3 volants) : Enemy.update un par un vs EnemyPool.update en bloc"""
+    from platform import Platform
+    from enemy import Enemy
+    from enemy_pool import EnemyPool
+    from spatial_index import SpatialHash
+    platforms = [Platform(0, SCREEN_HEIGHT - 50, count * 100)]
+    platforms += [Platform(150 + i * 400, 250 + (i * 97) % 400, 200) for i in range(count // 4)]
+    grid = SpatialHash(platforms)
+
+    def make_enemies():
+        return [Enemy(100 + i * 100, SCREEN_HEIGHT - 50 - ENEMY_HEIGHT if i % 3 else 300,
+                      50 + i * 100, 250 + i * 100, flying=i % 3 == 0) for i in range(count)]
+
+    enemies = make_enemies()
+
+    def one_by_one():
+        for e in enemies:
+            e.update(grid)
+
+    pool = EnemyPool()
+    pool.sync(make_enemies())
+
+    def batched():
+        pool.update(grid)
+
+    print(f"Ennemis, {count} patrouilleurs ({frames} frames)")
+    _report("mise à jour des ennemis", _time_frames(one_by_one, frames), _time_frames(batched, frames))
+
+
+# ---------------------------------------------------------------------------
+# Contacts joueurs / ennemis / étoiles
+# ---------------------------------------------------------------------------
+
+def bench_contacts(frames=300, count=1000):
+    """2 joueurs face à count ennemis et count étoiles : toutes les paires vs broad phase du niveau"""
+    from level import Level
+    from player import Player
+    from enemy import Enemy
+    from collectible import Collectible, CollectibleSet
+    level = Level(level_id=0)
+    level.enemies = [Enemy(200 + i * 60, 400, 150 + i * 60, 300 + i * 60, flying=i % 3 == 0)
+                     for i in range(count)]
+    level.collectibles = CollectibleSet([Collectible(230 + i * 60, 200 + (i * 37) % 300)
+                                         for i in range(count)], emitter=level.particles)
+    players = [Player(3000, 100, 1), Player(9000, 100, 2)]
+
+    def all_pairs():
+        for c in level.collectibles:
+            for p in players:
+                if c.check_collision(p):
+                    break
+        for e in level.enemies:
+            for p in players:
+                e.check_collision_with_player(p)
+
+    def broad_phase():
+        for c in level.contact_candidates("collectibles", players, COLLECT_REACH + 1):
+            for p in players:
+                if c.check_collision(p):
+                    break
+        for e in level.contact_candidates("enemies", players):
+            for p in players:
+                e.check_collision_with_player(p)
+
+    print(f"Contacts, {count} ennemis + {count} étoiles ({frames} frames)")
+    _report("2 joueurs", _time_frames(all_pairs, frames), _time_frames(broad_phase, frames))
+
+
+# ---------------------------------------------------------------------------
+# Étoiles ramassées
+# ---------------------------------------------------------------------------
+
+def bench_collectibles(frames=300, count=1000, remaining=50):
+    """count étoiles dont remaining pas encore ramassées : liste complète vs étoiles réparties"""
+    from collectible import Collectible, CollectibleSet
+    from particles import ParticleSystem
+
+    def stars():
+        items = [Collectible(200 + i * 60, 300, "kill_ground" if i % 2 else "kill_flying")
+                 for i in range(count)]
+        for c in items[remaining:]:
+            c.collected = True
+            c.collect_timer = c.collect_duration
+        return items
+
+    legacy = stars()
+    partitioned = CollectibleSet(stars(), emitter=ParticleSystem(COLLECT_PARTICLE_CAPACITY))
+    partitioned.update()  # les animations terminées sont retirées
+
+    def linear():
+        for c in legacy:
+            c.update()
+        return sum(1 for c in legacy if not c.collected)
+
+    def buckets():
+        partitioned.update()
+        return len(partitioned)
+
+    def phase_list():
+        items = [c for c in legacy if c.collect_type != "kill_flying"]
+        items.extend(Collectible(200 + i * 60, 200, "kill_flying") for i in range(10))
+        return items
+
+    def phase_buckets():
+        partitioned.discard_type("kill_flying")
+        partitioned.extend(Collectible(200 + i * 60, 200, "kill_flying") for i in range(10))
+
+    print(f"Étoiles, {count} dont {remaining} restantes ({frames} frames)")
+    _report("mise à jour + compteur du HUD", _time_frames(linear, frames), _time_frames(buckets, frames))
+    _report("changement de phase du boss", _time_frames(phase_list, frames),
+            _time_frames(phase_buckets, frames))
+
+
+# ---------------------------------------------------------------------------
+# Checkpoints
+# ---------------------------------------------------------------------------
+
+def bench_checkpoints(frames=300, count=2000):
+    """2 joueurs sur un niveau de count checkpoints : parcours de la liste vs index trié + masque"""
+    from level import Level
+    from player import Player
+    level = Level(level_id=0)
+    level.checkpoints = [(100 + i * 120, 300 + (i * 53) % 200) for i in range(count)]
+    length = 100 + count * 120
+
+    legacy_players = [Player(0, 300, 1), Player(0, 300, 2)]
+    indexed_players = [Player(0, 300, 1), Player(0, 300, 2)]
+    for p in legacy_players:
+        p.checkpoints_reached = []  # Ancienne représentation : liste d'indices
+
+    def advance(players):
+        for n, p in enumerate(players):
+            p.rect.centerx = (p.rect.centerx + 23 + n * 11) % length
+
+    def linear():
+        advance(legacy_players)
+        for p in legacy_players:
+            for i, (cx, cy) in enumerate(level.checkpoints):
+                if i in p.checkpoints_reached:
+                    continue
+                if cx - 40 <= p.rect.centerx <= cx + 40 and abs(p.rect.centery - cy) < 80:
+                    p.checkpoints_reached.append(i)
+                    p.last_checkpoint = (cx, cy)
+                    break
+
+    def indexed():
+        advance(indexed_players)
+        for p in indexed_players:
+            level.check_checkpoint(p)
+        return level.next_checkpoint(indexed_players[0])
+
+    print(f"Checkpoints, {count} checkpoints ({frames} frames)")
+    _report("2 joueurs + prochain checkpoint", _time_frames(linear, frames), _time_frames(indexed, frames))
+
+
+# ---------------------------------------------------------------------------
+# Chargement et construction des niveaux
+# ---------------------------------------------------------------------------
+
+def _race_map_rows(columns, rows=15, seed=0):
+    """Longue course générée : sol avec trous, plateformes flottantes, ennemis et étoiles"""
+    import random
+    rng = random.Random(seed)
+    grid = [["0"] * columns for _ in range(rows)]
+    x = 0
+    while x < columns:
+        run = rng.randint(4, 20)
+        for cx in range(x, min(x + run, columns)):
+            grid[rows - 1][cx] = "1"
+        if run > 8:
+            grid[rows - 2][x + run // 2 if x + run // 2 < columns else x] = "E"
+        x += run + rng.randint(1, 3)
+    for _ in range(columns // 8):
+        cx, cy = rng.randrange(columns - 6), rng.randrange(3, rows - 3)
+        width = rng.randint(2, 6)
+        grid[cy][cx:cx + width] = ["1"] * width
+        grid[cy - 1][cx + width // 2] = "E" if rng.random() < 0.3 else "C"
+    grid[rows - 2][columns - 2] = "F"
+    return ["".join(row) for row in grid]
+
+
+def _legacy_load(filename, cell_size=40):
+    """Ancien chargement : readlines(), puis recherche d'une plateforme à prolonger
+    parmi toutes les plateformes pour chaque cellule '1'"""
+    from platform import Platform
+    from enemy import Enemy
+    from collectible import Collectible
+    platforms, enemies, collectibles, enemy_cells = [], [], [], []
+    with open(filename, 'r') as f:
+        lines = f.readlines()
+    for y, line in enumerate(lines):
+        for x, char in enumerate(line.strip()):
+            px, py = x * cell_size, y * cell_size
+            if char == '1':
+                for platform in platforms:
+                    if platform.rect.y == py and platform.rect.right == px:
+                        platform.rect.width += cell_size
+                        break
+                else:
+                    platforms.append(Platform(px, py, cell_size))
+            elif char == 'E':
+                enemy_cells.append((px, py))
+            elif char == 'C':
+                collectibles.append(Collectible(px, py))
+    for px, py in enemy_cells:
+        left, right = px, px + cell_size
+        for platform in platforms:
+            if platform.rect.y == py + cell_size and platform.rect.left <= px < platform.rect.right:
+                left, right, py = platform.rect.left, platform.rect.right, platform.rect.top - ENEMY_HEIGHT
+                break
+        enemies.append(Enemy(px, py, left, right))
+    return platforms, enemies, collectibles
+
+
+def bench_level_load(sizes=(2000, 20000, 100000), legacy_limit=20000):
+    """Chargement de longues courses en fichier texte : ancien parcours vs lecture en flux
+    (l'ancien chargement n'est mesuré que jusqu'à legacy_limit colonnes, il est quadratique)"""
+    import tempfile
+    from level import Level
+
+    def timed(fn):
+        start = time.perf_counter()
+        fn()
+        return (time.perf_counter() - start) * 1000
+
+    def load(path):
+        level = Level.__new__(Level)  # Niveau vide : seul le chargement du fichier est mesuré
+        level.platforms, level.enemies, level.collectibles = [], [], []
+        level.load_from_file(path)
+        return level
+
+    print("Chargement de niveaux texte (15 rangées)")
+    with tempfile.TemporaryDirectory() as workdir:
+        for columns in sizes:
+            path = os.path.join(workdir, f"course_{columns}.txt")
+            with open(path, "w") as f:
+                f.write("\n".join(_race_map_rows(columns)) + "\n")
+            after = timed(lambda: load(path))
+            level = load(path)
+            label = f"{columns:>6} col. ({len(level.platforms)} plateformes)"
+            if columns <= legacy_limit:
+                _report(label, timed(lambda: _legacy_load(path)), after)
+            else:
+                print(f"  {label:<34} après {after:8.3f} ms")
+
+
+def bench_level_cache(frames=20, columns=20000):
+    """Construction d'un niveau : création depuis la source vs niveau compilé en cache (mmap).
+    « image » : contenu du niveau seul (compilation vs lecture du cache, sections décodées) ;
+    « niveau » : Level complet (modèle reconstruit : plateformes, grille de collision, décor)"""
+    import tempfile
+    import level_cache
+    from level import Level, LevelTemplate
+
+    def read(level_file, level_id):
+        image = level_cache.load(level_file, level_id)
+        return image.platforms, image.enemies, image.collectibles, image.checkpoints
+
+    def build(level_file, level_id):
+        LevelTemplate.clear()  # Modèle relu depuis le disque à chaque fois
+        return Level(level_file, level_id)
+
+    print(f"Niveaux compilés ({frames} constructions)")
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)  # Le cache est écrit dans le dossier courant
+        try:
+            path = f"course_{columns}.txt"
+            with open(path, "w") as f:
+                f.write("\n".join(_race_map_rows(columns)) + "\n")
+            sources = [(None, level_id, f"niveau {level_id + 1}") for level_id in range(5)]
+            sources.append((path, 0, f"course de {columns} colonnes"))
+            for level_file, level_id, label in sources:
+                build(level_file, level_id)  # Compilation dans le cache de ce dossier
+                _report(f"{label} : image", _time_frames(lambda: Level.compile(level_file, level_id), frames),
+                        _time_frames(lambda: read(level_file, level_id), frames))
+                before = _time_frames(lambda: Level(level_file, level_id, use_cache=False), frames)
+                after = _time_frames(lambda: build(level_file, level_id), frames)
+                _report(f"{label} : niveau", before, after)
+        finally:
+            os.chdir(cwd)
+
+
+def bench_preload(rounds=10):
+    """Accroc au démarrage d'une manche : niveau construit sur le thread principal vs
+    préchargé en arrière-plan pendant l'intro de manche"""
+    from level import LevelTemplate
+    from level_preloader import LevelPreloader
+
+    def hitch(level_id, preload):
+        LevelTemplate.clear()  # Premier passage sur ce niveau (modèle pas encore en mémoire)
+        preloader = LevelPreloader()
+        if preload:
+            preloader.request(level_id)
+            while not preloader.ready(level_id):
+                time.sleep(0.001)  # Intro de manche : le jeu continue pendant la construction
+        preloader.take(level_id)
+        return preloader.stats["last_ms"]
+
+    print(f"Préchargement des niveaux ({rounds} changements de niveau)")
+    for level_id in range(5):
+        before = sum(hitch(level_id, False) for _ in range(rounds)) / rounds
+        after = sum(hitch(level_id, True) for _ in range(rounds)) / rounds
+        _report(f"niveau {level_id + 1}", before, after)
+
+
+def bench_level_reset(rounds=20):
+    """Nouvelle manche ou nouvel essai sur un niveau déjà joué : niveau reconstruit entier
+    (modèle relu du cache) vs nouveau Level sur le modèle partagé vs Level.reset() sur place ;
+    temps et mémoire Python allouée (pic tracemalloc) par manche"""
+    import tracemalloc
+    from level import Level, LevelTemplate
+    from player import Player
+
+    def play(level, ticks=600):
+        """Une manche jouée en partie : ennemis en route, étoiles ramassées, sbires du boss"""
+        player = Player(50, 100)
+        for _ in range(ticks):
+            player.move_right()
+            player.update(level.platform_index)
+            level.update(player)
+            for c in level.contact_candidates("collectibles", [player], COLLECT_REACH + 1):
+                c.check_collision(player)
+
+    def rebuild(level):
+        LevelTemplate.clear()
+        return Level(level_id=level.level_id)
+
+    def shared(level):
+        return Level(level_id=level.level_id)
+
+    def reset(level):
+        level.reset()
+        return level
+
+    def per_round(new_round, level_id, traced):
+        """Moyenne par manche (hors partie jouée) : ms, ou Ko alloués si traced"""
+        level = Level(level_id=level_id)
+        total = 0.0
+        for _ in range(rounds):
+            play(level)
+            if traced:
+                tracemalloc.start()
+                level = new_round(level)
+                total += tracemalloc.get_traced_memory()[1] / 1024
+                tracemalloc.stop()
+            else:
+                start = time.perf_counter()
+                level = new_round(level)
+                total += (time.perf_counter() - start) * 1000
+        return total / rounds
+
+    print(f"Remise à zéro des niveaux ({rounds} manches)")
+    for level_id in range(5):
+        before = per_round(rebuild, level_id, False)
+        _report(f"niveau {level_id + 1}, nouveau Level", before, per_round(shared, level_id, False))
+        _report(f"niveau {level_id + 1}, reset()", before, per_round(reset, level_id, False))
+        memory = [per_round(new_round, level_id, True) for new_round in (rebuild, shared, reset)]
+        label = f"niveau {level_id + 1}, Ko alloués"
+        print(f"  {label:<34} reconstruit {memory[0]:6.1f}   nouveau Level {memory[1]:6.1f}   reset() {memory[2]:6.1f}")
+
+
+def bench_generator(count=2000):
+    """Génération + validation d'un lot de niveaux : un processus vs tous les cœurs"""
+    import tempfile
+    from level_generator import generate_batch
+
+    def per_level(workers):
+        with tempfile.TemporaryDirectory() as folder:
+            start = time.perf_counter()
+            generate_batch(count, folder, "difficile", workers=workers)
+            return (time.perf_counter() - start) * 1000 / count
+
+    workers = os.cpu_count() or 1
+    print(f"Générateur de niveaux ({count} niveaux difficiles, {workers} cœurs)")
+    _report("ms par niveau", per_level(1), per_level(workers))
+
+
+# ---------------------------------------------------------------------------
+# Mini-jeu « Le sol est en lave »
+# ---------------------------------------------------------------------------
+
+def bench_lava(frames=300):
+    """Tick du mini-jeu Lave (joueur + bot) selon la densité de plateformes et la vitesse"""
+    import random
+    from lava_survival_system import LavaSurvivalSystem
+
+    class _Match:
+        game_mode = "1v1"
+
+    print(f"Lave, tick selon la densité ({frames} frames)")
+    for gap, speed in ((100, 1), (10, 3), (2, 3)):
+        random.seed(0)
+        lava = LavaSurvivalSystem(_Match())
+        lava.platform_gap = gap
+
+        def step():
+            # Personne ne tombe dans la lave : la partie dure tout le test
+            lava.survival_timer = 0
+            lava.player1_y = min(lava.player1_y, SCREEN_HEIGHT - 200)
+            lava.bot_y = min(lava.bot_y, SCREEN_HEIGHT - 200)
+            lava.player1_velocity_y = min(lava.player1_velocity_y, 10)
+            lava.bot_velocity_y = min(lava.bot_velocity_y, 10)
+            lava.player1_jump_pressed = True
+            lava.update(player1_right=True)
+
+        lava.start_game()
+        lava.scroll_speed = speed
+        # Défilement préalable : l'écran se remplit à la densité voulue
+        for _ in range((SCREEN_HEIGHT + 150) // speed):
+            step()
+        ms = _time_frames(step, frames)
+        label = f"écart {gap} px, vitesse {speed} ({len(lava.scrolling)} plateformes)"
+        print(f"  {label:<44} {ms:8.3f} ms")
+
+
+BENCHMARKS = {
+    "gradient": bench_gradient,
+    "player": bench_player,
+    "enemies": bench_enemies,
+    "static": bench_static_layer,
+    "menu": bench_menu_idle,
+    "upscale": bench_upscale,
+    "text": bench_text,
+    "effects": bench_effects,
+    "particles": bench_particles,
+    "culling": bench_culling,
+    "collision": bench_collision,
+    "enemy_pool": bench_enemy_pool,
+    "contacts": bench_contacts,
+    "collectibles": bench_collectibles,
+    "checkpoints": bench_checkpoints,
+    "level_load": bench_level_load,
+    "level_cache": bench_level_cache,
+    "preload": bench_preload,
+    "level_reset": bench_level_reset,
+    "generator": bench_generator,
+    "lava": bench_lava,
+}
+
+
+def main(argv):
+    pygame.init()
+    names = argv or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            print(f"Scénario inconnu : {name} (disponibles : {', '.join(BENCHMARKS)})")
+            return 1
+        BENCHMARKS[name]()
+        print()
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
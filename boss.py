@@ -5,7 +5,46 @@ Chaque phase terminée = boss perd 1 vie. Boss a 5 vies au total.
 import pygame
 import random
 from config import *
+from render_cache import get_font
+from effect_pool import effect_pool
+from particles import ParticleSystem, CIRCLE, emit_explosion
 from enemy import Enemy
+from enemy_pool import EnemyPool
+from sprite_cache import SpriteCache, SpriteAtlas
+
+# Marge autour de chaque frame (corne et bras dépassent du rect)
+SPRITE_PADDING = 16
+
+
+class MinionPool:
+    """Réserve de sbires morts, réutilisés au lieu d'en créer de nouveaux
+    (partagée par tous les boss : d'une phase et d'une manche à l'autre)"""
+
+    def __init__(self, capacity=BOSS_MINION_CAPACITY):
+        self.capacity = capacity
+        self.spare = []
+        # Données des sbires en réserve, sorties du pool du niveau (sans un pool par sbire)
+        self.reserve = EnemyPool(capacity, use_numpy=False)
+
+    def acquire(self, x, y, platform_left, platform_right, flying=False):
+        """Un sbire vivant à cette position : repris dans la réserve, sinon créé"""
+        if self.spare:
+            minion = self.spare.pop()
+            minion.respawn(x, y, platform_left, platform_right, flying=flying)
+            return minion
+        return Enemy(x, y, platform_left, platform_right, flying=flying)
+
+    def release(self, minion):
+        """Rend un sbire mort (retiré de la liste du niveau) à la réserve"""
+        minion.owner = None
+        if len(self.spare) < self.capacity:
+            # Ses données ne sont pas recopiées : acquire() le remet à neuf (respawn)
+            self.reserve.take(minion)
+            self.spare.append(minion)
+
+
+minion_pool = MinionPool()
+
 
 class Boss:
     def __init__(self, x, y):
@@ -13,12 +52,18 @@ class Boss:
         self.height = 100
         self.rect = pygame.Rect(x, y, self.width, self.height)
         self.color = RED
+        self.max_health = 3
+        self.spawn_interval = 8  # Frames (~0.13 sec) - apparition BEAUCOUP plus rapide
+        # Éclats de l'explosion, en coordonnées relatives au centre du boss
+        self.explosion_particles = ParticleSystem(EXPLOSION_PARTICLE_CAPACITY, shape=CIRCLE, drag=0.96)
+        self.reset()
+    
+    def reset(self):
+        """Remet le boss en début de combat (phase 1, toutes ses vies), sur place"""
         self.alive = True
         self.health = 3
-        self.max_health = 3
         self.animation_frame = 0
         self.spawn_timer = 0
-        self.spawn_interval = 8  # Frames (~0.13 sec) - apparition BEAUCOUP plus rapide
         
         # Phases : 1=sol uniquement, 2=air uniquement, 3=les deux
         self.phase = 1
@@ -28,11 +73,19 @@ class Boss:
         self.phase_flying_done = False  # Pour phase 3 : air terminé
         self.exploding = False  # Animation d'explosion
         self.explosion_timer = 0
+        self.explosion_particles.clear()
+        # Sbires tenus à jour à chaque apparition et à chaque mort (Enemy.kill)
+        self.minions_alive = 0
+        self.minions_dead = 0  # Morts encore présents dans la liste du niveau
         
     def update(self, platforms, player=None, level=None):
         """Le boss reste en place et lance des ennemis selon la phase"""
         if self.exploding:
             self.explosion_timer += 1
+            # Nouvelles salves d'éclats pendant la première seconde
+            if self.explosion_timer % 10 == 1 and self.explosion_timer < TICK_RATE:
+                emit_explosion(self.explosion_particles, 0, 0)
+            self.explosion_particles.update()
             return
         
         if not self.alive:
@@ -43,8 +96,10 @@ class Boss:
         if not level or level.enemies is None or self.health <= 0:
             return
         
-        # Nettoyer les ennemis morts
-        level.enemies = [e for e in level.enemies if e.alive]
+        # Retirer les sbires morts de la liste du niveau (par paquets, pour ne pas la
+        # reconstruire à chaque tick) et les rendre à la réserve
+        if self.minions_dead >= BOSS_MINION_COMPACT or (self.minions_dead and not self.minions_alive):
+            self._compact(level)
         
         # Vérifier si la phase est terminée (tous les ennemis de la phase sont morts)
         if self._phase_complete(level):
@@ -53,7 +108,7 @@ class Boss:
         
         # VICTOIRE : Le boss explose SEULEMENT si toutes les 3 phases sont complétées ET tous les ennemis tués
         # Phase > 3 signifie que les 3 phases (1, 2, 3) sont toutes complétées
-        if self.phase > 3 and len(level.enemies) == 0:
+        if self.phase > 3 and self.minions_alive == 0:
             # Toutes les phases terminées ET tous les ennemis tués = victoire
             self.exploding = True
             self.explosion_timer = 0
@@ -73,9 +128,7 @@ class Boss:
         if self.phase_spawned < self.phase_goal:
             return False
         # Phase 3 : 15 sol + 15 air = 30 total
-        if self.phase == 3:
-            return len(level.enemies) == 0
-        return len(level.enemies) == 0
+        return self.minions_alive == 0
     
     def _can_spawn(self):
         """Peut-on encore spawner pour cette phase ?"""
@@ -97,8 +150,7 @@ class Boss:
         # Si toutes les phases sont complétées (phase > 3), le boss explose
         if self.phase > 3:
             # Toutes les phases terminées : vérifier qu'il n'y a plus d'ennemis
-            alive_enemies = [e for e in level.enemies if e.alive]
-            if len(alive_enemies) == 0:
+            if self.minions_alive == 0:
                 # Toutes les phases terminées ET tous les ennemis tués = explosion
                 self.exploding = True
                 self.explosion_timer = 0
@@ -127,20 +179,42 @@ class Boss:
         
         if self.phase == 1:
             # Phase 1 : uniquement au sol
-            e = Enemy(spawn_x, ground_y, platform_left, platform_right)
+            e = minion_pool.acquire(spawn_x, ground_y, platform_left, platform_right)
         elif self.phase == 2:
             # Phase 2 : uniquement en l'air
             spawn_y = random.randint(200, SCREEN_HEIGHT - 200)
-            e = Enemy(spawn_x, spawn_y, platform_left, platform_right, flying=True)
+            e = minion_pool.acquire(spawn_x, spawn_y, platform_left, platform_right, flying=True)
         else:
             # Phase 3 : alterner sol et air
             if self.phase_spawned % 2 == 0:
-                e = Enemy(spawn_x, ground_y, platform_left, platform_right)
+                e = minion_pool.acquire(spawn_x, ground_y, platform_left, platform_right)
             else:
                 spawn_y = random.randint(200, SCREEN_HEIGHT - 200)
-                e = Enemy(spawn_x, spawn_y, platform_left, platform_right, flying=True)
+                e = minion_pool.acquire(spawn_x, spawn_y, platform_left, platform_right, flying=True)
+        e.owner = self
+        self.minions_alive += 1
         level.enemies.append(e)
     
+    def minion_killed(self, minion):
+        """Appelé par Enemy.kill() quand un sbire de ce boss meurt"""
+        self.minions_alive -= 1
+        self.minions_dead += 1
+    
+    def _compact(self, level):
+        """Retire les morts de la liste du niveau (ordre des vivants conservé)"""
+        alive, dead = [], []
+        for e in level.enemies:
+            if e.alive:
+                alive.append(e)
+            else:
+                dead.append(e)
+                if e.owner is self:
+                    minion_pool.release(e)
+        # Remplie sur place : le pool du niveau ne détache que les morts
+        level.enemies[:] = alive
+        level.enemy_pool.discard(level.enemies, dead)
+        self.minions_dead = 0
+    
     def take_damage(self):
         """Le boss prend des dégâts"""
         self.health -= 1
@@ -160,60 +234,22 @@ class Boss:
         
         return False, False
     
-    def draw(self, screen):
-        """Dessine le grand robot boss"""
+    def draw(self, screen, camera_x=0, camera_y=0):
+        """Dessine le grand robot boss décalé de (camera_x, camera_y)"""
         if self.exploding:
             # Animation d'explosion
-            self._draw_explosion(screen)
+            self._draw_explosion(screen, camera_x, camera_y)
             return
         
         if not self.alive:
             return
         
-        x, y = self.rect.x, self.rect.y
+        x, y = self.rect.x - camera_x, self.rect.y - camera_y
         w, h = self.rect.width, self.rect.height
         
-        body_rect = pygame.Rect(x + 10, y + 20, w - 20, h - 30)
-        pygame.draw.rect(screen, self.color, body_rect)
-        pygame.draw.rect(screen, BLACK, body_rect, 3)
-        
-        head_size = 35
-        head_rect = pygame.Rect(x + (w - head_size) // 2, y, head_size, head_size)
-        pygame.draw.rect(screen, self.color, head_rect)
-        pygame.draw.rect(screen, BLACK, head_rect, 3)
-        
-        eye_size = 6
-        eye_y = y + 12
-        eye_color = RED if int(self.animation_frame) % 2 == 0 else YELLOW
-        pygame.draw.circle(screen, eye_color, (x + w // 2 - 8, eye_y), eye_size)
-        pygame.draw.circle(screen, eye_color, (x + w // 2 + 8, eye_y), eye_size)
-        pygame.draw.circle(screen, BLACK, (x + w // 2 - 8, eye_y), eye_size, 2)
-        pygame.draw.circle(screen, BLACK, (x + w // 2 + 8, eye_y), eye_size, 2)
-        pygame.draw.circle(screen, BLACK, (x + w // 2 - 8, eye_y), 3)
-        pygame.draw.circle(screen, BLACK, (x + w // 2 + 8, eye_y), 3)
-        
-        horn_points = [
-            (x + w // 2, y - 5),
-            (x + w // 2 - 5, y - 15),
-            (x + w // 2 + 5, y - 15)
-        ]
-        pygame.draw.polygon(screen, DARK_GRAY, horn_points)
-        pygame.draw.polygon(screen, BLACK, horn_points, 2)
-        
-        arm_width, arm_height = 8, 40
-        pygame.draw.rect(screen, self.color, (x - 3, y + 25, arm_width, arm_height))
-        pygame.draw.rect(screen, BLACK, (x - 3, y + 25, arm_width, arm_height), 2)
-        pygame.draw.rect(screen, self.color, (x + w - 5, y + 25, arm_width, arm_height))
-        pygame.draw.rect(screen, BLACK, (x + w - 5, y + 25, arm_width, arm_height), 2)
-        
-        leg_width, leg_height = 12, 25
-        pygame.draw.rect(screen, self.color, (x + 15, y + h - leg_height, leg_width, leg_height))
-        pygame.draw.rect(screen, BLACK, (x + 15, y + h - leg_height, leg_width, leg_height), 2)
-        pygame.draw.rect(screen, self.color, (x + w - 27, y + h - leg_height, leg_width, leg_height))
-        pygame.draw.rect(screen, BLACK, (x + w - 27, y + h - leg_height, leg_width, leg_height), 2)
-        
-        pygame.draw.line(screen, DARK_GRAY, (body_rect.left + 5, body_rect.top + 15), (body_rect.right - 5, body_rect.top + 15), 2)
-        pygame.draw.line(screen, DARK_GRAY, (body_rect.left + 5, body_rect.bottom - 15), (body_rect.right - 5, body_rect.bottom - 15), 2)
+        # Corps pré-rendu (2 frames : yeux rouges / jaunes)
+        eye_frame = int(self.animation_frame) % 2
+        _ATLASES.get(self.color, w, h).blit(screen, (eye_frame,), (x - SPRITE_PADDING, y - SPRITE_PADDING))
         
         health_bar_width, health_bar_height = 100, 8
         health_bar_x = x + (w - health_bar_width) // 2
@@ -225,32 +261,79 @@ class Boss:
         pygame.draw.rect(screen, health_color, (health_bar_x, health_bar_y, health_fill_width, health_bar_height))
         pygame.draw.rect(screen, BLACK, (health_bar_x, health_bar_y, health_bar_width, health_bar_height), 1)
         
-        font = pygame.font.Font(None, 20)
+        font = get_font(20)
         phase_name = ["", "Phase 1: Sol", "Phase 2: Air", "Phase 3: Sol+Air"][min(self.phase, 3)]
         phase_text = font.render(phase_name, True, WHITE)
         screen.blit(phase_text, (x + (w - phase_text.get_width()) // 2, y - 40))
         vies_text = font.render(f"{self.health} vies", True, WHITE)
         screen.blit(vies_text, (x + (w - vies_text.get_width()) // 2, y - 55))
     
-    def _draw_explosion(self, screen):
+    def _draw_explosion(self, screen, camera_x=0, camera_y=0):
         """Dessine l'animation d'explosion du boss"""
-        x, y = self.rect.centerx, self.rect.centery
+        x, y = self.rect.centerx - camera_x, self.rect.centery - camera_y
         explosion_radius = min(200, self.explosion_timer * 3)
         alpha = max(0, 255 - self.explosion_timer * 5)
         
-        # Particules d'explosion
-        import random
-        for i in range(30):
-            angle = (i / 30) * 6.28
-            dist = explosion_radius * (0.5 + random.random() * 0.5)
-            px = x + int(dist * pygame.math.Vector2(1, 0).rotate_rad(angle).x)
-            py = y + int(dist * pygame.math.Vector2(1, 0).rotate_rad(angle).y)
-            color = random.choice([RED, ORANGE, YELLOW])
-            size = random.randint(3, 8)
-            pygame.draw.circle(screen, color, (px, py), size)
+        # Particules d'explosion (relatives au centre du boss)
+        self.explosion_particles.draw(screen, -x, -y)
         
-        # Cercle d'explosion principal
-        if explosion_radius > 0:
-            explosion_surface = pygame.Surface((explosion_radius * 2, explosion_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(explosion_surface, (255, 100, 0, alpha), (explosion_radius, explosion_radius), explosion_radius)
-            screen.blit(explosion_surface, (x - explosion_radius, y - explosion_radius))
+        # Cercle d'explosion principal (invisible une fois complètement estompé)
+        if explosion_radius > 0 and alpha > 0:
+            screen.blit(effect_pool.disc(explosion_radius, (255, 100, 0), alpha),
+                        (x - explosion_radius, y - explosion_radius))
+
+
+def _draw_frame(surface, color, w, h, eye_frame):
+    """Dessine une frame du grand robot boss"""
+    x, y = SPRITE_PADDING, SPRITE_PADDING
+    body_rect = pygame.Rect(x + 10, y + 20, w - 20, h - 30)
+    pygame.draw.rect(surface, color, body_rect)
+    pygame.draw.rect(surface, BLACK, body_rect, 3)
+    
+    head_size = 35
+    head_rect = pygame.Rect(x + (w - head_size) // 2, y, head_size, head_size)
+    pygame.draw.rect(surface, color, head_rect)
+    pygame.draw.rect(surface, BLACK, head_rect, 3)
+    
+    eye_size = 6
+    eye_y = y + 12
+    eye_color = RED if eye_frame == 0 else YELLOW
+    pygame.draw.circle(surface, eye_color, (x + w // 2 - 8, eye_y), eye_size)
+    pygame.draw.circle(surface, eye_color, (x + w // 2 + 8, eye_y), eye_size)
+    pygame.draw.circle(surface, BLACK, (x + w // 2 - 8, eye_y), eye_size, 2)
+    pygame.draw.circle(surface, BLACK, (x + w // 2 + 8, eye_y), eye_size, 2)
+    pygame.draw.circle(surface, BLACK, (x + w // 2 - 8, eye_y), 3)
+    pygame.draw.circle(surface, BLACK, (x + w // 2 + 8, eye_y), 3)
+    
+    horn_points = [
+        (x + w // 2, y - 5),
+        (x + w // 2 - 5, y - 15),
+        (x + w // 2 + 5, y - 15)
+    ]
+    pygame.draw.polygon(surface, DARK_GRAY, horn_points)
+    pygame.draw.polygon(surface, BLACK, horn_points, 2)
+    
+    arm_width, arm_height = 8, 40
+    pygame.draw.rect(surface, color, (x - 3, y + 25, arm_width, arm_height))
+    pygame.draw.rect(surface, BLACK, (x - 3, y + 25, arm_width, arm_height), 2)
+    pygame.draw.rect(surface, color, (x + w - 5, y + 25, arm_width, arm_height))
+    pygame.draw.rect(surface, BLACK, (x + w - 5, y + 25, arm_width, arm_height), 2)
+    
+    leg_width, leg_height = 12, 25
+    pygame.draw.rect(surface, color, (x + 15, y + h - leg_height, leg_width, leg_height))
+    pygame.draw.rect(surface, BLACK, (x + 15, y + h - leg_height, leg_width, leg_height), 2)
+    pygame.draw.rect(surface, color, (x + w - 27, y + h - leg_height, leg_width, leg_height))
+    pygame.draw.rect(surface, BLACK, (x + w - 27, y + h - leg_height, leg_width, leg_height), 2)
+    
+    pygame.draw.line(surface, DARK_GRAY, (body_rect.left + 5, body_rect.top + 15), (body_rect.right - 5, body_rect.top + 15), 2)
+    pygame.draw.line(surface, DARK_GRAY, (body_rect.left + 5, body_rect.bottom - 15), (body_rect.right - 5, body_rect.bottom - 15), 2)
+
+
+def _build_atlas(color, w, h):
+    """Atlas des frames du boss (clignotement des yeux)"""
+    frame_size = (w + 2 * SPRITE_PADDING, h + 2 * SPRITE_PADDING)
+    return SpriteAtlas(frame_size, [(0,), (1,)], lambda frame, eye_frame: _draw_frame(frame, color, w, h, eye_frame))
+
+
+# Atlas du boss par (couleur, taille) (construit au premier dessin)
+_ATLASES = SpriteCache(_build_atlas)
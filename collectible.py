@@ -3,8 +3,9 @@ Classe des objets collectibles (Étoiles jaunes / Shurikens)
 """
 import pygame
 import math
-import random
 from config import *
+from effect_pool import effect_pool
+from particles import emit_collect_burst
 
 class Collectible:
     """Étoile jaune = +vitesse. Étoile cyan (type='jump') = +sauts. Étoile rouge (type='kill_ground') = bouclier tuer ennemis au sol 3s. Étoile bleue (type='kill_flying') = bouclier tuer ennemis volants 3s."""
@@ -23,26 +24,26 @@ class Collectible:
         else:
             self.color = YELLOW
         self.animation_offset = 0
-        # Animation de collecte
-        self.collect_particles = []
+        # Animation de collecte : les éclats sont émis dans le système de particules
+        # du niveau (relié par Level)
+        self.emitter = None
+        self.group = None  # CollectibleSet du niveau (prévenu à la collecte)
         self.collect_timer = 0
         self.collect_duration = 25  # ~0.4 sec d'animation
+    
+    def reset(self):
+        """Remet l'étoile à sa place, pas encore ramassée (nouvel essai sur le même niveau)"""
+        self.collected = False
+        self.animation_offset = 0
+        self.collect_timer = 0
+        self.group = None
         
     def update(self):
         """Met à jour l'animation"""
         if not self.collected:
             self.animation_offset += 0.12
         else:
-            # Mettre à jour les particules de collecte
             self.collect_timer += 1
-            for p in self.collect_particles[:]:
-                p["x"] += p["vx"]
-                p["y"] += p["vy"]
-                p["vy"] += 0.3
-                p["life"] -= 1
-                p["size"] = max(1, p["size"] - 0.3)
-                if p["life"] <= 0:
-                    self.collect_particles.remove(p)
     
     def _create_collect_particles(self, center_x, center_y):
         """Crée les particules d'explosion à la collecte"""
@@ -56,69 +57,45 @@ class Collectible:
             colors = [BLUE, (100, 150, 255), (150, 200, 255)]
         else:
             colors = [YELLOW, ORANGE, (255, 255, 150)]
-        for _ in range(16):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 6)
-            self.collect_particles.append({
-                "x": center_x,
-                "y": center_y,
-                "vx": math.cos(angle) * speed,
-                "vy": math.sin(angle) * speed - 4,
-                "size": random.randint(4, 10),
-                "color": random.choice(colors),
-                "life": random.randint(15, 25),
-            })
+        if self.emitter is not None:
+            emit_collect_burst(self.emitter, center_x, center_y, colors)
     
     def check_collision(self, player):
         """Vérifie si le joueur passe sur l'étoile et la récupère (disparaît)"""
         if self.collected:
             return False
         # Zone large : collision rect OU proximité du centre du joueur
-        margin = 20
-        hit = pygame.Rect(
-            self.rect.x - margin, self.rect.y - margin,
-            self.rect.width + margin * 2, self.rect.height + margin * 2
-        )
-        player_center = (player.rect.centerx, player.rect.centery)
-        star_center = (self.rect.centerx, self.rect.centery)
-        dist = math.sqrt((player_center[0] - star_center[0])**2 + (player_center[1] - star_center[1])**2)
-        if hit.colliderect(player.rect) or dist < 45:
+        dx = player.rect.centerx - self.rect.centerx
+        dy = player.rect.centery - self.rect.centery
+        near = dx * dx + dy * dy < COLLECT_REACH * COLLECT_REACH
+        if near or self.rect.inflate(COLLECT_MARGIN * 2, COLLECT_MARGIN * 2).colliderect(player.rect):
             self.collected = True
             center_x = self.rect.centerx
             center_y = self.rect.centery - int(3 * abs(math.sin(self.animation_offset)))
             self._create_collect_particles(center_x, center_y)
             self.collect_timer = 0
+            if self.group is not None:
+                self.group.collected(self)
             return True
         return False
     
     def draw(self, screen, camera_x=0):
-        """Dessine l'étoile ou l'animation de collecte (camera_x pour coordonnées écran)"""
+        """Dessine l'étoile décalée de camera_x (les éclats de collecte sont dessinés par le niveau)"""
         if self.collected:
-            # Dessiner l'animation de collecte (particules en coordonnées écran)
-            for p in self.collect_particles:
-                alpha = min(255, int(255 * p["life"] / 15))
-                s = pygame.Surface((int(p["size"] * 2), int(p["size"] * 2)))
-                s.fill(p["color"])
-                s.set_alpha(alpha)
-                sx = int(p["x"] - camera_x - p["size"])
-                sy = int(p["y"] - p["size"])
-                screen.blit(s, (sx, sy))
             return
         
         # Animation de flottement + pulsation
         y_offset = int(4 * math.sin(self.animation_offset))
         pulse = 1 + 0.15 * math.sin(self.animation_offset * 1.5)
         
-        center_x = self.rect.centerx
+        center_x = self.rect.centerx - camera_x
         center_y = self.rect.centery - y_offset
         
         size = int((self.rect.width // 2) * pulse)
         rotation = self.animation_offset * 2.5
         
         glow_color = self.color
-        glow_surf = pygame.Surface((size * 4, size * 4))
-        glow_surf.set_alpha(50)
-        pygame.draw.circle(glow_surf, glow_color, (size * 2, size * 2), size + 8)
+        glow_surf = effect_pool.glow(size * 4, size + 8, glow_color, 50)
         screen.blit(glow_surf, (center_x - size * 2, center_y - size * 2))
         
         points = []
@@ -149,3 +126,83 @@ class Collectible:
         pygame.draw.polygon(screen, BLACK, points, 2)
         pygame.draw.circle(screen, center_color, (int(center_x), int(center_y)), 4)
         pygame.draw.circle(screen, BLACK, (int(center_x), int(center_y)), 4, 1)
+
+
+class CollectibleSet:
+    """Étoiles d'un niveau, réparties selon leur état :
+    - live : pas encore ramassées (mises à jour, dessinées, testées aux collisions),
+      rangées par type (seaux) : un changement de phase du boss retire un seau entier
+    - collecting : ramassées, animation de collecte en cours
+    - retired : nombre d'étoiles dont l'animation est terminée (plus jamais touchées)"""
+
+    def __init__(self, collectibles=(), emitter=None):
+        self.emitter = emitter    # Système de particules des éclats de collecte
+        self.buckets = {}         # Type -> {id: étoile} pas encore ramassées (ordre d'ajout)
+        self.collecting = []
+        self.retired = 0
+        self._live = None         # Liste des étoiles des seaux (recalculée après un changement)
+        self.extend(collectibles)
+
+    @property
+    def live(self):
+        """Étoiles pas encore ramassées (nouvelle liste à chaque changement : les index
+        de culling du niveau la reconnaissent à son identité)"""
+        if self._live is None:
+            self._live = [c for bucket in self.buckets.values() for c in bucket.values()]
+        return self._live
+
+    def __iter__(self):
+        return iter(self.live)
+
+    def __len__(self):
+        return len(self.live)
+
+    def reset(self, collectibles=()):
+        """Repart des étoiles données (remises à zéro, voir Collectible.reset), sur place"""
+        self.buckets.clear()
+        self.collecting.clear()
+        self.retired = 0
+        for c in collectibles:
+            c.reset()
+        self.extend(collectibles)
+
+    def append(self, collectible):
+        self.extend((collectible,))
+
+    def extend(self, collectibles):
+        for c in collectibles:
+            if c.emitter is None:
+                c.emitter = self.emitter
+            c.group = self
+            if c.collected:
+                self.collecting.append(c)
+            else:
+                self.buckets.setdefault(c.collect_type, {})[id(c)] = c
+        self._live = None
+
+    def discard_type(self, collect_type):
+        """Retire toutes les étoiles d'un type, ramassées ou non (changement de phase du boss)"""
+        if self.buckets.pop(collect_type, None) is not None:
+            self._live = None
+        self.collecting = [c for c in self.collecting if c.collect_type != collect_type]
+
+    def collected(self, collectible):
+        """Appelé par Collectible.check_collision : l'étoile passe en animation de collecte
+        (retrait du seau en temps constant, l'ordre des autres étoiles est gardé)"""
+        del self.buckets[collectible.collect_type][id(collectible)]
+        self.collecting.append(collectible)
+        self._live = None
+
+    def update(self):
+        """Anime les étoiles restantes et celles en cours de collecte"""
+        for c in self.live:
+            c.update()
+        if self.collecting:
+            for c in self.collecting:
+                c.update()
+            done = [c for c in self.collecting if c.collect_timer >= c.collect_duration]
+            if done:
+                self.collecting = [c for c in self.collecting if c.collect_timer < c.collect_duration]
+                self.retired += len(done)
+                for c in done:
+                    c.group = None
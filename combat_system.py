@@ -4,6 +4,8 @@ Système de combat - Gère les combats après chaque course
 import pygame
 import random
 from config import *
+from render_cache import get_font
+from effect_pool import effect_pool
 
 class CombatSystem:
     def __init__(self, match_manager):
@@ -87,7 +89,7 @@ class CombatSystem:
         if not self.combat_active:
             return
         
-        self.combat_timer += 1/60  # Incrémenter le timer (60 FPS)
+        self.combat_timer += TICK_DT  # Incrémenter le timer (un tick de simulation)
         
         # Gérer les attaques du joueur 1 (clavier Espace - pour compatibilité)
         if keys and keys[pygame.K_SPACE] and not self.player1_attacking:
@@ -108,7 +110,7 @@ class CombatSystem:
             self.player2_attacking = False
             self.bot_attacking = False
         else:
-            self.attack_timer += 1/60
+            self.attack_timer += TICK_DT
         
         # Vérifier les conditions de fin de combat
         winner = self._check_winner()
@@ -209,20 +211,17 @@ class CombatSystem:
             return
         
         # Fond sombre pour le combat
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill(BLACK)
-        screen.blit(overlay, (0, 0))
+        screen.blit(effect_pool.fill((SCREEN_WIDTH, SCREEN_HEIGHT), BLACK, 200), (0, 0))
         
         # Titre - Mini-jeu combat pour déterminer le gagnant
-        font_large = pygame.font.Font(None, 52)
+        font_large = get_font(52)
         title = font_large.render("🎮 MINI-JEU COMBAT 🎮", True, ORANGE)
         screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 40))
-        subtitle = pygame.font.Font(None, 24).render("Qui gagne la manche?", True, YELLOW)
+        subtitle = get_font(24).render("Qui gagne la manche?", True, YELLOW)
         screen.blit(subtitle, (SCREEN_WIDTH // 2 - subtitle.get_width() // 2, 75))
         
         # Timer
-        font = pygame.font.Font(None, 36)
+        font = get_font(36)
         time_left = int(self.max_combat_time - self.combat_timer)
         timer_text = font.render(f"Temps: {time_left}s", True, WHITE)
         screen.blit(timer_text, (SCREEN_WIDTH // 2 - timer_text.get_width() // 2, 100))
@@ -245,8 +244,8 @@ class CombatSystem:
                                  self.bot_health, self.bot_max_health, "Bot", RED)
         
         # Instructions claires - COMMENT JOUER
-        font_small = pygame.font.Font(None, 26)
-        font_tiny = pygame.font.Font(None, 22)
+        font_small = get_font(26)
+        font_tiny = get_font(22)
         
         how_to_title = font_small.render("COMMENT JOUER :", True, YELLOW)
         screen.blit(how_to_title, (SCREEN_WIDTH // 2 - how_to_title.get_width() // 2, 260))
@@ -290,7 +289,7 @@ class CombatSystem:
     def _draw_health_bar(self, screen, x, y, width, height, current, maximum, label, color):
         """Dessine une barre de vie"""
         # Label
-        font = pygame.font.Font(None, 24)
+        font = get_font(24)
         label_text = font.render(label, True, WHITE)
         screen.blit(label_text, (x, y - 25))
         
@@ -32,7 +32,28 @@ STAR_COLOR = (255, 255, 200)  # Couleur des étoiles
 # Paramètres de l'écran
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
-FPS = 60
+FPS = 60  # Images affichées par seconde (au plus)
+
+# Simulation à pas fixe : la logique avance par ticks de durée constante,
+# indépendamment du rendu. Les constantes physiques (vitesses, gravité...) sont
+# exprimées par tick et réglées pour 60 ticks par seconde.
+TICK_RATE = 60
+TICK_DT = 1 / TICK_RATE
+MAX_CATCHUP_TICKS = 5  # Ticks rattrapés au plus par image (au-delà, le retard est abandonné)
+MAX_INTERPOLATION_STEP = 100  # Déplacement (px) au-delà duquel on n'interpole pas (téléportation, respawn)
+
+# Durées de jeu en ticks
+SHIELD_DURATION = 3 * TICK_RATE      # Boucliers rouge/bleu et bulles
+JUMP_BONUS_DURATION = 5 * TICK_RATE  # Bonus de saut
+INTRO_DURATION = 3 * TICK_RATE       # Animations "Manche X", transitions, explosion du boss
+
+# Mise à l'échelle vers la fenêtre : "smoothscale", "scale", "integer" ou "sdl2" (F10 pour changer)
+UPSCALE_MODES = ("smoothscale", "scale", "integer", "sdl2")
+UPSCALE_MODE = "smoothscale"
+
+# Présentation des écrans statiques (menus) : seules les zones modifiées sont envoyées à l'écran
+DIRTY_TILE_SIZE = 40  # Taille des cases de la grille de comparaison (pixels)
+STATIC_REFRESH_FRAMES = FPS  # Rafraîchissement de sécurité (frames) même sans changement détecté
 
 # Paramètres du joueur
 PLAYER_WIDTH = 40
@@ -50,10 +71,49 @@ ENEMY_SPEED = 2
 
 # Paramètres des collectibles
 COLLECTIBLE_SIZE = 20
+COLLECT_MARGIN = 20  # Zone de ramassage : rect de l'étoile élargi de cette marge...
+COLLECT_REACH = 45   # ... ou centres du joueur et de l'étoile à moins de cette distance
 
 # Paramètres des plateformes
 PLATFORM_HEIGHT = 20
 
+# Niveaux en fichier texte : taille d'une cellule en pixels
+LEVEL_CELL_SIZE = 40
+# Dossier des niveaux compilés (cache binaire, voir level_cache.py)
+LEVEL_CACHE_DIR = "level_cache"
+# Modèles de niveaux (partie statique + colonnes du décor) gardés en mémoire, les derniers utilisés
+LEVEL_TEMPLATE_CACHE = 5
+
+# Checkpoints : franchis quand le centre du joueur passe à moins de ces distances
+CHECKPOINT_REACH_X = 40
+CHECKPOINT_REACH_Y = 80
+
+# Rendu du décor statique (plateformes, checkpoints, drapeau) en colonnes pré-rendues
+STATIC_CHUNK_WIDTH = 512  # Largeur d'une colonne en pixels
+STATIC_CHUNK_CACHE = 16  # Colonnes gardées en mémoire (les niveaux plus longs sont rendus à la volée)
+
+# Grille de collision des plateformes (taille d'une case en pixels)
+SPATIAL_CELL_SIZE = 256
+
+# Pool d'ennemis d'un niveau (colonnes de données, agrandies par doublement si besoin)
+ENEMY_POOL_CAPACITY = 64
+
+# Sbires du boss : réserve réutilisée d'une phase et d'une manche à l'autre
+BOSS_MINION_CAPACITY = 30  # Sbires gardés en réserve (30 vivants au plus en phase 3)
+BOSS_MINION_COMPACT = 8    # Les morts sont retirés de la liste du niveau par paquets
+
+# Cache des textes rendus (HUD, menus) : nombre maximal de surfaces gardées
+TEXT_CACHE_SIZE = 512
+
+# Surfaces d'effets partagées (disques semi-transparents, voiles) : pas d'alpha entre deux paliers
+EFFECT_ALPHA_STEP = 8
+
+# Capacité des systèmes de particules (les émissions au-delà sont ignorées)
+COLLECT_PARTICLE_CAPACITY = 256  # Éclats d'étoiles, par niveau
+BUBBLE_PARTICLE_CAPACITY = 8     # Bulles autour d'un joueur
+CONFETTI_PARTICLE_CAPACITY = 80  # Confettis de fin de match
+EXPLOSION_PARTICLE_CAPACITY = 128  # Éclats de l'explosion du boss
+
 # Scores
 SCORE_COLLECTIBLE = 50
 SCORE_ENEMY = 200
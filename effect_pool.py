@@ -0,0 +1,86 @@
+"""
+Surfaces d'effets partagées : disques semi-transparents (bulles, étoiles) et
+voiles unis (assombrissement, teintes, surbrillance, particules carrées).
+Le code de dessin emprunte une surface du pool au lieu d'en allouer une à
+chaque frame. La surface empruntée est blittée tout de suite : elle ne doit
+pas être gardée ni modifiée.
+"""
+import pygame
+from config import *
+
+
+def quantize_alpha(alpha, step=EFFECT_ALPHA_STEP):
+    """Arrondit alpha au palier le plus proche (0 et 255 restent exacts)"""
+    alpha = max(0, min(255, int(alpha)))
+    return min(255, int(round(alpha / step)) * step)
+
+
+class EffectPool:
+    """Pool de surfaces d'effets indexées par taille et couleur"""
+
+    def __init__(self):
+        self._discs = {}   # (rayon, rgb, alpha) -> Surface SRCALPHA
+        self._fills = {}   # ((largeur, hauteur), rgb) -> Surface unie (alpha de surface)
+        self._glows = {}   # (taille, rayon, rgb) -> Surface noire + disque (alpha de surface)
+        self.stats = {"allocated": 0, "reused": 0}
+
+    def _lookup(self, cache, key, build):
+        surface = cache.get(key)
+        if surface is None:
+            surface = build()
+            cache[key] = surface
+            self.stats["allocated"] += 1
+        else:
+            self.stats["reused"] += 1
+        return surface
+
+    def disc(self, radius, color, alpha=255):
+        """Disque de rayon radius (surface 2r x 2r, centre en (r, r)) avec alpha par pixel.
+        L'alpha est arrondi à EFFECT_ALPHA_STEP près pour limiter le nombre de variantes."""
+        radius = max(1, int(radius))
+        rgb = tuple(color[:3])
+        alpha = quantize_alpha(alpha)
+
+        def build():
+            surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surface, rgb + (alpha,), (radius, radius), radius)
+            return surface
+
+        return self._lookup(self._discs, (radius, rgb, alpha), build)
+
+    def fill(self, size, color, alpha=255):
+        """Rectangle uni de la taille donnée, avec alpha de surface (voile, teinte, particule)"""
+        key = ((int(size[0]), int(size[1])), tuple(color[:3]))
+
+        def build():
+            surface = pygame.Surface(key[0])
+            surface.fill(key[1])
+            return surface
+
+        surface = self._lookup(self._fills, key, build)
+        surface.set_alpha(int(alpha))
+        return surface
+
+    def glow(self, size, radius, color, alpha=255):
+        """Carré noir de côté size avec un disque de couleur au centre (halo des étoiles)"""
+        key = (int(size), int(radius), tuple(color[:3]))
+
+        def build():
+            surface = pygame.Surface((key[0], key[0]))
+            pygame.draw.circle(surface, key[2], (key[0] // 2, key[0] // 2), key[1])
+            return surface
+
+        surface = self._lookup(self._glows, key, build)
+        surface.set_alpha(int(alpha))
+        return surface
+
+    def clear(self):
+        self._discs.clear()
+        self._fills.clear()
+        self._glows.clear()
+
+    def __len__(self):
+        return len(self._discs) + len(self._fills) + len(self._glows)
+
+
+effect_pool = EffectPool()
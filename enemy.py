@@ -3,93 +3,111 @@ Classe des ennemis (Robots patrouilleurs)
 """
 import pygame
 from config import *
+from sprite_cache import SpriteCache, SpriteAtlas
+from timestep import interpolate
+from enemy_pool import EnemyPool
+
+# Marge autour de chaque frame (ailes et cornes dépassent du rect)
+SPRITE_PADDING = 10
+
+
+def _field(name, cast):
+    """Attribut d'Enemy lu et écrit dans la case du pool"""
+    def get(self):
+        return cast(self._pool.columns[name][self._slot])
+
+    def set(self, value):
+        self._pool.columns[name][self._slot] = value
+        self._pool.stamp += 1
+    return property(get, set)
+
+
+def _spawn_values(x, y, platform_left, platform_right, is_1v1, flying):
+    """Valeurs des colonnes d'un ennemi tout juste créé"""
+    return {
+        "x": x, "y": y, "prev_x": x, "prev_y": y,
+        "left": platform_left, "right": platform_right,
+        "speed": ENEMY_SPEED * 1.5 if is_1v1 else ENEMY_SPEED,  # Plus rapide en mode 1v1
+        "direction": 1, "vertical_speed": 0,
+        # Portée verticale pour les volants
+        "range_top": y - 100, "range_bottom": y + 100,
+        "animation": 0, "walk": 0,
+        "flying": flying, "is_1v1": is_1v1, "alive": True,
+    }
+
 
 class Enemy:
-    def __init__(self, x, y, platform_left, platform_right, is_1v1=False, flying=False):
-        self.rect = pygame.Rect(x, y, ENEMY_WIDTH, ENEMY_HEIGHT)
-        self.platform_left = platform_left
-        self.platform_right = platform_right
-        self.speed = ENEMY_SPEED * 1.5 if is_1v1 else ENEMY_SPEED  # Plus rapide en mode 1v1
-        self.direction = 1  # 1 = droite, -1 = gauche
+    """Vue sur une case d'EnemyPool : les données vivent dans les colonnes du pool.
+    Un ennemi créé hors niveau a son propre pool d'une case ; le niveau l'adopte
+    dans le sien et met tous ses ennemis à jour en bloc (un niveau compilé crée
+    directement ses ennemis dans son pool : argument pool)."""
+
+    prev_x = _field("prev_x", int)   # Position au tick précédent (interpolation du dessin)
+    prev_y = _field("prev_y", int)
+    platform_left = _field("left", int)
+    platform_right = _field("right", int)
+    speed = _field("speed", float)
+    direction = _field("direction", int)  # 1 = droite, -1 = gauche
+    alive = _field("alive", bool)
+    is_1v1 = _field("is_1v1", bool)  # Mode course contre le joueur
+    flying = _field("flying", bool)  # Ennemi volant qui peut se déplacer en l'air
+    animation_frame = _field("animation", float)  # Pour les animations
+    walk_animation = _field("walk", int)  # Animation de marche
+    vertical_speed = _field("vertical_speed", float)  # Pour les ennemis volants
+
+    def __init__(self, x, y, platform_left, platform_right, is_1v1=False, flying=False, pool=None):
         self.color = RED
-        self.alive = True
-        self.is_1v1 = is_1v1  # Mode course contre le joueur
-        self.flying = flying  # Ennemi volant qui peut se déplacer en l'air
-        self.animation_frame = 0  # Pour les animations
-        self.walk_animation = 0  # Animation de marche
-        self.vertical_speed = 0  # Pour les ennemis volants
-        self.flying_range_y = (y - 100, y + 100) if flying else None  # Portée verticale pour les volants
-        
-    def update(self, platforms, player=None):
-        """Met à jour la position de l'ennemi"""
+        self.owner = None  # Boss qui a lancé l'ennemi (prévenu de sa mort par kill())
+        self._rect = pygame.Rect(x, y, ENEMY_WIDTH, ENEMY_HEIGHT)
+        self._rect_pool, self._rect_stamp = None, None
+        if pool is None:
+            pool = EnemyPool(1, use_numpy=False)
+        pool.allocate(self, _spawn_values(x, y, platform_left, platform_right, is_1v1, flying))
+
+    def respawn(self, x, y, platform_left, platform_right, is_1v1=False, flying=False):
+        """Remet l'ennemi à neuf à une nouvelle position, dans sa case actuelle (réutilisation)"""
+        columns, slot = self._pool.columns, self._slot
+        for name, value in _spawn_values(x, y, platform_left, platform_right, is_1v1, flying).items():
+            columns[name][slot] = value
+        self._pool.unbind(slot)
+        self._pool.stamp += 1
+
+    def kill(self):
+        """Tue l'ennemi (à utiliser plutôt que alive = False : le boss compte ses sbires vivants)"""
         if not self.alive:
             return
-        
-        # Animation de marche
-        self.animation_frame += 0.2
-        self.walk_animation = int(self.animation_frame) % 4  # 4 frames d'animation
-        
-        # Ennemis volants : mouvement en 8 (horizontal + vertical)
-        if self.flying:
-            # Mouvement horizontal
-            self.rect.x += self.speed * self.direction
-            
-            # Mouvement vertical (oscillation)
-            self.vertical_speed += 0.1 * (1 if self.direction > 0 else -1)
-            if abs(self.vertical_speed) > 2:
-                self.vertical_speed *= -1
-            
-            self.rect.y += int(self.vertical_speed)
-            
-            # Limiter la portée verticale
-            if self.flying_range_y:
-                if self.rect.y < self.flying_range_y[0]:
-                    self.rect.y = self.flying_range_y[0]
-                    self.vertical_speed *= -1
-                elif self.rect.y > self.flying_range_y[1]:
-                    self.rect.y = self.flying_range_y[1]
-                    self.vertical_speed *= -1
-            
-            # Changer de direction aux limites horizontales
-            if self.rect.right >= self.platform_right or self.rect.left <= self.platform_left:
-                self.direction *= -1
-            
-            # Ne pas vérifier les collisions avec les plateformes (volant)
-            return
-        
-        # Mode 1v1 : l'ennemi court vers la fin (gauche)
-        if self.is_1v1:
-            self.rect.x -= self.speed
-            # Si l'ennemi atteint la fin avant le joueur, c'est une défaite
-            if self.rect.right <= 0:
-                return  # L'ennemi a gagné
-        else:
-            # Mode normal : patrouille
-            self.rect.x += self.speed * self.direction
-            
-            # Vérifier les limites de la plateforme
-            if self.rect.right >= self.platform_right or self.rect.left <= self.platform_left:
-                self.direction *= -1
-        
-        # Vérifier collision avec les plateformes (pour éviter de tomber)
-        on_platform = False
-        for platform in platforms:
-            if self.rect.colliderect(platform.rect):
-                on_platform = True
-                # Si l'ennemi touche un bord de plateforme, changer de direction
-                if self.rect.right >= platform.rect.right:
-                    self.direction = -1
-                elif self.rect.left <= platform.rect.left:
-                    self.direction = 1
-                break
-        
-        # Si l'ennemi n'est plus sur une plateforme, le repositionner
-        if not on_platform:
-            # Trouver la plateforme la plus proche
-            for platform in platforms:
-                if platform.rect.left <= self.rect.centerx <= platform.rect.right:
-                    self.rect.bottom = platform.rect.top
-                    break
+        self.alive = False
+        if self.owner is not None:
+            self.owner.minion_killed(self)
+
+    @property
+    def rect(self):
+        """Rect de l'ennemi (recalculé quand le pool a bougé ; le modifier ne déplace pas l'ennemi)"""
+        pool = self._pool
+        if self._rect_pool is not pool or self._rect_stamp != pool.stamp:
+            columns, slot = pool.columns, self._slot
+            self._rect.topleft = (int(columns["x"][slot]), int(columns["y"][slot]))
+            self._rect_pool, self._rect_stamp = pool, pool.stamp
+        return self._rect
+
+    @rect.setter
+    def rect(self, rect):
+        columns, slot = self._pool.columns, self._slot
+        columns["x"][slot], columns["y"][slot] = rect.x, rect.y
+        self._pool.stamp += 1
+
+    @property
+    def flying_range_y(self):
+        """Portée verticale (haut, bas) des volants, None au sol"""
+        if not self.flying:
+            return None
+        columns, slot = self._pool.columns, self._slot
+        return int(columns["range_top"][slot]), int(columns["range_bottom"][slot])
+
+    def update(self, platforms, player=None):
+        """Met à jour la position de l'ennemi seul (les ennemis d'un niveau sont mis à jour
+        en bloc par EnemyPool.update)"""
+        self._pool.update_slot(self._slot, platforms)
     
     def check_collision_with_player(self, player):
         """Vérifie la collision avec le joueur"""
@@ -111,87 +129,105 @@ class Enemy:
         
         return False, False
     
-    def draw(self, screen):
-        """Dessine l'ennemi comme un personnage méchant style pixel art"""
+    def draw(self, screen, camera_x=0, alpha=1.0):
+        """Dessine l'ennemi décalé de camera_x (une frame de l'atlas d'animation = un seul blit)
+        alpha : fraction de tick écoulée, pour interpoler la position entre deux ticks"""
         if not self.alive:
             return
         
-        x, y = self.rect.x, self.rect.y
-        w, h = self.rect.width, self.rect.height
-        
-        # Pour les ennemis volants, ajouter des ailes
-        if self.flying:
-            # Ailes animées (oscillent avec l'animation)
-            wing_offset = int(3 * (self.animation_frame % 2))
-            # Aile gauche
-            pygame.draw.ellipse(screen, PURPLE, 
-                              (x - 8, y + h // 2 - 5, 12, 8))
-            # Aile droite
-            pygame.draw.ellipse(screen, PURPLE,
-                              (x + w - 4, y + h // 2 - 5, 12, 8))
-        
-        # Corps principal (forme de blob arrondi, couleur rouge/mauve)
-        body_radius = min(w, h) // 2 - 2
-        body_center = (x + w // 2, y + h // 2 + 5)
-        pygame.draw.circle(screen, self.color, body_center, body_radius)
-        pygame.draw.circle(screen, BLACK, body_center, body_radius, 2)
-        
-        # Tête (cercle plus petit)
-        head_radius = body_radius - 3
-        head_center = (x + w // 2, y + head_radius + 5)
-        pygame.draw.circle(screen, self.color, head_center, head_radius)
-        pygame.draw.circle(screen, BLACK, head_center, head_radius, 2)
-        
-        # Petites cornes au lieu d'antennes (pour le look méchant)
-        horn_length = 6
-        horn_y_start = head_center[1] - head_radius
-        # Corne gauche
-        pygame.draw.line(screen, DARK_GRAY,
-                        (head_center[0] - 4, horn_y_start),
-                        (head_center[0] - 6, horn_y_start - horn_length), 2)
-        # Corne droite
-        pygame.draw.line(screen, DARK_GRAY,
-                        (head_center[0] + 4, horn_y_start),
-                        (head_center[0] + 6, horn_y_start - horn_length), 2)
-        
-        # Yeux méchants (rouges)
-        eye_size = 4
-        eye_y = head_center[1] - 2
-        pygame.draw.circle(screen, RED, (head_center[0] - 4, eye_y), eye_size)
-        pygame.draw.circle(screen, RED, (head_center[0] + 4, eye_y), eye_size)
-        pygame.draw.circle(screen, BLACK, (head_center[0] - 4, eye_y), eye_size, 1)
-        pygame.draw.circle(screen, BLACK, (head_center[0] + 4, eye_y), eye_size, 1)
-        # Pupilles blanches
-        pygame.draw.circle(screen, WHITE, (head_center[0] - 4, eye_y), 1)
-        pygame.draw.circle(screen, WHITE, (head_center[0] + 4, eye_y), 1)
-        
-        # Bouche méchante (arc inversé)
-        mouth_y = head_center[1] + 3
-        pygame.draw.arc(screen, BLACK,
-                       (head_center[0] - 6, mouth_y, 12, 8),
-                       3.14, 6.28, 2)
-        
-        # Petites jambes avec animation de marche
-        leg_y = y + h - 5
-        leg_offset = int(2 * (self.walk_animation % 2)) - 1  # Animation de marche (-1 ou 1)
-        leg_left_x = x + w // 2 - 4 + (leg_offset if self.direction > 0 else -leg_offset)
-        leg_right_x = x + w // 2 + 4 - (leg_offset if self.direction > 0 else -leg_offset)
-        pygame.draw.circle(screen, self.color, (leg_left_x, leg_y), 3)
-        pygame.draw.circle(screen, self.color, (leg_right_x, leg_y), 3)
-        pygame.draw.circle(screen, BLACK, (leg_left_x, leg_y), 3, 1)
-        pygame.draw.circle(screen, BLACK, (leg_right_x, leg_y), 3, 1)
-        
-        # Animation des yeux (clignotement)
         eye_blink = int(self.animation_frame * 0.5) % 20 < 1  # Clignote toutes les 20 frames
-        if not eye_blink:
-            # Yeux normaux (déjà dessinés plus haut)
-            pass
-        else:
-            # Yeux fermés (ligne horizontale)
-            pygame.draw.line(screen, BLACK, 
-                           (head_center[0] - 6, eye_y),
-                           (head_center[0] - 2, eye_y), 2)
-            pygame.draw.line(screen, BLACK,
-                           (head_center[0] + 2, eye_y),
-                           (head_center[0] + 6, eye_y), 2)
+        key = (self.flying, self.direction > 0, self.walk_animation, eye_blink)
+        x = int(interpolate(self.prev_x, self.rect.x, alpha))
+        y = int(interpolate(self.prev_y, self.rect.y, alpha))
+        _ATLASES.get(self.color).blit(screen, key, (x - camera_x - SPRITE_PADDING, y - SPRITE_PADDING))
+
+
+def _draw_frame(surface, color, flying, facing_right, walk_animation, eye_blink):
+    """Dessine une frame de l'ennemi (personnage méchant style pixel art)"""
+    x, y = SPRITE_PADDING, SPRITE_PADDING
+    w, h = ENEMY_WIDTH, ENEMY_HEIGHT
+    
+    # Pour les ennemis volants, ajouter des ailes
+    if flying:
+        # Aile gauche
+        pygame.draw.ellipse(surface, PURPLE, 
+                          (x - 8, y + h // 2 - 5, 12, 8))
+        # Aile droite
+        pygame.draw.ellipse(surface, PURPLE,
+                          (x + w - 4, y + h // 2 - 5, 12, 8))
+    
+    # Corps principal (forme de blob arrondi, couleur rouge/mauve)
+    body_radius = min(w, h) // 2 - 2
+    body_center = (x + w // 2, y + h // 2 + 5)
+    pygame.draw.circle(surface, color, body_center, body_radius)
+    pygame.draw.circle(surface, BLACK, body_center, body_radius, 2)
+    
+    # Tête (cercle plus petit)
+    head_radius = body_radius - 3
+    head_center = (x + w // 2, y + head_radius + 5)
+    pygame.draw.circle(surface, color, head_center, head_radius)
+    pygame.draw.circle(surface, BLACK, head_center, head_radius, 2)
+    
+    # Petites cornes au lieu d'antennes (pour le look méchant)
+    horn_length = 6
+    horn_y_start = head_center[1] - head_radius
+    # Corne gauche
+    pygame.draw.line(surface, DARK_GRAY,
+                    (head_center[0] - 4, horn_y_start),
+                    (head_center[0] - 6, horn_y_start - horn_length), 2)
+    # Corne droite
+    pygame.draw.line(surface, DARK_GRAY,
+                    (head_center[0] + 4, horn_y_start),
+                    (head_center[0] + 6, horn_y_start - horn_length), 2)
+    
+    # Yeux méchants (rouges)
+    eye_size = 4
+    eye_y = head_center[1] - 2
+    pygame.draw.circle(surface, RED, (head_center[0] - 4, eye_y), eye_size)
+    pygame.draw.circle(surface, RED, (head_center[0] + 4, eye_y), eye_size)
+    pygame.draw.circle(surface, BLACK, (head_center[0] - 4, eye_y), eye_size, 1)
+    pygame.draw.circle(surface, BLACK, (head_center[0] + 4, eye_y), eye_size, 1)
+    # Pupilles blanches
+    pygame.draw.circle(surface, WHITE, (head_center[0] - 4, eye_y), 1)
+    pygame.draw.circle(surface, WHITE, (head_center[0] + 4, eye_y), 1)
+    
+    # Bouche méchante (arc inversé)
+    mouth_y = head_center[1] + 3
+    pygame.draw.arc(surface, BLACK,
+                   (head_center[0] - 6, mouth_y, 12, 8),
+                   3.14, 6.28, 2)
+    
+    # Petites jambes avec animation de marche
+    leg_y = y + h - 5
+    leg_offset = int(2 * (walk_animation % 2)) - 1  # Animation de marche (-1 ou 1)
+    leg_left_x = x + w // 2 - 4 + (leg_offset if facing_right else -leg_offset)
+    leg_right_x = x + w // 2 + 4 - (leg_offset if facing_right else -leg_offset)
+    pygame.draw.circle(surface, color, (leg_left_x, leg_y), 3)
+    pygame.draw.circle(surface, color, (leg_right_x, leg_y), 3)
+    pygame.draw.circle(surface, BLACK, (leg_left_x, leg_y), 3, 1)
+    pygame.draw.circle(surface, BLACK, (leg_right_x, leg_y), 3, 1)
+    
+    # Yeux fermés pendant le clignotement (ligne horizontale)
+    if eye_blink:
+        pygame.draw.line(surface, BLACK, 
+                       (head_center[0] - 6, eye_y),
+                       (head_center[0] - 2, eye_y), 2)
+        pygame.draw.line(surface, BLACK,
+                       (head_center[0] + 2, eye_y),
+                       (head_center[0] + 6, eye_y), 2)
+
+
+def _build_atlas(color):
+    """Atlas de toutes les combinaisons sol/vol, orientation, pas de marche, clignement"""
+    keys = [(flying, facing_right, walk, blink)
+            for flying in (False, True)
+            for facing_right in (True, False)
+            for walk in range(4)
+            for blink in (False, True)]
+    frame_size = (ENEMY_WIDTH + 2 * SPRITE_PADDING, ENEMY_HEIGHT + 2 * SPRITE_PADDING)
+    return SpriteAtlas(frame_size, keys, lambda frame, *key: _draw_frame(frame, color, *key))
+
+
+# Atlas d'animation par couleur (construit au premier dessin)
+_ATLASES = SpriteCache(_build_atlas)
 
@@ -0,0 +1,394 @@
+"""
+Pool d'ennemis en colonnes (position, direction, vitesse, vol, bornes de patrouille...)
+Les ennemis d'un niveau sont rangés dans des tableaux parallèles : patrouille,
+vol en oscillation et maintien sur les plateformes sont calculés en un seul
+passage vectorisé (NumPy) au lieu d'un appel Enemy.update() par ennemi.
+Un Enemy n'est plus qu'une vue sur une case du pool (dessin, collisions).
+Les cases libérées sont réutilisées (liste de cases libres).
+Chaque ennemi au sol est lié aux plateformes qui peuvent le porter sur sa zone de
+patrouille (calculées à son apparition) : le maintien sur les plateformes ne
+regarde que celles-là au lieu de chercher dans tout le niveau à chaque tick.
+"""
+import math
+from array import array
+import pygame
+from config import *
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+FIELDS = ("x", "y", "prev_x", "prev_y", "left", "right", "speed", "direction",
+          "vertical_speed", "range_top", "range_bottom", "animation", "walk",
+          "flying", "is_1v1", "alive")
+# Zone [bind_left, bind_right] couverte par les plateformes liées à la case (vide = non liée)
+BIND_FIELDS = ("bind_left", "bind_right")
+
+
+def round_coord(value):
+    """Arrondi d'une coordonnée comme pygame.Rect (demi vers l'extérieur de zéro)"""
+    return int(math.copysign(math.floor(abs(value) + 0.5), value))
+
+
+class EnemyPool:
+    """Colonnes de données des ennemis d'un niveau.
+    - adopt(enemy) : range un ennemi dans le pool (ses données quittent son ancien pool)
+    - take(enemy) : le range sans ses données (réserve d'ennemis à remettre à neuf)
+    - release(enemy) : le détache (il retrouve un pool individuel) et libère sa case
+    - sync(enemies) : aligne le pool sur la liste d'ennemis du niveau
+    - discard(enemies, removed) : détache des ennemis retirés sur place de cette liste
+    - update(platforms) : fait avancer tous les ennemis vivants d'un tick
+    - unbind(slot) : oublie les plateformes liées à une case (ennemi déplacé ou réapparu)"""
+
+    def __init__(self, capacity=ENEMY_POOL_CAPACITY, use_numpy=HAS_NUMPY):
+        self.use_numpy = use_numpy
+        self.capacity = 0
+        self.columns = {name: self._new_column(0) for name in FIELDS + BIND_FIELDS}
+        self.views = []        # Case -> Enemy (None si libre)
+        self.supports = []     # Case -> [(rang, plateforme)] qui peuvent porter l'ennemi au sol
+        self.free = []         # Cases libres, la plus basse en dernier
+        self.size = 0          # Cases utilisées au plus (les suivantes sont vides)
+        self.count = 0         # Ennemis rangés dans le pool
+        self.stamp = 0         # Incrémenté à chaque déplacement (invalide les rects des vues)
+        self.escaped = False   # Un ennemi est sorti de sa zone de patrouille au dernier tick
+        self._synced = None    # (liste, longueur) déjà alignée par sync()
+        self._platforms = None  # (source, colonnes left/top/right/bottom) des plateformes
+        self._slices = None     # (size, colonne -> vue sur les size premières cases)
+        self._bound = None      # Source des plateformes liées (changer de source délie tout)
+        self._support_matrix = None  # Rangs des plateformes liées, une ligne par case (NumPy)
+        self._grow(max(1, capacity))
+
+    def __len__(self):
+        return self.count
+
+    def _new_column(self, capacity):
+        if self.use_numpy:
+            return np.zeros(capacity, dtype=np.float64)
+        return array("d", bytes(8 * capacity))
+
+    def _grow(self, capacity):
+        """Agrandit les colonnes (les nouvelles cases sont libres)"""
+        old = self.capacity
+        for name, column in self.columns.items():
+            if self.use_numpy:
+                grown = self._new_column(capacity)
+                grown[:old] = column
+                self.columns[name] = grown
+            else:
+                column.extend(self._new_column(capacity - old))
+        self.views.extend([None] * (capacity - old))
+        self.supports.extend([None] * (capacity - old))
+        self._slices = None
+        self.free = list(range(capacity - 1, old - 1, -1)) + self.free
+        self.capacity = capacity
+
+    # --- Cases ---------------------------------------------------------------
+
+    def allocate(self, enemy, values=None):
+        """Range enemy dans une case libre avec les valeurs données (nom de colonne -> valeur) ;
+        sans valeurs, la case reste vide (ennemi mort, à remettre à neuf par Enemy.respawn)"""
+        if not self.free:
+            self._grow(self.capacity * 2)
+        slot = self.free.pop()
+        if values is not None:
+            for name in FIELDS:
+                self.columns[name][slot] = values[name]
+        self.unbind(slot)
+        self.views[slot] = enemy
+        self.size = max(self.size, slot + 1)
+        self.count += 1
+        self.stamp += 1
+        enemy._pool, enemy._slot = self, slot
+        return slot
+
+    def unbind(self, slot):
+        """Oublie les plateformes liées à la case (recalculées au prochain tick)"""
+        self.columns["bind_left"][slot] = self.columns["bind_right"][slot] = 0
+        self.supports[slot] = None
+        self._support_matrix = None
+
+    def values(self, slot):
+        """Valeurs d'une case (nom de colonne -> valeur)"""
+        return {name: self.columns[name][slot] for name in FIELDS}
+
+    def _free_slot(self, slot):
+        self.columns["alive"][slot] = 0  # Une case libre n'est plus mise à jour
+        self.unbind(slot)
+        self.views[slot] = None
+        self.free.append(slot)
+        self.count -= 1
+
+    def adopt(self, enemy):
+        """Déplace les données d'un ennemi dans ce pool"""
+        source = enemy._pool
+        if source is self:
+            return
+        values = source.values(enemy._slot)
+        source._free_slot(enemy._slot)
+        self.allocate(enemy, values)
+
+    def take(self, enemy):
+        """Comme adopt, sans recopier les données : l'ennemi arrive mort dans une case vide
+        (pour une réserve, qui le remet à neuf avant de le resservir)"""
+        source = enemy._pool
+        if source is self:
+            return
+        source._free_slot(enemy._slot)
+        self.allocate(enemy)
+
+    def release(self, enemy):
+        """Détache un ennemi du pool : il garde ses données dans un pool individuel"""
+        if enemy._pool is self:
+            EnemyPool(1, use_numpy=False).adopt(enemy)
+
+    def sync(self, enemies, changed=False):
+        """Aligne le pool sur la liste d'ennemis du niveau : les nouveaux venus sont adoptés,
+        ceux qui ont quitté la liste sont détachés. Même liste, plus longue : seuls les
+        ennemis ajoutés à la fin sont adoptés (changed=True : elle a été remplie à nouveau
+        sur place, tout est réaligné)."""
+        synced = self._synced
+        if not changed and synced is not None and synced[0] is enemies and synced[1] <= len(enemies):
+            for enemy in enemies[synced[1]:]:
+                self.adopt(enemy)
+            self._synced = (enemies, len(enemies))
+            return
+        members = set(map(id, enemies))
+        for view in self.views[:self.size]:
+            if view is not None and id(view) not in members:
+                self.release(view)
+        for enemy in enemies:
+            self.adopt(enemy)
+        self._synced = (enemies, len(enemies))
+
+    def discard(self, enemies, removed):
+        """Détache les ennemis removed, déjà retirés sur place de la liste enemies :
+        la liste reste alignée sans tout réaligner au prochain sync()."""
+        for enemy in removed:
+            self.release(enemy)
+        if self._synced is not None and self._synced[0] is enemies:
+            # Un retiré ajouté depuis le dernier sync fait seulement revoir un ennemi déjà adopté
+            self._synced = (enemies, max(0, self._synced[1] - len(removed)))
+
+    # --- Mise à jour -------------------------------------------------------
+
+    def update(self, platforms):
+        """Fait avancer tous les ennemis vivants d'un tick.
+        platforms : liste de plateformes ou index spatial du niveau"""
+        self._check_source(platforms)
+        if self.use_numpy:
+            self._update_numpy(platforms)
+        else:
+            self.escaped = False
+            alive = self.columns["alive"]
+            for slot in range(self.size):
+                if alive[slot]:
+                    self.update_slot(slot, platforms)
+        self.stamp += 1
+
+    # --- Plateformes liées --------------------------------------------------
+
+    def _check_source(self, platforms):
+        """Délie toutes les cases si les plateformes ne sont plus les mêmes"""
+        if self._bound is not platforms:
+            for slot in range(self.capacity):
+                self.unbind(slot)
+            self._bound = platforms
+
+    def _bind(self, slot, platforms):
+        """Lie un ennemi au sol aux plateformes qui recoupent (en x) sa zone de patrouille,
+        dans l'ordre de la liste : ce sont les seules qu'il peut toucher ou avoir sous lui
+        tant qu'il reste dans cette zone"""
+        c = self.columns
+        x = c["x"][slot]
+        low = min(x, c["left"][slot]) - ENEMY_WIDTH
+        high = max(x, c["right"][slot]) + ENEMY_WIDTH * 2
+        if c["is_1v1"][slot]:
+            low = min(low, x - SPATIAL_CELL_SIZE)  # Les coureurs avancent vers la gauche
+        if hasattr(platforms, "query_ordered"):
+            candidates = platforms.query_ordered(platforms.column(low, high))
+        else:
+            candidates = enumerate(platforms)
+        self.supports[slot] = [(order, platform) for order, platform in candidates
+                               if platform.rect.right >= low and platform.rect.left <= high]
+        c["bind_left"][slot], c["bind_right"][slot] = low, high
+        self._support_matrix = None
+
+    def _platform_columns(self, platforms):
+        """Bords des plateformes en colonnes NumPy (calculés une fois par source), suivis
+        d'une plateforme fictive qui ne touche jamais rien (bourrage des lignes liées)"""
+        if self._platforms is None or self._platforms[0] is not platforms:
+            rects = [platform.rect for platform in platforms]
+            bounds = np.array([(r.left, r.top, r.right, r.bottom) for r in rects]
+                              + [(np.inf, np.inf, -np.inf, -np.inf)], dtype=np.float64)
+            self._platforms = (platforms, bounds.T.copy())
+        return self._platforms[1]
+
+    def _supports_numpy(self, n, padding):
+        """Rangs des plateformes liées aux n premières cases, complétés par padding"""
+        matrix = self._support_matrix
+        if matrix is None or len(matrix) != n:
+            rows = [[order for order, platform in self.supports[slot] or ()] for slot in range(n)]
+            width = max(1, max(map(len, rows)))
+            matrix = np.full((n, width), padding, dtype=np.intp)
+            for slot, row in enumerate(rows):
+                matrix[slot, :len(row)] = row
+            self._support_matrix = matrix
+        return matrix
+
+    def _update_numpy(self, platforms):
+        # Tout est calculé sur les n premières cases puis validé par masque
+        # (moins d'appels NumPy que des extractions par indices sur de petits niveaux)
+        n = self.size
+        if self._slices is None or self._slices[0] != n:
+            self._slices = (n, {name: column[:n] for name, column in self.columns.items()})
+        c = self._slices[1]
+        alive = c["alive"] > 0
+        if not alive.any():
+            self.escaped = False
+            return
+        x, y, direction, vertical_speed = c["x"], c["y"], c["direction"], c["vertical_speed"]
+        np.copyto(c["prev_x"], x, where=alive)
+        np.copyto(c["prev_y"], y, where=alive)
+
+        # Animation de marche
+        c["animation"] += alive * 0.2
+        np.copyto(c["walk"], np.floor(c["animation"]) % 4, where=alive)
+
+        flying = alive & (c["flying"] > 0)
+        # Mode 1v1 : course vers la gauche ; sinon patrouille (ou vol) dans la direction courante
+        runner = (c["is_1v1"] > 0) & ~flying
+        new_x = _round_coords(np.where(runner, x - c["speed"], x + c["speed"] * direction))
+
+        # Volants : oscillation verticale bornée par leur portée
+        new_vs = vertical_speed + np.where(direction > 0, 0.1, -0.1)
+        new_vs = np.where(np.abs(new_vs) > 2, -new_vs, new_vs)
+        new_y = y + np.trunc(new_vs)
+        low = new_y < c["range_top"]
+        high = ~low & (new_y > c["range_bottom"])
+        new_y = np.where(low, c["range_top"], np.where(high, c["range_bottom"], new_y))
+        new_vs = np.where(low | high, -new_vs, new_vs)
+
+        # Demi-tour aux bornes de patrouille
+        flip = ~runner & ((new_x + ENEMY_WIDTH >= c["right"]) | (new_x <= c["left"]))
+        np.copyto(direction, np.where(flip, -direction, direction), where=alive)
+        np.copyto(x, new_x, where=alive)
+        np.copyto(y, new_y, where=flying)
+        np.copyto(vertical_speed, new_vs, where=flying)
+
+        # Un coureur sorti par la gauche a gagné : plus de plateformes à vérifier
+        grounded = alive & ~flying & ~(runner & (x + ENEMY_WIDTH <= 0))
+        if grounded.any():
+            # Ennemis sortis de la zone de leurs plateformes liées (ou pas encore liés)
+            unbound = grounded & ((x < c["bind_left"]) | (x + ENEMY_WIDTH > c["bind_right"]))
+            for slot in np.flatnonzero(unbound):
+                self._bind(slot, platforms)
+            self._keep_on_platforms(grounded, x, y, direction, platforms)
+
+        # Un ennemi hors de sa zone de patrouille peut sortir de l'index de culling du niveau
+        outside = (x < c["left"] - ENEMY_WIDTH) | (x > c["right"])
+        self.escaped = bool((alive & outside).any())
+
+    def _keep_on_platforms(self, grounded, x, y, direction, platforms):
+        """Demi-tour au bord de la plateforme touchée, sinon replacement sur celle qui est
+        sous le centre de l'ennemi (première plateforme de la liste dans les deux cas).
+        Seules les plateformes liées à chaque ennemi sont testées (n x liées, pas n x toutes)."""
+        bounds = self._platform_columns(platforms)
+        if bounds.shape[1] == 1:
+            return  # Aucune plateforme (seulement la fictive)
+        supports = self._supports_numpy(len(x), bounds.shape[1] - 1)
+        left, top, right, bottom = (column[supports] for column in bounds)
+        rows = np.arange(len(x))
+        ex, ey = x[:, None], y[:, None]
+        touching = ((ex < right) & (ex + ENEMY_WIDTH > left)
+                    & (ey < bottom) & (ey + ENEMY_HEIGHT > top))
+        first = touching.argmax(axis=1)
+        on_platform = grounded & touching[rows, first]
+        turned = np.where(x + ENEMY_WIDTH >= right[rows, first], -1.0,
+                          np.where(x <= left[rows, first], 1.0, direction))
+        np.copyto(direction, turned, where=on_platform)
+        centers = ex + ENEMY_WIDTH // 2
+        below = (left <= centers) & (centers <= right)
+        support = below.argmax(axis=1)
+        snap = grounded & ~on_platform & below[rows, support]
+        np.copyto(y, top[rows, support] - ENEMY_HEIGHT, where=snap)
+
+    def update_slot(self, slot, platforms):
+        """Un tick pour un seul ennemi (sans NumPy, ou ennemi hors niveau)"""
+        self._check_source(platforms)
+        c = self.columns
+        if not c["alive"][slot]:
+            return
+        x, y = c["x"][slot], c["y"][slot]
+        c["prev_x"][slot], c["prev_y"][slot] = x, y
+        direction, speed = c["direction"][slot], c["speed"][slot]
+        left, right = c["left"][slot], c["right"][slot]
+        c["animation"][slot] += 0.2
+        c["walk"][slot] = int(c["animation"][slot]) % 4
+        self.stamp += 1
+
+        if c["flying"][slot]:
+            # Mouvement horizontal puis oscillation verticale bornée
+            x = round_coord(x + speed * direction)
+            vertical_speed = c["vertical_speed"][slot] + 0.1 * (1 if direction > 0 else -1)
+            if abs(vertical_speed) > 2:
+                vertical_speed *= -1
+            y = y + int(vertical_speed)
+            if y < c["range_top"][slot]:
+                y = c["range_top"][slot]
+                vertical_speed *= -1
+            elif y > c["range_bottom"][slot]:
+                y = c["range_bottom"][slot]
+                vertical_speed *= -1
+            if x + ENEMY_WIDTH >= right or x <= left:
+                direction *= -1
+            c["x"][slot], c["y"][slot] = x, y
+            c["vertical_speed"][slot], c["direction"][slot] = vertical_speed, direction
+            self._check_escaped(slot)
+            return
+
+        if c["is_1v1"][slot]:
+            # Mode 1v1 : l'ennemi court vers la fin (gauche)
+            x = round_coord(x - speed)
+            c["x"][slot] = x
+            if x + ENEMY_WIDTH <= 0:
+                self._check_escaped(slot)
+                return  # L'ennemi a gagné
+        else:
+            x = round_coord(x + speed * direction)
+            if x + ENEMY_WIDTH >= right or x <= left:
+                direction *= -1
+            c["x"][slot] = x
+
+        if x < c["bind_left"][slot] or x + ENEMY_WIDTH > c["bind_right"][slot]:
+            self._bind(slot, platforms)
+        supports = self.supports[slot]
+        rect = pygame.Rect(x, y, ENEMY_WIDTH, ENEMY_HEIGHT)
+        on_platform = False
+        for order, platform in supports:
+            if rect.colliderect(platform.rect):
+                on_platform = True
+                # Au bord de la plateforme : demi-tour
+                if rect.right >= platform.rect.right:
+                    direction = -1
+                elif rect.left <= platform.rect.left:
+                    direction = 1
+                break
+        if not on_platform:
+            # Replacer l'ennemi sur la plateforme qui est sous son centre
+            for order, platform in supports:
+                if platform.rect.left <= rect.centerx <= platform.rect.right:
+                    y = platform.rect.top - ENEMY_HEIGHT
+                    break
+        c["y"][slot], c["direction"][slot] = y, direction
+        self._check_escaped(slot)
+
+    def _check_escaped(self, slot):
+        c = self.columns
+        if c["x"][slot] < c["left"][slot] - ENEMY_WIDTH or c["x"][slot] > c["right"][slot]:
+            self.escaped = True
+
+
+def _round_coords(values):
+    """round_coord sur un tableau"""
+    return np.copysign(np.floor(np.abs(values) + 0.5), values)
@@ -5,8 +5,9 @@ import os
 import datetime
 import pygame
 from config import *
+from timestep import FixedTimestep, sim_clock
 from player import Player
-from level import Level
+from level_preloader import LevelPreloader
 from scoreboard import Scoreboard
 from menu import Menu
 from settings import Settings
@@ -24,6 +25,10 @@ from player_selection import PlayerSelection, UNASSIGNED
 from tic_tac_toe_system import TicTacToeSystem
 from lava_survival_system import LavaSurvivalSystem
 from sound_manager import SoundManager
+from render_cache import draw_gradient, get_font
+from effect_pool import effect_pool
+from presentation import Presenter
+from input_source import KeyboardInput
 from progress import (
     get_joueur_vs_bot_progress,
     save_joueur_vs_bot_progress,
@@ -31,17 +36,31 @@ from progress import (
 )
 
 class Game:
-    def __init__(self):
+    def __init__(self, headless=False, input_source=None):
+        """headless : pas de fenêtre ni de dessin (simulation seule, voir headless.py)
+        input_source : source des entrées clavier (KeyboardInput par défaut)"""
         pygame.init()
+        self.headless = headless
+        self.input = input_source if input_source is not None else KeyboardInput()
         # Mode plein écran : fenêtre sans bordure (pas exclusif) pour permettre Print Screen et captures
         self.fullscreen = True
+        self.settings = Settings()
+        pygame.display.set_caption("Cyber Jump")
         info = pygame.display.Info()
-        self._display = pygame.display.set_mode((info.current_w, info.current_h), pygame.NOFRAME)
-        self.display_w, self.display_h = self._display.get_size()
+        # Présentation : mise à l'échelle de l'image vers la fenêtre (mode choisi dans les paramètres)
+        self.presenter = Presenter(self.settings.upscale_mode)
+        if headless:
+            # Fenêtre minimale (pilote vidéo « dummy ») : nécessaire à convert() des sprites
+            pygame.display.set_mode((1, 1))
+            self.display_w, self.display_h = SCREEN_WIDTH, SCREEN_HEIGHT
+        else:
+            self.display_w, self.display_h = self.presenter.open_display((info.current_w, info.current_h), pygame.NOFRAME)
         # Surface de rendu du jeu (1200x800), mise à l'échelle pour remplir tout l'écran
         self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Cyber Jump")
         self.clock = pygame.time.Clock()
+        # Simulation à pas fixe (TICK_RATE ticks/s), dessin interpolé entre deux ticks
+        self.timestep = FixedTimestep()
+        self.render_alpha = 1.0
         self.running = True
         
         # États du jeu
@@ -82,13 +101,13 @@ class Game:
         self.course_only_completed = False  # Course seule terminée
         
         # Initialisation des composants
-        self.settings = Settings()
         self.menu = Menu(self.screen)
         self.settings_menu = SettingsMenu(self.screen, self.settings)
         self.scoreboard = Scoreboard()
         self.background = Background()
         self.splash_screen = SplashScreen(self.screen)
         self.level = None
+        self.level_preloader = LevelPreloader()  # Prochain niveau construit en arrière-plan
         self.player = None
         self.score = 0
         self.pseudo = ""
@@ -114,20 +133,24 @@ class Game:
             print(f"Manette 2: {self.joystick2.get_name()}")
         
         # Fonts
-        self.font_large = pygame.font.Font(None, 48)
-        self.font_medium = pygame.font.Font(None, 36)
-        self.font_small = pygame.font.Font(None, 24)
+        self.font_large = get_font(48)
+        self.font_medium = get_font(36)
+        self.font_small = get_font(24)
     
     def toggle_fullscreen(self):
         """Basculer entre mode plein écran et fenêtré"""
         self.fullscreen = not self.fullscreen
         if self.fullscreen:
             info = pygame.display.Info()
-            self._display = pygame.display.set_mode((info.current_w, info.current_h), pygame.NOFRAME)
-            self.display_w, self.display_h = self._display.get_size()
+            self.display_w, self.display_h = self.presenter.open_display((info.current_w, info.current_h), pygame.NOFRAME)
         else:
-            self.display_w, self.display_h = SCREEN_WIDTH, SCREEN_HEIGHT
-            self._display = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.display_w, self.display_h = self.presenter.open_display((SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    def cycle_upscale_mode(self):
+        """Passe au mode de mise à l'échelle suivant (F10) et le sauvegarde"""
+        mode = self.presenter.next_mode()
+        self.settings.set_upscale_mode(mode)
+        print(f"Mise à l'échelle : {mode}")
     
     def get_joy_for_player1(self):
         """Retourne le joystick du Joueur 1 (ou None si clavier). Utilise les manettes pré-initialisées."""
@@ -194,7 +217,7 @@ class Game:
         os.makedirs(os.path.join(folder, "screenshots"), exist_ok=True)
         ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         path = os.path.join(folder, "screenshots", f"cyberjump_{ts}.png")
-        pygame.image.save(self._display, path)
+        pygame.image.save(self.presenter.snapshot(), path)
         print(f"Capture sauvegardée: {path}")
     
     def start_game(self, level_id=0):
@@ -210,7 +233,7 @@ class Game:
         self.state = "playing"
         self.current_level_id = level_id
         # Ne pas passer LEVEL_FILE si le fichier n'existe pas, utiliser directement level_id
-        self.level = Level(level_file=None, level_id=level_id)
+        self.level = self._build_level(level_id)
         self.player = Player(50, 100)
         self.score = 0
         self.entering_name = False
@@ -394,7 +417,7 @@ class Game:
                             delattr(self, '_pending_start_game_level_id')
                             self.state = "playing"
                             self.current_level_id = level_id
-                            self.level = Level(level_file=None, level_id=level_id)
+                            self.level = self._build_level(level_id)
                             self.player = Player(50, 100)
                             self.score = 0
                             self.entering_name = False
@@ -453,6 +476,16 @@ class Game:
                     self._score_saved = True
             return  # Ne pas continuer la mise à jour si le match est terminé
         
+        # Précharger le niveau de la prochaine course dès le début de la manche en cours : il a
+        # toute la course pour se construire (pendant l'intro, current_round est déjà la
+        # manche qui va démarrer)
+        if self.match_manager:
+            upcoming = self.match_manager.current_round
+            if self.match_manager.round_state != "round_intro":
+                upcoming += 1
+            if upcoming <= self.match_manager.num_rounds:
+                self.level_preloader.request(self._race_level_id(upcoming))
+        
         if self.match_manager and self.match_manager.round_state == "race":
             # Attendre la fin de l'animation "Manche X" avant de jouer (MAX 3 secondes)
             if getattr(self, '_race_intro_timer', 0) > 0:
@@ -460,11 +493,11 @@ class Game:
                 # Si c'est la manche 5 (boss) et que l'animation vient de se terminer, initialiser le timer
                 if self.level and self.level.level_type == "boss" and self._race_intro_timer == 0:
                     if self.level.boss_start_time is None:
-                        self.level.boss_start_time = pygame.time.get_ticks()
+                        self.level.boss_start_time = sim_clock.get_ticks()
                         print(f"[DEBUG] Timer boss démarré (après animation Manche 5)")
                 return  # Pas de jeu tant que l'animation n'est pas terminée
             
-            keys = pygame.key.get_pressed()
+            keys = self.input.get_pressed()
             
             # Joueur 1: Clavier (Flèches/A/D) OU Manette 0
             if keys[pygame.K_LEFT] or keys[pygame.K_a]:
@@ -497,183 +530,53 @@ class Game:
             # Mise à jour physique et collisions
             if self.match_manager.game_mode == "pvp" and self.player2:
                 # PvP: MÊME NIVEAU pour les deux (level2 = level)
-                self.player.update(self.level.platforms)
-                self.player2.update(self.level.platforms)
+                self.player.update(self.level.platform_index)
+                self.player2.update(self.level.platform_index)
                 self.level.update(self.player)  # Une seule mise à jour (ennemis partagés)
                 self.level.check_checkpoint(self.player)
                 self.level.check_checkpoint(self.player2)
-                for c in self.level.collectibles:
-                    if c.check_collision(self.player):
-                        if getattr(c, 'collect_type', 'speed') == 'speed':
-                            self.player.stars_collected += 1
-                        elif getattr(c, 'collect_type', '') == 'kill_ground':
-                            # Étoile rouge : bouclier pour tuer les ennemis au sol pendant 3 secondes
-                            self.player.ground_shield_timer = 180  # 3 secondes = 180 frames à 60 FPS
-                            self.player.bubbles_timer = 180  # Effet de bulles pendant 3 secondes
-                            self.player.bubbles = []  # Réinitialiser les bulles
+                players = [self.player, self.player2]
+                for c in self.level.contact_candidates("collectibles", players, COLLECT_REACH + 1):
+                    for p in players:
+                        if c.check_collision(p):
+                            self._apply_collectible(p, c)
                             self.sound_manager.play_collectible()  # Son de collectible
-                        elif getattr(c, 'collect_type', '') == 'kill_flying':
-                            # Étoile bleue : bouclier pour tuer les ennemis volants pendant 3 secondes
-                            self.player.flying_shield_timer = 180  # 3 secondes = 180 frames à 60 FPS
-                            self.player.bubbles_timer = 180  # Effet de bulles pendant 3 secondes
-                            self.player.bubbles = []  # Réinitialiser les bulles
-                            self.sound_manager.play_collectible()  # Son de collectible
-                        else:
-                            self._apply_jump_bonus(self.player)
-                        self.sound_manager.play_collectible()  # Son de collectible
-                    elif c.check_collision(self.player2):
-                        if getattr(c, 'collect_type', 'speed') == 'speed':
-                            self.player2.stars_collected += 1
-                        elif getattr(c, 'collect_type', '') == 'kill_ground':
-                            # Étoile rouge : bouclier pour tuer les ennemis au sol pendant 3 secondes
-                            self.player2.ground_shield_timer = 180  # 3 secondes = 180 frames à 60 FPS
-                            self.player2.bubbles_timer = 180  # Effet de bulles pendant 3 secondes
-                            self.player2.bubbles = []  # Réinitialiser les bulles
-                            self.sound_manager.play_collectible()  # Son de collectible
-                        elif getattr(c, 'collect_type', '') == 'kill_flying':
-                            # Étoile bleue : bouclier pour tuer les ennemis volants pendant 3 secondes
-                            self.player2.flying_shield_timer = 180  # 3 secondes = 180 frames à 60 FPS
-                            self.player2.bubbles_timer = 180  # Effet de bulles pendant 3 secondes
-                            self.player2.bubbles = []  # Réinitialiser les bulles
-                            self.sound_manager.play_collectible()  # Son de collectible
-                        else:
-                            self._apply_jump_bonus(self.player2)
-                        self.sound_manager.play_collectible()  # Son de collectible
+                            break
                 if self.level.level_type == "boss" and hasattr(self.level, 'bounds_x'):
                     for p in [self.player, self.player2]:
                         p.rect.x = max(self.level.bounds_x[0], min(p.rect.x, self.level.bounds_x[1] - p.rect.width))
-                for e in self.level.enemies:
+                for e in self.level.contact_candidates("enemies", players):
                     col1, crushed1 = e.check_collision_with_player(self.player)
                     col2, crushed2 = e.check_collision_with_player(self.player2)
-                    # Manches 1-4 : ennemis invincibles (pas de kill, seulement dégâts)
-                    # Manche 5 : ennemis tuables avec boucliers temporaires (3 secondes)
-                    current_round = self.match_manager.current_round if self.match_manager else 1
-                    is_ground_enemy = not getattr(e, 'flying', False)
-                    is_flying_enemy = getattr(e, 'flying', False)
-                    
-                    # Vérifier les boucliers actifs pour le joueur 1
-                    has_ground_shield = current_round == 5 and getattr(self.player, 'ground_shield_timer', 0) > 0
-                    has_flying_shield = current_round == 5 and getattr(self.player, 'flying_shield_timer', 0) > 0
-                    can_kill1 = (has_ground_shield and is_ground_enemy) or (has_flying_shield and is_flying_enemy)
-                    
                     if col1:
-                        if can_kill1:
-                            # Avec bouclier actif : toucher l'ennemi = le tuer (pas besoin d'être au-dessus)
-                            e.alive = False
-                            self.sound_manager.play_enemy_kill()  # Son de mort d'ennemi
-                        else:
-                            # Ennemi invincible ou pas de bouclier actif : dégâts au joueur
-                            self.player.lives -= 1
-                            self.sound_manager.play_player_hit()  # Son quand le joueur est touché
-                            if self.player.lives <= 0:
-                                self.player.lives = 5
-                            self.player.reset_to_checkpoint()
-                    
-                    # Vérifier les boucliers actifs pour le joueur 2
+                        self._competitive_enemy_contact(e, self.player)
                     if col2:
-                        has_ground_shield2 = current_round == 5 and getattr(self.player2, 'ground_shield_timer', 0) > 0
-                        has_flying_shield2 = current_round == 5 and getattr(self.player2, 'flying_shield_timer', 0) > 0
-                        can_kill2 = (has_ground_shield2 and is_ground_enemy) or (has_flying_shield2 and is_flying_enemy)
-                        
-                        if can_kill2:
-                            # Avec bouclier actif : toucher l'ennemi = le tuer (pas besoin d'être au-dessus)
-                            e.alive = False
-                            self.sound_manager.play_enemy_kill()  # Son de mort d'ennemi
-                        else:
-                            # Ennemi invincible ou pas de bouclier actif : dégâts au joueur
-                            self.player2.lives -= 1
-                            self.sound_manager.play_player_hit()  # Son quand le joueur est touché
-                            if self.player2.lives <= 0:
-                                self.player2.lives = 5
-                            self.player2.reset_to_checkpoint()
+                        self._competitive_enemy_contact(e, self.player2)
             elif self.player and self.level:
-                self.player.update(self.level.platforms)
+                self.player.update(self.level.platform_index)
                 if self.player2:
-                    self.player2.update(self.level.platforms)
+                    self.player2.update(self.level.platform_index)
                 self.level.update(self.player)
                 self.level.check_checkpoint(self.player)
                 if self.player2:
                     self.level.check_checkpoint(self.player2)
-                for c in self.level.collectibles:
-                    if c.check_collision(self.player):
-                        if getattr(c, 'collect_type', 'speed') == 'speed':
-                            self.player.stars_collected += 1
-                        elif getattr(c, 'collect_type', '') == 'kill_ground':
-                            # Étoile rouge : bouclier pour tuer les ennemis au sol pendant 3 secondes
-                            self.player.ground_shield_timer = 180  # 3 secondes = 180 frames à 60 FPS
-                            self.player.bubbles_timer = 180  # Effet de bulles pendant 3 secondes
-                            self.player.bubbles = []  # Réinitialiser les bulles
-                            self.sound_manager.play_collectible()  # Son de collectible
-                        elif getattr(c, 'collect_type', '') == 'kill_flying':
-                            # Étoile bleue : bouclier pour tuer les ennemis volants pendant 3 secondes
-                            self.player.flying_shield_timer = 180  # 3 secondes = 180 frames à 60 FPS
-                            self.player.bubbles_timer = 180  # Effet de bulles pendant 3 secondes
-                            self.player.bubbles = []  # Réinitialiser les bulles
-                            self.sound_manager.play_collectible()  # Son de collectible
-                        else:
-                            self._apply_jump_bonus(self.player)
-                    elif self.player2 and c.check_collision(self.player2):
-                        if getattr(c, 'collect_type', 'speed') == 'speed':
-                            self.player2.stars_collected += 1
-                        elif getattr(c, 'collect_type', '') == 'kill_ground':
-                            # Étoile rouge : bouclier pour tuer les ennemis au sol pendant 3 secondes
-                            self.player2.ground_shield_timer = 180  # 3 secondes = 180 frames à 60 FPS
-                            self.player2.bubbles_timer = 180  # Effet de bulles pendant 3 secondes
-                            self.player2.bubbles = []  # Réinitialiser les bulles
-                            self.sound_manager.play_collectible()  # Son de collectible
-                        elif getattr(c, 'collect_type', '') == 'kill_flying':
-                            # Étoile bleue : bouclier pour tuer les ennemis volants pendant 3 secondes
-                            self.player2.flying_shield_timer = 180  # 3 secondes = 180 frames à 60 FPS
-                            self.player2.bubbles_timer = 180  # Effet de bulles pendant 3 secondes
-                            self.player2.bubbles = []  # Réinitialiser les bulles
-                            self.sound_manager.play_collectible()  # Son de collectible
-                        else:
-                            self._apply_jump_bonus(self.player2)
+                players = [self.player] + ([self.player2] if self.player2 else [])
+                for c in self.level.contact_candidates("collectibles", players, COLLECT_REACH + 1):
+                    for p in players:
+                        if c.check_collision(p):
+                            self._apply_collectible(p, c)
+                            break
                 if self.level.level_type == "boss" and hasattr(self.level, 'bounds_x'):
-                    for p in [self.player] + ([self.player2] if self.player2 else []):
+                    for p in players:
                         p.rect.x = max(self.level.bounds_x[0], min(p.rect.x, self.level.bounds_x[1] - p.rect.width))
-                for e in self.level.enemies:
+                for e in self.level.contact_candidates("enemies", players):
                     col, crushed = e.check_collision_with_player(self.player)
-                    # Manches 1-4 : ennemis invincibles (pas de kill, seulement dégâts)
-                    # Manche 5 : ennemis tuables avec boucliers temporaires (3 secondes)
-                    current_round = self.match_manager.current_round if self.match_manager else 1
-                    is_ground_enemy = not getattr(e, 'flying', False)
-                    is_flying_enemy = getattr(e, 'flying', False)
-                    
-                    # Vérifier les boucliers actifs pour le joueur 1
-                    has_ground_shield = current_round == 5 and getattr(self.player, 'ground_shield_timer', 0) > 0
-                    has_flying_shield = current_round == 5 and getattr(self.player, 'flying_shield_timer', 0) > 0
-                    can_kill = (has_ground_shield and is_ground_enemy) or (has_flying_shield and is_flying_enemy)
-                    
                     if col:
-                        if can_kill:
-                            # Avec bouclier actif : toucher l'ennemi = le tuer (pas besoin d'être au-dessus)
-                            e.alive = False
-                            self.sound_manager.play_enemy_kill()  # Son de mort d'ennemi
-                        else:
-                            # Ennemi invincible ou pas de bouclier actif : dégâts au joueur
-                            self.player.lives -= 1
-                            self.sound_manager.play_player_hit()  # Son quand le joueur est touché
-                            if self.player.lives <= 0:
-                                self.player.lives = 5
-                            self.player.reset_to_checkpoint()
+                        self._competitive_enemy_contact(e, self.player)
                     if self.player2:
                         col2, crushed2 = e.check_collision_with_player(self.player2)
-                        has_ground_shield2 = current_round == 5 and getattr(self.player2, 'ground_shield_timer', 0) > 0
-                        has_flying_shield2 = current_round == 5 and getattr(self.player2, 'flying_shield_timer', 0) > 0
-                        can_kill2 = (has_ground_shield2 and is_ground_enemy) or (has_flying_shield2 and is_flying_enemy)
                         if col2:
-                            if can_kill2:
-                                # Avec bouclier actif : toucher l'ennemi = le tuer (pas besoin d'être au-dessus)
-                                e.alive = False
-                                self.sound_manager.play_enemy_kill()  # Son de mort d'ennemi
-                            else:
-                                # Ennemi invincible ou pas de bouclier actif : dégâts au joueur
-                                self.player2.lives -= 1
-                                self.sound_manager.play_player_hit()  # Son quand le joueur est touché
-                                if self.player2.lives <= 0:
-                                    self.player2.lives = 5
-                                self.player2.reset_to_checkpoint()
+                            self._competitive_enemy_contact(e, self.player2)
             
             if self.race_system:
                 self.race_system.update()
@@ -684,7 +587,7 @@ class Game:
                 if self.level.check_boss_timeout():
                     # Temps écoulé = défaite - capturer le temps écoulé
                     if hasattr(self.level, 'boss_start_time') and self.level.boss_start_time is not None:
-                        elapsed_ms = pygame.time.get_ticks() - self.level.boss_start_time
+                        elapsed_ms = sim_clock.get_ticks() - self.level.boss_start_time
                         elapsed_seconds = elapsed_ms / 1000.0
                         # Sauvegarder le temps écoulé (195 secondes = timeout)
                         self._boss_defeat_time = 195.0  # Temps maximum écoulé
@@ -729,17 +632,17 @@ class Game:
             else:
                 # Même manche : incrémenter le timer seulement si on n'est pas dans une nouvelle manche
                 current_timer = getattr(self, '_round_intro_timer', 0)
-                # MAX 3 secondes (180 frames à 60 FPS) - ne JAMAIS dépasser
-                if current_timer < 180:
+                # MAX 3 secondes (INTRO_DURATION ticks) - ne JAMAIS dépasser
+                if current_timer < INTRO_DURATION:
                     self._round_intro_timer = current_timer + 1
-                    if self._round_intro_timer % 30 == 0:  # Log toutes les 0.5 sec
-                        print(f"[DEBUG] Timer round_intro: {self._round_intro_timer}/180")
+                    if self._round_intro_timer % (TICK_RATE // 2) == 0:  # Log toutes les 0.5 sec
+                        print(f"[DEBUG] Timer round_intro: {self._round_intro_timer}/{INTRO_DURATION}")
                 else:
-                    # S'assurer que le timer ne dépasse JAMAIS 180 (MAX 3 secondes)
-                    self._round_intro_timer = 180
+                    # S'assurer que le timer ne dépasse JAMAIS INTRO_DURATION (MAX 3 secondes)
+                    self._round_intro_timer = INTRO_DURATION
                 
                 # Vérifier si le timer est écoulé (MAX 3 secondes) - transition automatique
-                if self._round_intro_timer >= 180:
+                if self._round_intro_timer >= INTRO_DURATION:
                     print(f"[DEBUG] Timer écoulé (MAX 3s atteint), démarrage de la course pour manche {rnd}")
                     # Réinitialiser les états
                     self.match_manager.race_completed = False
@@ -771,7 +674,7 @@ class Game:
                         self.match_manager.current_rewards["player2"]["items"] if self.match_manager.current_rewards.get("player2") else None
                     )
                 else:
-                    keys = pygame.key.get_pressed()
+                    keys = self.input.get_pressed()
                     player2_keys = keys if self.match_manager.game_mode in ["pvp", "2v1"] else None
                     # Les attaques sont gérées par événements (KEYDOWN/JOYBUTTONDOWN), pas ici
                     # On met juste à jour le combat
@@ -797,7 +700,7 @@ class Game:
         
         elif self.match_manager and self.match_manager.round_state == "minigame_lava":
             if self.lava_survival_system:
-                keys = pygame.key.get_pressed()
+                keys = self.input.get_pressed()
                 # Contrôles joueur 1
                 p1_left = keys[pygame.K_LEFT] or keys[pygame.K_a]
                 p1_right = keys[pygame.K_RIGHT] or keys[pygame.K_d]
@@ -867,7 +770,7 @@ class Game:
             return
         
         # Gestion du mouvement continu avec le clavier
-        keys = pygame.key.get_pressed()
+        keys = self.input.get_pressed()
         if keys[pygame.K_LEFT]:
             self.player.move_left()
         elif keys[pygame.K_RIGHT]:
@@ -897,14 +800,14 @@ class Game:
                 pass  # Ignorer les erreurs de manette
         
         # Mettre à jour le joueur
-        self.player.update(self.level.platforms)
+        self.player.update(self.level.platform_index)
         
         # Mettre à jour le niveau
         self.level.update(self.player)
         self.level.check_checkpoint(self.player)
         
         # Vérifier les collisions avec les collectibles
-        for collectible in self.level.collectibles:
+        for collectible in self.level.contact_candidates("collectibles", [self.player], COLLECT_REACH + 1):
             if collectible.check_collision(self.player):
                 if getattr(collectible, 'collect_type', 'speed') == 'speed':
                     self.player.stars_collected += 1
@@ -914,12 +817,12 @@ class Game:
             self.player.rect.x = max(self.level.bounds_x[0], min(self.player.rect.x, self.level.bounds_x[1] - self.player.rect.width))
         
         # Vérifier les collisions avec les ennemis
-        for enemy in self.level.enemies:
+        for enemy in self.level.contact_candidates("enemies", [self.player]):
             collision, crushed = enemy.check_collision_with_player(self.player)
             if collision:
                 if crushed:
                     # Ennemi écrasé
-                    enemy.alive = False
+                    enemy.kill()
                     self.score += SCORE_ENEMY
                     self.sound_manager.play_enemy_kill()  # Son de mort d'ennemi
                 else:
@@ -954,16 +857,19 @@ class Game:
             if not self.level_completed:
                 self.level_completed = True
                 self.transition_timer = 0
+                if self.current_level_id < 2:
+                    # Le niveau suivant se construit pendant la transition
+                    self.level_preloader.request(self.current_level_id + 1)
             
             # Si ce n'est pas le dernier niveau (boss), passer au suivant après transition
             if self.current_level_id < 2:  # 0=Parcours1, 1=Parcours2, 2=Boss
                 self.transition_timer += 1
-                if self.transition_timer > 180:  # 3 secondes à 60 FPS
+                if self.transition_timer > INTRO_DURATION:  # 3 secondes
                     # Passer au niveau suivant
                     self.current_level_id += 1
                     print(f"Chargement du niveau {self.current_level_id}...")  # Debug
                     # Ne pas passer LEVEL_FILE si le fichier n'existe pas, utiliser directement level_id
-                    self.level = Level(level_file=None, level_id=self.current_level_id)
+                    self.level = self._build_level(self.current_level_id)
                     self.player.reset_position()
                     self.level_completed = False
                     self.transition_timer = 0
@@ -972,13 +878,35 @@ class Game:
             else:
                 # Dernier niveau terminé (boss vaincu) - Fin du jeu
                 self.transition_timer += 1
-                if self.transition_timer > 120:  # 2 secondes avant d'afficher l'écran de fin
+                if self.transition_timer > 2 * TICK_RATE:  # 2 secondes avant d'afficher l'écran de fin
                     self.state = "enter_name"
     
+    def _static_screen_key(self):
+        """Clé décrivant le contenu d'un écran statique (None = écran animé, redessiné à chaque frame)"""
+        if self.state == "menu":
+            return ("menu", self.menu.selected_option, tuple(self.menu.options))
+        if self.state == "settings":
+            return ("settings", self.settings_menu.selected_option, self.settings.joystick_enabled)
+        if self.state == "mode_selection":
+            return ("mode_selection", self.mode_selection_index)
+        if self.state == "course_combat_choice":
+            return (self.state, self.course_combat_index)
+        if self.state == "course_choice":
+            return (self.state, self.course_choice_index)
+        if self.state == "combat_choice":
+            return (self.state, self.combat_choice_index)
+        if self.state == "scoreboard":
+            return ("scoreboard", self.pseudo, len(self.scoreboard.scores))
+        return None
+    
     def draw_game(self):
         """Dessine l'état actuel du jeu"""
+        # Écrans statiques : rien à faire si le contenu n'a pas changé
+        static_key = self._static_screen_key()
+        if static_key is not None and not self.presenter.needs_redraw(static_key):
+            return
+        
         if self.state == "splash":
-            self.splash_screen.update()
             self.splash_screen.draw()
             if self.splash_screen.is_finished():
                 self.state = "menu"
@@ -1015,7 +943,7 @@ class Game:
             # Mettre à jour la caméra pour suivre le joueur
             if self.player and self.level:
                 # Centrer la caméra sur le joueur
-                self.camera_x = self.player.rect.centerx - SCREEN_WIDTH // 2
+                self.camera_x = self.player.render_centerx(self.render_alpha) - SCREEN_WIDTH // 2
                 # Limiter la caméra aux limites du niveau
                 max_camera_x = max(0, (self.level.end_x + 100) - SCREEN_WIDTH)
                 self.camera_x = max(0, min(self.camera_x, max_camera_x))
@@ -1028,14 +956,11 @@ class Game:
             
             # Dessiner le niveau avec décalage de caméra
             if self.level:
-                self.level.draw(self.screen, camera_x=self.camera_x)
+                self.level.draw(self.screen, camera_x=self.camera_x, alpha=self.render_alpha)
             
             # Dessiner le joueur avec décalage de caméra
             if self.player:
-                old_x = self.player.rect.x
-                self.player.rect.x -= self.camera_x
-                self.player.draw(self.screen)
-                self.player.rect.x = old_x
+                self.player.draw(self.screen, self.camera_x, self.render_alpha)
             
             # Interface utilisateur
             self.draw_ui()
@@ -1049,10 +974,11 @@ class Game:
         elif self.state == "game_over":
             self.draw_game_over()
         
-        # Mise à l'échelle pour remplir tout l'écran
-        scaled = pygame.transform.smoothscale(self.screen, (self.display_w, self.display_h))
-        self._display.blit(scaled, (0, 0))
-        pygame.display.flip()
+        # Mise à l'échelle pour remplir tout l'écran (zones modifiées seulement sur les écrans statiques)
+        if static_key is None:
+            self.presenter.present(self.screen)
+        else:
+            self.presenter.present_static(self.screen, static_key)
     
     def draw_ui(self):
         """Dessine l'interface utilisateur pendant le jeu"""
@@ -1065,7 +991,7 @@ class Game:
         self.screen.blit(lives_text, (20, 60))
         
         # Collectibles restants
-        collectibles_left = sum(1 for c in self.level.collectibles if not c.collected)
+        collectibles_left = len(self.level.collectibles)
         collectibles_text = self.font_small.render(
             f"Micro-puces: {collectibles_left}", True, YELLOW
         )
@@ -1073,7 +999,7 @@ class Game:
         
         # Indicateur du bonus de saut (étoiles bleues)
         if self.player and getattr(self.player, 'jump_bonus_timer', 0) > 0:
-            bonus_seconds = int(self.player.jump_bonus_timer / 60) + 1
+            bonus_seconds = int(self.player.jump_bonus_timer / TICK_RATE) + 1
             bonus_text = self.font_small.render(
                 f"⭐ Bonus Saut Actif: {bonus_seconds}s - Tuez les ennemis en l'air!",
                 True, CYAN
@@ -1123,14 +1049,11 @@ class Game:
                 next_level_name = next_level_names[self.current_level_id]
                 transition_text = self.font_large.render("✓ NIVEAU TERMINÉ!", True, GREEN)
                 next_text = self.font_medium.render(f"Prochain niveau: {next_level_name}", True, YELLOW)
-                countdown = max(0, 3 - (self.transition_timer // 60))
+                countdown = max(0, 3 - (self.transition_timer // TICK_RATE))
                 countdown_text = self.font_small.render(f"Chargement dans {countdown}...", True, CYAN)
                 
                 # Fond semi-transparent
-                overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-                overlay.set_alpha(200)
-                overlay.fill(BLACK)
-                self.screen.blit(overlay, (0, 0))
+                self.screen.blit(effect_pool.fill((SCREEN_WIDTH, SCREEN_HEIGHT), BLACK, 200), (0, 0))
                 
                 transition_rect = transition_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
                 next_rect = next_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
@@ -1143,10 +1066,7 @@ class Game:
                 victory_text = self.font_large.render("VICTOIRE!", True, YELLOW)
                 boss_defeated_text = self.font_medium.render("BOSS VAINCU!", True, GREEN)
                 
-                overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-                overlay.set_alpha(200)
-                overlay.fill(BLACK)
-                self.screen.blit(overlay, (0, 0))
+                self.screen.blit(effect_pool.fill((SCREEN_WIDTH, SCREEN_HEIGHT), BLACK, 200), (0, 0))
                 
                 victory_rect = victory_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 30))
                 boss_rect = boss_defeated_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30))
@@ -1375,7 +1295,7 @@ class Game:
         """Mise à jour de la sélection (délai auto si prêt)"""
         if self.player_selection and self.player_selection.is_ready():
             self._player_selection_timer = getattr(self, '_player_selection_timer', 0) + 1
-            if self._player_selection_timer >= 90:  # ~1.5 sec
+            if self._player_selection_timer >= TICK_RATE * 3 // 2:  # ~1.5 sec
                 p1, p2 = self.player_selection.player1_joy_id, self.player_selection.player2_joy_id
                 if p1 is not None and p2 is not None and p1 == p2:
                     p1, p2 = 0, 1 if pygame.joystick.get_count() >= 2 else None
@@ -1454,9 +1374,50 @@ class Game:
         if player.max_jumps < 4:
             player.max_jumps += 1
         # Timer 5 secondes pour tuer les ennemis volants en les touchant
-        player.jump_bonus_timer = 300  # 300 frames = 5 secondes à 60 FPS
+        player.jump_bonus_timer = JUMP_BONUS_DURATION  # 5 secondes
         # Ne fait pas de dégâts au boss
-    
+
+    def _apply_collectible(self, player, c):
+        """Effet d'une étoile ramassée en mode compétitif"""
+        if getattr(c, 'collect_type', 'speed') == 'speed':
+            player.stars_collected += 1
+        elif getattr(c, 'collect_type', '') == 'kill_ground':
+            # Étoile rouge : bouclier pour tuer les ennemis au sol pendant 3 secondes
+            player.ground_shield_timer = SHIELD_DURATION  # 3 secondes
+            player.bubbles_timer = SHIELD_DURATION  # Effet de bulles pendant 3 secondes
+            player.bubbles.clear()  # Réinitialiser les bulles
+            self.sound_manager.play_collectible()  # Son de collectible
+        elif getattr(c, 'collect_type', '') == 'kill_flying':
+            # Étoile bleue : bouclier pour tuer les ennemis volants pendant 3 secondes
+            player.flying_shield_timer = SHIELD_DURATION  # 3 secondes
+            player.bubbles_timer = SHIELD_DURATION  # Effet de bulles pendant 3 secondes
+            player.bubbles.clear()  # Réinitialiser les bulles
+            self.sound_manager.play_collectible()  # Son de collectible
+        else:
+            self._apply_jump_bonus(player)
+
+    def _competitive_enemy_contact(self, e, player):
+        """Contact entre un joueur et un ennemi en mode compétitif.
+        Manches 1-4 : ennemis invincibles (pas de kill, seulement dégâts)
+        Manche 5 : ennemis tuables avec boucliers temporaires (3 secondes)"""
+        current_round = self.match_manager.current_round if self.match_manager else 1
+        is_ground_enemy = not getattr(e, 'flying', False)
+        is_flying_enemy = getattr(e, 'flying', False)
+        has_ground_shield = current_round == 5 and getattr(player, 'ground_shield_timer', 0) > 0
+        has_flying_shield = current_round == 5 and getattr(player, 'flying_shield_timer', 0) > 0
+        can_kill = (has_ground_shield and is_ground_enemy) or (has_flying_shield and is_flying_enemy)
+        if can_kill:
+            # Avec bouclier actif : toucher l'ennemi = le tuer (pas besoin d'être au-dessus)
+            e.kill()
+            self.sound_manager.play_enemy_kill()  # Son de mort d'ennemi
+        else:
+            # Ennemi invincible ou pas de bouclier actif : dégâts au joueur
+            player.lives -= 1
+            self.sound_manager.play_player_hit()  # Son quand le joueur est touché
+            if player.lives <= 0:
+                player.lives = 5
+            player.reset_to_checkpoint()
+
     def _skip_round_intro(self):
         """Passe l'intro de manche et démarre la course immédiatement"""
         # Forcer immédiatement la transition vers la course
@@ -1548,15 +1509,25 @@ class Game:
                 self.match_manager.round_state = "round_intro"
         # IMPORTANT: Ne pas changer self.state ici sauf si match_complete, laisser update_competitive gérer la transition
     
+    def _race_level_id(self, round_number):
+        """Niveau d'une manche : Manche 1 = Niveau 1, Manche 2 = Niveau 2, ... Dernière = Boss"""
+        level_id = min(round_number - 1, 4)
+        if round_number == self.match_manager.num_rounds:
+            level_id = 4  # Dernière manche = boss
+        return level_id
+    
+    def _build_level(self, level_id):
+        """Niveau prêt à jouer : préchargé en arrière-plan s'il l'a été, sinon le niveau en
+        cours remis à zéro si c'est le même, sinon construit maintenant"""
+        return self.level_preloader.take(level_id, current=self.level)
+    
     def start_race(self):
         """Démarre une course - niveau = manche (progression)"""
         if self.match_manager and self.match_manager.game_mode == "pvp":
             # JvJ: MÊME NIVEAU pour les deux joueurs, niveau = manche (progression)
             # Manche 1 = Niveau 1, Manche 2 = Niveau 2, ... Dernière = Boss
-            level_id = min(self.match_manager.current_round - 1, 4)
-            if self.match_manager.current_round == self.match_manager.num_rounds:
-                level_id = 4  # Dernière manche = boss
-            self.level = Level(level_file=None, level_id=level_id)
+            level_id = self._race_level_id(self.match_manager.current_round)
+            self.level = self._build_level(level_id)
             self.level2 = self.level  # Même niveau partagé
             self.player = Player(50, 100, player_id=1)
             self.player2 = Player(50, 100, player_id=2)
@@ -1575,11 +1546,9 @@ class Game:
                 self.player2.flying_shield_timer = 0
         else:
             # Niveau = manche : Manche 1 = Niveau 1, Manche 2 = Niveau 2, ... Dernière = Boss
-            level_id = min(self.match_manager.current_round - 1, 4)
-            if self.match_manager.current_round == self.match_manager.num_rounds:
-                level_id = 4  # Dernière manche = boss
+            level_id = self._race_level_id(self.match_manager.current_round)
             self.current_level_id = level_id
-            self.level = Level(level_file=None, level_id=level_id)
+            self.level = self._build_level(level_id)
             self.level2 = None
             self.player = Player(50, 100, player_id=1)
             self.player2 = None
@@ -1611,7 +1580,7 @@ class Game:
             self._race_intro_timer = 0
         else:
             # Sinon, afficher l'overlay "Manche X" pendant MAX 3 secondes
-            self._race_intro_timer = 180
+            self._race_intro_timer = INTRO_DURATION
         
         # Réinitialiser le flag d'explosion du boss
         self._boss_explosion_handled = False
@@ -1627,7 +1596,7 @@ class Game:
     
     def handle_competitive_events(self, event):
         """Gère les événements en mode compétitif"""
-        keys = pygame.key.get_pressed()
+        keys = self.input.get_pressed()
         
         if self.match_manager.round_state == "race":
             # Ne pas traiter les inputs tant que l'animation "Manche X" est affichée
@@ -1658,7 +1627,7 @@ class Game:
                     if self.level.check_boss_timeout():
                         # Temps écoulé = défaite (même si le boss n'a pas explosé) - capturer le temps écoulé
                         if hasattr(self.level, 'boss_start_time') and self.level.boss_start_time is not None:
-                            elapsed_ms = pygame.time.get_ticks() - self.level.boss_start_time
+                            elapsed_ms = sim_clock.get_ticks() - self.level.boss_start_time
                             elapsed_seconds = elapsed_ms / 1000.0
                             # Sauvegarder le temps écoulé (195 secondes = timeout)
                             self._boss_defeat_time = 195.0  # Temps maximum écoulé
@@ -1679,8 +1648,7 @@ class Game:
                             boss_won = True
                         # OU vérifier si toutes les phases sont complétées ET tous les ennemis tués
                         elif self.level.boss.phase > 3:
-                            alive_enemies = [e for e in self.level.enemies if e.alive]
-                            if len(alive_enemies) == 0:
+                            if self.level.boss.minions_alive == 0:
                                 # Forcer l'explosion si ce n'est pas déjà fait
                                 self.level.boss.exploding = True
                                 self.level.boss.explosion_timer = 0
@@ -1700,7 +1668,7 @@ class Game:
                             self.sound_manager.play_boss_explode()  # Son d'explosion du boss
                             self.sound_manager.play_victory()  # Son de victoire
                             # Attendre un peu pour voir l'explosion, puis passer à l'écran de fin
-                            self._boss_explosion_timer = 180  # 3 secondes pour voir l'explosion
+                            self._boss_explosion_timer = INTRO_DURATION  # 3 secondes pour voir l'explosion
                 
                 # Si le timer d'explosion est actif, décrémenter et passer à la fin quand il atteint 0
                 if hasattr(self, '_boss_explosion_timer') and self._boss_explosion_timer > 0:
@@ -1928,24 +1896,12 @@ class Game:
     
     def draw_mode_selection(self):
         """Dessine l'écran de sélection de mode"""
-        from config import GRADIENT_START, GRADIENT_END
-        for y in range(SCREEN_HEIGHT):
-            ratio = y / SCREEN_HEIGHT
-            r = int(GRADIENT_START[0] * (1 - ratio) + GRADIENT_END[0] * ratio)
-            g = int(GRADIENT_START[1] * (1 - ratio) + GRADIENT_END[1] * ratio)
-            b = int(GRADIENT_START[2] * (1 - ratio) + GRADIENT_END[2] * ratio)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        draw_gradient(self.screen)
         self.game_modes.draw_mode_selection(self.screen, self.mode_selection_index)
     
     def draw_submenu(self, title, options, selected_index, back_hint=True):
         """Dessine un sous-menu générique"""
-        from config import GRADIENT_START, GRADIENT_END
-        for y in range(SCREEN_HEIGHT):
-            ratio = y / SCREEN_HEIGHT
-            r = int(GRADIENT_START[0] * (1 - ratio) + GRADIENT_END[0] * ratio)
-            g = int(GRADIENT_START[1] * (1 - ratio) + GRADIENT_END[1] * ratio)
-            b = int(GRADIENT_START[2] * (1 - ratio) + GRADIENT_END[2] * ratio)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        draw_gradient(self.screen)
         
         title_text = self.font_large.render(title, True, ORANGE)
         self.screen.blit(title_text, (SCREEN_WIDTH // 2 - title_text.get_width() // 2, 100))
@@ -1979,25 +1935,19 @@ class Game:
     def draw_course_only(self):
         """Dessine la course seule (sans combat)"""
         if self.player and self.level:
-            self.camera_x = self.player.rect.centerx - SCREEN_WIDTH // 2
+            self.camera_x = self.player.render_centerx(self.render_alpha) - SCREEN_WIDTH // 2
             max_camera_x = max(0, (self.level.end_x + 100) - SCREEN_WIDTH)
             self.camera_x = max(0, min(self.camera_x, max_camera_x))
         
         self.background.update()
         self.background.draw(self.screen)
         if self.level:
-            self.level.draw(self.screen, camera_x=self.camera_x)
+            self.level.draw(self.screen, camera_x=self.camera_x, alpha=self.render_alpha)
         if self.player:
-            old_x = self.player.rect.x
-            self.player.rect.x -= self.camera_x
-            self.player.draw(self.screen)
-            self.player.rect.x = old_x
+            self.player.draw(self.screen, self.camera_x, self.render_alpha)
         
         if self.course_only_completed:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.set_alpha(200)
-            overlay.fill(BLACK)
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(effect_pool.fill((SCREEN_WIDTH, SCREEN_HEIGHT), BLACK, 200), (0, 0))
             t = self.font_large.render("Course terminée!", True, GREEN)
             self.screen.blit(t, (SCREEN_WIDTH // 2 - t.get_width() // 2, SCREEN_HEIGHT // 2 - 50))
             h = self.font_small.render("Entrée ou ESPACE pour retourner au menu", True, GRAY)
@@ -2011,10 +1961,7 @@ class Game:
         if self.combat_system:
             self.combat_system.draw(self.screen)
         if self.combat_only_mode and hasattr(self, '_combat_only_winner') and self._combat_only_winner:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.set_alpha(200)
-            overlay.fill(BLACK)
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(effect_pool.fill((SCREEN_WIDTH, SCREEN_HEIGHT), BLACK, 200), (0, 0))
             w = self._combat_only_winner
             t = self.font_large.render(f"Combat terminé! Gagnant: {w}", True, GREEN)
             self.screen.blit(t, (SCREEN_WIDTH // 2 - t.get_width() // 2, SCREEN_HEIGHT // 2 - 50))
@@ -2081,7 +2028,7 @@ class Game:
         level_id = self.course_choice_index
         self.state = "course_only"
         self.course_only_completed = False
-        self.level = Level(level_file=None, level_id=level_id)
+        self.level = self._build_level(level_id)
         self.player = Player(50, 100)
         self.score = 0
         self.camera_x = 0
@@ -2140,7 +2087,7 @@ class Game:
         """Met à jour la course seule"""
         if self.course_only_completed:
             return
-        keys = pygame.key.get_pressed()
+        keys = self.input.get_pressed()
         if keys[pygame.K_LEFT]:
             self.player.move_left()
         elif keys[pygame.K_RIGHT]:
@@ -2154,9 +2101,9 @@ class Game:
                     self.player.move_right()
             except (AttributeError, IndexError, pygame.error):
                 pass
-        self.player.update(self.level.platforms)
+        self.player.update(self.level.platform_index)
         self.level.update(self.player)
-        for c in self.level.collectibles:
+        for c in self.level.contact_candidates("collectibles", [self.player], COLLECT_REACH + 1):
             if c.check_collision(self.player):
                 if getattr(c, 'collect_type', 'speed') == 'speed':
                     self.player.stars_collected += 1
@@ -2164,11 +2111,11 @@ class Game:
                     self._apply_jump_bonus(self.player)
         if self.level.level_type == "boss" and hasattr(self.level, 'bounds_x'):
             self.player.rect.x = max(self.level.bounds_x[0], min(self.player.rect.x, self.level.bounds_x[1] - self.player.rect.width))
-        for e in self.level.enemies:
+        for e in self.level.contact_candidates("enemies", [self.player]):
             col, crushed = e.check_collision_with_player(self.player)
             if col:
                 if crushed:
-                    e.alive = False
+                    e.kill()
                     self.sound_manager.play_enemy_kill()  # Son de mort d'ennemi
                 else:
                     self.player.lives -= 1
@@ -2197,7 +2144,7 @@ class Game:
         """Met à jour le combat seul"""
         if self._combat_only_winner:
             return
-        keys = pygame.key.get_pressed()
+        keys = self.input.get_pressed()
         player2_keys = keys if self.match_manager and self.match_manager.game_mode == "pvp" else None
         try:
             joy1 = self.get_joy_for_player1()
@@ -2229,79 +2176,57 @@ class Game:
                     if self.level:
                         self.level2 = self.level
                     else:
-                        level_id = min(self.match_manager.current_round - 1, 4)
-                        if self.match_manager.current_round == self.match_manager.num_rounds:
-                            level_id = 4
-                        self.level2 = Level(level_file=None, level_id=level_id)
+                        level_id = self._race_level_id(self.match_manager.current_round)
+                        self.level2 = self._build_level(level_id)
                         self.level = self.level2
                 
                 if self.player2 and self.level2:
                     # ÉCRAN PARTAGÉ: DEUX MONDES DIFFÉRENTS - J1 à gauche, J2 à droite
                     half_w = SCREEN_WIDTH // 2
                     # Monde 1 - Joueur 1 (Parcours 1 ou 2)
-                    cam1 = self.player.rect.centerx - half_w // 2
+                    cam1 = self.player.render_centerx(self.render_alpha) - half_w // 2
                     cam1 = max(0, min(cam1, (self.level.end_x + 100) - half_w))
                     surf1 = self.screen.subsurface((0, 0, half_w, SCREEN_HEIGHT))
                     self.background.draw(surf1)
-                    self.level.draw(surf1, camera_x=cam1)
-                    old_x = self.player.rect.x
-                    self.player.rect.x -= cam1
-                    self.player.draw(surf1)
-                    self.player.rect.x = old_x
+                    self.level.draw(surf1, camera_x=cam1, alpha=self.render_alpha)
+                    self.player.draw(surf1, cam1, self.render_alpha)
                     # Tint bleu pour J1 (champ gauche)
-                    tint1 = pygame.Surface((half_w, SCREEN_HEIGHT))
-                    tint1.set_alpha(25)
-                    tint1.fill(BLUE)
-                    surf1.blit(tint1, (0, 0))
+                    surf1.blit(effect_pool.fill((half_w, SCREEN_HEIGHT), BLUE, 25), (0, 0))
                     # Monde 2 - Joueur 2 (l'autre niveau)
-                    cam2 = self.player2.rect.centerx - half_w // 2
+                    cam2 = self.player2.render_centerx(self.render_alpha) - half_w // 2
                     cam2 = max(0, min(cam2, (self.level2.end_x + 100) - half_w))
                     surf2 = self.screen.subsurface((half_w, 0, half_w, SCREEN_HEIGHT))
                     self.background.draw(surf2)
-                    self.level2.draw(surf2, camera_x=cam2)
-                    old_x2 = self.player2.rect.x
-                    self.player2.rect.x -= cam2
-                    self.player2.draw(surf2)
-                    self.player2.rect.x = old_x2
+                    self.level2.draw(surf2, camera_x=cam2, alpha=self.render_alpha)
+                    self.player2.draw(surf2, cam2, self.render_alpha)
                     # Tint vert pour J2 (champ droit)
-                    tint2 = pygame.Surface((half_w, SCREEN_HEIGHT))
-                    tint2.set_alpha(25)
-                    tint2.fill(GREEN)
-                    surf2.blit(tint2, (0, 0))
+                    surf2.blit(effect_pool.fill((half_w, SCREEN_HEIGHT), GREEN, 25), (0, 0))
                     pygame.draw.line(self.screen, WHITE, (half_w, 0), (half_w, SCREEN_HEIGHT), 2)
-                    font_s = pygame.font.Font(None, 24)
+                    font_s = get_font(24)
                     self.screen.blit(font_s.render("J1", True, BLUE), (10, 10))
                     self.screen.blit(font_s.render("J2", True, GREEN), (half_w + 10, 10))
             elif self.match_manager.game_mode == "2v1" and self.player2:
                 # 2v1: MÊME NIVEAU - les deux joueurs visibles, caméra au centre
-                center_x = (self.player.rect.centerx + self.player2.rect.centerx) // 2
+                center_x = (self.player.render_centerx(self.render_alpha) + self.player2.render_centerx(self.render_alpha)) // 2
                 self.camera_x = center_x - SCREEN_WIDTH // 2
                 max_cam = max(0, (self.level.end_x + 100) - SCREEN_WIDTH)
                 self.camera_x = max(0, min(self.camera_x, max_cam))
                 self.background.draw(self.screen)
-                self.level.draw(self.screen, camera_x=self.camera_x)
-                old_x1, old_x2 = self.player.rect.x, self.player2.rect.x
-                self.player.rect.x -= self.camera_x
-                self.player2.rect.x -= self.camera_x
-                self.player.draw(self.screen)
-                self.player2.draw(self.screen)
-                self.player.rect.x, self.player2.rect.x = old_x1, old_x2
+                self.level.draw(self.screen, camera_x=self.camera_x, alpha=self.render_alpha)
+                self.player.draw(self.screen, self.camera_x, self.render_alpha)
+                self.player2.draw(self.screen, self.camera_x, self.render_alpha)
             else:
                 # 1v1: vue normale
                 if self.player and self.level:
-                    self.camera_x = self.player.rect.centerx - SCREEN_WIDTH // 2
+                    self.camera_x = self.player.render_centerx(self.render_alpha) - SCREEN_WIDTH // 2
                     max_camera_x = max(0, (self.level.end_x + 100) - SCREEN_WIDTH)
                     self.camera_x = max(0, min(self.camera_x, max_camera_x))
                 self.background.draw(self.screen)
                 if self.level:
-                    self.level.draw(self.screen, camera_x=self.camera_x)
+                    self.level.draw(self.screen, camera_x=self.camera_x, alpha=self.render_alpha)
                 if self.player:
-                    old_x = self.player.rect.x
-                    self.player.rect.x -= self.camera_x
-                    self.player.draw(self.screen)
-                    self.player.rect.x = old_x
+                    self.player.draw(self.screen, self.camera_x, self.render_alpha)
             
-            self.race_system.update()
             self.race_system.draw_race_hud(self.screen, self.match_manager, self.player, self.level)
             
             # Overlay "Manche X" au début de chaque course (Manche 2, 3, 4, Dernière)
@@ -2338,18 +2263,15 @@ class Game:
     
     def _draw_race_intro_overlay(self):
         """Overlay Manche X au début de chaque course (semi-transparent)"""
-        alpha = min(255, int(255 * getattr(self, '_race_intro_timer', 0) / 180))
+        alpha = min(255, int(255 * getattr(self, '_race_intro_timer', 0) / INTRO_DURATION))
         if alpha <= 0:
             return
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(alpha)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(effect_pool.fill((SCREEN_WIDTH, SCREEN_HEIGHT), BLACK, alpha), (0, 0))
         
         rnd = self.match_manager.current_round
         total = self.match_manager.num_rounds
-        font_huge = pygame.font.Font(None, 72)
-        font_medium = pygame.font.Font(None, 36)
+        font_huge = get_font(72)
+        font_medium = get_font(36)
         if rnd == total:
             title = font_huge.render("DERNIÈRE MANCHE", True, YELLOW)
             sub = font_medium.render("Contre le Boss !", True, RED)
@@ -2361,14 +2283,8 @@ class Game:
     
     def draw_round_intro(self):
         """Animation Manche X ou Dernière manche - Contre le boss (fond dégradé violet, effet bounce)"""
-        from config import GRADIENT_START, GRADIENT_END
         # Fond dégradé violet
-        for y in range(SCREEN_HEIGHT):
-            ratio = y / SCREEN_HEIGHT
-            r = int(GRADIENT_START[0] * (1 - ratio) + GRADIENT_END[0] * ratio)
-            g = int(GRADIENT_START[1] * (1 - ratio) + GRADIENT_END[1] * ratio)
-            b = int(GRADIENT_START[2] * (1 - ratio) + GRADIENT_END[2] * ratio)
-            self.screen.fill((r, g, b), (0, y, SCREEN_WIDTH, 1))
+        draw_gradient(self.screen)
         
         rnd = self.match_manager.current_round
         total = self.match_manager.num_rounds
@@ -2376,8 +2292,8 @@ class Game:
         # Effet bounce sur le texte
         bounce = abs(((timer / 15) % 2) - 1) * 0.2 + 1
         font_size = int(72 * bounce)
-        font_huge = pygame.font.Font(None, max(48, font_size))
-        font_medium = pygame.font.Font(None, 36)
+        font_huge = get_font(max(48, font_size))
+        font_medium = get_font(36)
         
         if rnd == total:
             title = font_huge.render("DERNIÈRE MANCHE", True, YELLOW)
@@ -2389,15 +2305,15 @@ class Game:
         self.screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 280))
         self.screen.blit(sub, (SCREEN_WIDTH // 2 - sub.get_width() // 2, 380))
         
-        hint = pygame.font.Font(None, 24).render("Espace/Entrée ou X/Cercle : Continuer", True, GRAY)
+        hint = get_font(24).render("Espace/Entrée ou X/Cercle : Continuer", True, GRAY)
         self.screen.blit(hint, (SCREEN_WIDTH // 2 - hint.get_width() // 2, SCREEN_HEIGHT - 80))
     
     def draw_match_complete(self):
         """Dessine l'écran de fin de match"""
         self.screen.fill(BLACK)
         
-        font_large = pygame.font.Font(None, 56)
-        font_medium = pygame.font.Font(None, 36)
+        font_large = get_font(56)
+        font_medium = get_font(36)
         
         # Vérifier si le joueur a perdu (timeout boss)
         if getattr(self.match_manager, 'match_lost', False):
@@ -2487,6 +2403,85 @@ class Game:
         inst = self.font_small.render("Appuyez sur Entrée ou ESC pour retourner au menu", True, GRAY)
         self.screen.blit(inst, (SCREEN_WIDTH // 2 - inst.get_width() // 2, SCREEN_HEIGHT - 100))
     
+    def handle_event(self, event):
+        """Distribue un événement selon l'état du jeu"""
+        if event.type == pygame.QUIT:
+            self.running = False
+            return
+        # Fenêtre à redessiner entièrement (découverte, restaurée...)
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            self.presenter.invalidate()
+        # Capture d'écran intégrée (F12) - fonctionne même en plein écran
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F12:
+            self._take_screenshot()
+        # Mode de mise à l'échelle suivant (F10)
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F10:
+            self.cycle_upscale_mode()
+        
+        # Gérer les événements selon l'état
+        if self.state == "splash":
+            if self.splash_screen.handle_event(event):
+                self.state = "menu"
+        elif self.state == "menu":
+            self.handle_menu_events(event)
+        elif self.state == "settings":
+            self.handle_settings_events(event)
+        elif self.state == "playing":
+            self.handle_playing_events(event)
+        elif self.state == "enter_name" or self.state == "enter_name_before_match":
+            self.handle_name_input_events(event)
+        elif self.state == "scoreboard":
+            self.handle_scoreboard_events(event)
+        elif self.state == "mode_selection":
+            self.handle_mode_selection_events(event)
+        elif self.state == "player_selection":
+            self.handle_player_selection_events(event)
+        elif self.state == "course_combat_choice":
+            self.handle_course_combat_choice_events(event)
+        elif self.state == "course_choice":
+            self.handle_course_choice_events(event)
+        elif self.state == "combat_choice":
+            self.handle_combat_choice_events(event)
+        elif self.state == "course_only":
+            self.handle_course_only_events(event)
+        elif self.state == "combat_only":
+            self.handle_combat_only_events(event)
+        elif self.state == "competitive":
+            self.handle_competitive_events(event)
+    
+    def _update_tick(self):
+        """Avance la simulation d'un tick (TICK_DT secondes)"""
+        sim_clock.advance()
+        try:
+            if self.state == "splash":
+                self.splash_screen.update()
+            elif self.state == "player_selection":
+                self.update_player_selection()
+            elif self.state == "competitive":
+                self.update_competitive()
+            elif self.state == "course_only":
+                self.update_course_only()
+            elif self.state == "combat_only":
+                self.update_combat_only()
+            else:
+                self.update_game()
+        except Exception as e:
+            print(f"[ERROR] Erreur dans update: {e}")
+            import traceback
+            traceback.print_exc()
+            # Ne pas quitter le jeu, juste continuer
+    
+    def simulate(self, ticks):
+        """Simulation sans dessin ni limite de FPS : ticks mises à jour à pleine vitesse,
+        pilotées par la source d'entrées (un poll() par tick). Retourne le nombre de ticks joués."""
+        done = 0
+        while done < ticks and self.running:
+            for event in self.input.poll():
+                self.handle_event(event)
+            self._update_tick()
+            done += 1
+        return done
+    
     def run(self):
         """Boucle principale du jeu"""
         # Ignorer les événements initiaux de la manette pour éviter le démarrage automatique
@@ -2494,67 +2489,22 @@ class Game:
         
         print("[DEBUG] Démarrage de la boucle principale du jeu...")
         print("[DEBUG] Démarrage de la boucle principale du jeu...")
+        self.clock.tick()  # Ne pas compter le temps de chargement comme une image
         try:
             while self.running:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        self.running = False
+                for event in self.input.poll():
+                    self.handle_event(event)
+                    if not self.running:
                         break
-                    # Capture d'écran intégrée (F12) - fonctionne même en plein écran
-                    if event.type == pygame.KEYDOWN and event.key == pygame.K_F12:
-                        self._take_screenshot()
-                    
-                    # Gérer les événements selon l'état
-                    if self.state == "splash":
-                        if self.splash_screen.handle_event(event):
-                            self.state = "menu"
-                    elif self.state == "menu":
-                        self.handle_menu_events(event)
-                    elif self.state == "settings":
-                        self.handle_settings_events(event)
-                    elif self.state == "playing":
-                        self.handle_playing_events(event)
-                    elif self.state == "enter_name" or self.state == "enter_name_before_match":
-                        self.handle_name_input_events(event)
-                    elif self.state == "scoreboard":
-                        self.handle_scoreboard_events(event)
-                    elif self.state == "mode_selection":
-                        self.handle_mode_selection_events(event)
-                    elif self.state == "player_selection":
-                        self.handle_player_selection_events(event)
-                    elif self.state == "course_combat_choice":
-                        self.handle_course_combat_choice_events(event)
-                    elif self.state == "course_choice":
-                        self.handle_course_choice_events(event)
-                    elif self.state == "combat_choice":
-                        self.handle_combat_choice_events(event)
-                    elif self.state == "course_only":
-                        self.handle_course_only_events(event)
-                    elif self.state == "combat_only":
-                        self.handle_combat_only_events(event)
-                    elif self.state == "competitive":
-                        self.handle_competitive_events(event)
                 
                 if not self.running:
                     break
                 
-                # Mettre à jour le jeu
-                try:
-                    if self.state == "player_selection":
-                        self.update_player_selection()
-                    elif self.state == "competitive":
-                        self.update_competitive()
-                    elif self.state == "course_only":
-                        self.update_course_only()
-                    elif self.state == "combat_only":
-                        self.update_combat_only()
-                    else:
-                        self.update_game()
-                except Exception as e:
-                    print(f"[ERROR] Erreur dans update: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    # Ne pas quitter le jeu, juste continuer
+                # Mettre à jour le jeu : autant de ticks fixes que le temps écoulé le demande
+                frame_seconds = self.clock.tick(FPS) / 1000
+                for _ in range(self.timestep.advance(frame_seconds)):
+                    self._update_tick()
+                self.render_alpha = self.timestep.alpha
                 
                 # Dessiner
                 try:
@@ -2564,9 +2514,6 @@ class Game:
                     import traceback
                     traceback.print_exc()
                     # Ne pas quitter le jeu, juste continuer
-                
-                # Contrôler le FPS
-                self.clock.tick(FPS)
         except KeyboardInterrupt:
             print("[DEBUG] Interruption clavier détectée")
             self.running = False
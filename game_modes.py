@@ -1,8 +1,9 @@
 """
 Gestion des différents modes de jeu
 """
-import pygame
 from config import *
+from render_cache import get_font
+from effect_pool import effect_pool
 
 class GameModes:
     def __init__(self):
@@ -64,9 +65,9 @@ class GameModes:
     
     def draw_mode_selection(self, screen, selected_index=0):
         """Dessine le menu de sélection de mode"""
-        font_large = pygame.font.Font(None, 48)
-        font_medium = pygame.font.Font(None, 32)
-        font_small = pygame.font.Font(None, 24)
+        font_large = get_font(48)
+        font_medium = get_font(32)
+        font_small = get_font(24)
         
         # Titre
         title = font_large.render("Sélectionnez un mode de jeu", True, ORANGE)
@@ -81,10 +82,7 @@ class GameModes:
             
             # Fond si sélectionné
             if i == selected_index:
-                highlight = pygame.Surface((SCREEN_WIDTH - 200, 100))
-                highlight.set_alpha(100)
-                highlight.fill(BLUE)
-                screen.blit(highlight, (100, y - 10))
+                screen.blit(effect_pool.fill((SCREEN_WIDTH - 200, 100), BLUE, 100), (100, y - 10))
             
             # Nom du mode
             name_text = font_medium.render(mode_info["name"], True, WHITE)
@@ -0,0 +1,117 @@
+"""
+Simulation sans fenêtre de Cyber Jump (tests d'endurance, débit de la simulation)
+La vraie logique du jeu (niveau, joueurs, ennemis, boss, manches) tourne à pleine
+vitesse, sans dessin ni limite de FPS, pilotée par des entrées scriptées.
+Usage :
+    python headless.py                        # match 1v1, 36000 ticks (10 min de jeu)
+    python headless.py --mode pvp --ticks 5000
+    python headless.py --script partie.txt    # script « tick action touche » par ligne
+"""
+import argparse
+import contextlib
+import os
+import random
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from config import *
+from game import Game
+from input_source import ScriptedInput
+
+
+def default_script(ticks, jump_every=30):
+    """Les deux joueurs courent vers la droite et sautent régulièrement"""
+    script = [(0, "press", pygame.K_RIGHT), (0, "press", pygame.K_l)]
+    for tick in range(jump_every, ticks, jump_every):
+        script.append((tick, "tap", pygame.K_SPACE))
+        script.append((tick + jump_every // 2, "tap", pygame.K_i))
+    return script
+
+
+def start_match(game, mode):
+    """Démarre un match sans passer par les menus ni la sélection des manettes"""
+    game.pseudo = "headless"
+    if mode == "1v1":
+        game.start_joueur_vs_bot(continue_progress=False)
+    else:
+        game.start_competitive_match(mode)
+    game.player1_joy_id = None
+    game.player2_joy_id = None
+    if game.state == "player_selection":
+        game.player_selection = None
+        game.state = "competitive"
+        if game.match_manager.round_state != "round_intro":
+            game.start_race()
+
+
+def run(ticks, mode, input_source, verbose=False):
+    """Simule jusqu'à ticks ticks et retourne (game, ticks simulés, secondes écoulées)"""
+    output = sys.stdout if verbose else open(os.devnull, "w")
+    with contextlib.redirect_stdout(output):
+        game = Game(headless=True, input_source=input_source)
+        start_match(game, mode)
+        start = time.perf_counter()
+        ticks = game.simulate(ticks)
+        elapsed = time.perf_counter() - start
+    if not verbose:
+        output.close()
+    return game, ticks, elapsed
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Simulation sans fenêtre de Cyber Jump")
+    parser.add_argument("--ticks", type=int, default=600 * TICK_RATE, help="nombre de ticks à simuler")
+    parser.add_argument("--mode", choices=["1v1", "2v1", "pvp"], default="1v1")
+    parser.add_argument("--script", help="fichier de script d'entrées (sinon : course + sauts réguliers)")
+    parser.add_argument("--seed", type=int, default=0, help="graine aléatoire (parties reproductibles)")
+    parser.add_argument("--keep-files", action="store_true",
+                        help="écrire scores/progression/paramètres dans le dossier courant")
+    parser.add_argument("--verbose", action="store_true", help="afficher les traces du jeu")
+    args = parser.parse_args(argv)
+
+    random.seed(args.seed)
+    pygame.init()
+    if args.script:
+        input_source = ScriptedInput.from_file(args.script)
+    else:
+        input_source = ScriptedInput(default_script(args.ticks))
+
+    # Par défaut, la simulation travaille dans un dossier temporaire pour ne pas
+    # toucher aux scores et à la progression du joueur
+    workdir = None if args.keep_files else tempfile.TemporaryDirectory()
+    cwd = os.getcwd()
+    if workdir is not None:
+        os.chdir(workdir.name)
+    try:
+        game, ticks, elapsed = run(args.ticks, args.mode, input_source, args.verbose)
+    finally:
+        os.chdir(cwd)
+        if workdir is not None:
+            workdir.cleanup()
+
+    match = game.match_manager
+    print(f"Mode {args.mode} : {ticks} ticks en {elapsed:.2f} s")
+    print(f"  {ticks / elapsed:,.0f} ticks/s (x{ticks / elapsed / TICK_RATE:.1f} temps réel)")
+    print(f"  état final : {game.state}, manche {match.current_round}/{match.num_rounds} ({match.round_state})")
+    print(f"  scores : J1 {match.player1_score}  J2 {match.player2_score}  bot {match.bot_score}")
+    stats = game.level.collision_stats if game.level else None
+    if stats and stats["ticks"]:
+        for name, label in (("enemies", "ennemis"), ("collectibles", "étoiles")):
+            print(f"  paires joueur/{label} testées par tick (niveau final) : "
+                  f"{stats[name + '_pairs'] / stats['ticks']:.1f} sur {stats[name + '_all'] / stats['ticks']:.1f}")
+    preload = game.level_preloader.stats
+    if preload["handovers"]:
+        print(f"  changements de niveau : {preload['handovers']} (dont {preload['preloaded']} préchargés "
+              f"- {preload['waited']} encore en construction -, {preload['reused']} remis à zéro), "
+              f"accroc moyen {preload['total_ms'] / preload['handovers']:.2f} ms, max {preload['max_ms']:.2f} ms")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,95 @@
+"""
+Sources d'entrées du jeu
+Le jeu lit le clavier à travers une source d'entrées : get_pressed() pour les
+touches maintenues, poll() pour les événements. KeyboardInput lit le vrai
+clavier ; ScriptedInput rejoue un script (simulation sans fenêtre).
+"""
+from bisect import bisect_left
+import pygame
+
+
+def _typed_char(key):
+    """Caractère tapé par la touche (attribut unicode des KEYDOWN), vide hors ASCII imprimable"""
+    return chr(key) if 32 <= key < 127 else ""
+
+
+class KeyState:
+    """Touches maintenues, indexables comme le retour de pygame.key.get_pressed()"""
+
+    def __init__(self, held=()):
+        self.held = frozenset(held)
+
+    def __getitem__(self, key):
+        return key in self.held
+
+
+class KeyboardInput:
+    """Clavier et file d'événements de pygame"""
+
+    def get_pressed(self):
+        return pygame.key.get_pressed()
+
+    def poll(self):
+        return pygame.event.get()
+
+
+class ScriptedInput:
+    """Entrées scriptées, avancées d'un tick à chaque poll().
+    Le script est une liste de (tick, action, touche) avec action parmi
+    "press" (la touche reste enfoncée), "release" et "tap" (appui d'un tick).
+    Chaque appui génère un KEYDOWN, chaque relâchement un KEYUP."""
+
+    def __init__(self, script=()):
+        self.script = sorted(script, key=lambda step: step[0])
+        self._ticks = [step[0] for step in self.script]
+        self.tick = -1
+        self._held = set()
+        self._taps = []
+        self._keys = KeyState()
+
+    def get_pressed(self):
+        return self._keys
+
+    def poll(self):
+        """Passe au tick suivant et retourne ses événements"""
+        self.tick += 1
+        # Les touches tapées au tick précédent sont relâchées (sauf si maintenues)
+        events = [pygame.event.Event(pygame.KEYUP, key=key) for key in self._taps if key not in self._held]
+        self._taps = []
+        for step_tick, action, key in self._steps(self.tick):
+            if action == "release":
+                if key in self._held:
+                    self._held.discard(key)
+                    events.append(pygame.event.Event(pygame.KEYUP, key=key))
+            else:
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=key, unicode=_typed_char(key)))
+                if action == "tap":
+                    self._taps.append(key)
+                else:
+                    self._held.add(key)
+        self._keys = KeyState(self._held.union(self._taps))
+        return events
+
+    def _steps(self, tick):
+        """Étapes du script prévues à ce tick (script trié par tick)"""
+        script = self.script
+        index = bisect_left(self._ticks, tick)
+        while index < len(script) and script[index][0] == tick:
+            yield script[index]
+            index += 1
+
+    @classmethod
+    def from_file(cls, path):
+        """Charge un script texte : une ligne « tick action touche » par étape
+        (touche = nom pygame, ex. right, space, i ; # pour les commentaires)"""
+        script = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.split("#", 1)[0].strip()
+                if not line:
+                    continue
+                tick, action, name = line.split(None, 2)
+                if action not in ("press", "release", "tap"):
+                    raise ValueError(f"Action inconnue dans {path}: {action}")
+                script.append((int(tick), action, pygame.key.key_code(name)))
+        return cls(script)
@@ -1,8 +1,9 @@
 """
 Système d'objets et sorts stratégiques
 """
-import pygame
 from config import *
+from timestep import sim_clock
+from render_cache import get_font
 
 class ItemsSystem:
     def __init__(self):
@@ -64,7 +65,7 @@ class ItemsSystem:
         self.active_items[player_id][item_name] = {
             "effect": item["effect"],
             "value": item["value"],
-            "start_time": pygame.time.get_ticks() / 1000  # Temps en secondes
+            "start_time": sim_clock.get_ticks() / 1000  # Temps en secondes
         }
         
         # Si l'item a une durée, ajouter un timer
@@ -75,7 +76,7 @@ class ItemsSystem:
     
     def update(self):
         """Met à jour les timers des items"""
-        current_time = pygame.time.get_ticks() / 1000
+        current_time = sim_clock.get_ticks() / 1000
         
         for player_id in ["player1", "player2"]:
             items_to_remove = []
@@ -127,7 +128,7 @@ class ItemsSystem:
         if not self.active_items[player_id]:
             return
         
-        font = pygame.font.Font(None, 20)
+        font = get_font(20)
         y_offset = 0
         
         for item_name in self.active_items[player_id]:
@@ -136,7 +137,7 @@ class ItemsSystem:
             
             # Si l'item a une durée, afficher le temps restant
             if item["duration"] > 0:
-                elapsed = (pygame.time.get_ticks() / 1000) - self.active_items[player_id][item_name]["start_time"]
+                elapsed = (sim_clock.get_ticks() / 1000) - self.active_items[player_id][item_name]["start_time"]
                 remaining = max(0, item["duration"] - elapsed)
                 item_text += f" ({int(remaining)}s)"
             
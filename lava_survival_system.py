@@ -5,7 +5,108 @@ Le gagnant remporte 5 points
 """
 import pygame
 import random
+from bisect import bisect_left, bisect_right
 from config import *
+from render_cache import draw_gradient, get_font
+
+
+class ScrollingPlatforms:
+    """Plateformes qui défilent, en coordonnées monde : y écran = y monde + offset.
+    Faire défiler = avancer offset (rien n'est recopié). Les plateformes gardent
+    leur ordre d'ajout (premier contact, départage du bot) et un index trié par
+    hauteur sert les recherches (bisect). L'index va du bas vers le haut : les
+    nouvelles plateformes (en haut) s'ajoutent à la fin, celles qui sortent en bas
+    partent du début ; les deux sont en O(1)."""
+
+    def __init__(self, height):
+        self.height = height
+        self.reset()
+
+    def reset(self):
+        self.offset = 0
+        self._next = 0
+        self._platforms = {}  # rang d'ajout -> (x, y monde, largeur), dans l'ordre d'ajout
+        self._keys = []       # -y monde croissants (du bas vers le haut)...
+        self._ranks = []      # ... et rang d'ajout correspondant
+        self._start = 0       # début de l'index (les entrées avant sont déjà retirées)
+
+    def __len__(self):
+        return len(self._platforms)
+
+    def __iter__(self):
+        """(x, y écran, largeur) dans l'ordre d'ajout"""
+        offset = self.offset
+        return ((x, y + offset, w) for x, y, w in self._platforms.values())
+
+    def add(self, x, y, width):
+        """Ajoute une plateforme à la hauteur écran y"""
+        y -= self.offset
+        keys, key = self._keys, -y
+        if not keys or key > keys[-1]:
+            # Cas courant : la nouvelle plateforme est la plus haute
+            keys.append(key)
+            self._ranks.append(self._next)
+        else:
+            # À hauteur égale, la plus récente passe avant (l'ordre d'ajout est
+            # rétabli quand on parcourt l'index du haut vers le bas)
+            index = bisect_left(keys, key, self._start)
+            keys.insert(index, key)
+            self._ranks.insert(index, self._next)
+        self._platforms[self._next] = (x, y, width)
+        self._next += 1
+
+    def scroll(self, dy):
+        self.offset += dy
+
+    def top(self):
+        """y écran de la plateforme la plus haute (None si aucune)"""
+        return self.offset - self._keys[-1] if self._platforms else None
+
+    def drop_below(self, limit):
+        """Retire les plateformes dont le y écran a atteint limit"""
+        keys, ranks, start = self._keys, self._ranks, self._start
+        threshold = self.offset - limit
+        while start < len(keys) and keys[start] <= threshold:
+            del self._platforms[ranks[start]]
+            start += 1
+        if start * 2 > len(keys):
+            # Compacter quand la moitié de l'index est retirée : O(1) amorti
+            del keys[:start], ranks[:start]
+            start = 0
+        self._start = start
+
+    def _band(self, low, high):
+        """Positions dans l'index des plateformes de y écran dans ]low, high[, de la plus haute à la plus basse"""
+        offset = self.offset
+        return range(bisect_left(self._keys, offset - low, self._start) - 1,
+                     bisect_right(self._keys, offset - high, self._start) - 1, -1)
+
+    def above(self, limit):
+        """(rang, x, y écran, largeur) des plateformes de y écran < limit, de la plus haute à la plus basse"""
+        offset, platforms, ranks = self.offset, self._platforms, self._ranks
+        for index in range(len(ranks) - 1, bisect_right(self._keys, offset - limit, self._start) - 1, -1):
+            x, y, w = platforms[ranks[index]]
+            yield ranks[index], x, y + offset, w
+
+    def between(self, low, high):
+        """Comme above, pour les y écran dans ]low, high["""
+        offset, platforms, ranks = self.offset, self._platforms, self._ranks
+        for index in self._band(low, high):
+            x, y, w = platforms[ranks[index]]
+            yield ranks[index], x, y + offset, w
+
+    def landing(self, rect, velocity_y, feet_y):
+        """y écran de la première plateforme (ordre d'ajout) sur laquelle se pose un
+        personnage de rect rect qui tombe (velocity_y >= 0), None sinon.
+        feet_y : y non arrondi du personnage (le rect est arrondi par pygame)"""
+        if velocity_y < 0:
+            return None
+        # Seules les plateformes qui recoupent rect verticalement peuvent le toucher
+        for rank, px, py, pw in sorted(self.between(rect.top - self.height, rect.bottom)):
+            if px < rect.right and rect.left < px + pw and feet_y < py + self.height:
+                return py
+        return None
+
 
 class LavaSurvivalSystem:
     def __init__(self, match_manager):
@@ -34,10 +135,11 @@ class LavaSurvivalSystem:
         self.bot_jump_count = 0
         self.bot_jump_cooldown = 0  # Cooldown pour éviter les sauts trop fréquents
         
-        # Plateformes (liste de (x, y, width))
-        self.platforms = []
+        # Plateformes (x, y, width), en coordonnées monde + défilement
         self.platform_height = 20
+        self.scrolling = ScrollingPlatforms(self.platform_height)
         self.platform_width = 100
+        self.platform_gap = 100  # Écart vertical entre deux plateformes ajoutées en haut
         
         # État
         self.winner = None
@@ -47,6 +149,11 @@ class LavaSurvivalSystem:
         self.survival_timer = 0
         self.survival_time_limit = 30  # 30 secondes pour gagner en survivant
         
+    @property
+    def platforms(self):
+        """Plateformes (x, y écran, width) dans l'ordre d'ajout"""
+        return list(self.scrolling)
+    
     def start_game(self):
         """Démarre une nouvelle partie"""
         self.game_active = True
@@ -79,15 +186,15 @@ class LavaSurvivalSystem:
         self.bot_jump_cooldown = 0
         
         # Créer des plateformes initiales (en haut de l'écran, elles vont descendre)
-        self.platforms = []
+        self.scrolling.reset()
         for i in range(8):
             x = random.randint(50, SCREEN_WIDTH - 150)
             y = 100 + i * 100  # Commencer en haut, elles descendent
-            self.platforms.append((x, y, self.platform_width))
+            self.scrolling.add(x, y, self.platform_width)
         
         # Plateformes pour les deux joueurs au départ (en bas)
-        self.platforms.append((self.player1_x - 50, SCREEN_HEIGHT - 150, self.platform_width))
-        self.platforms.append((self.player2_x - 50, SCREEN_HEIGHT - 150, self.platform_width))
+        self.scrolling.add(self.player1_x - 50, SCREEN_HEIGHT - 150, self.platform_width)
+        self.scrolling.add(self.player2_x - 50, SCREEN_HEIGHT - 150, self.platform_width)
     
     def update(self, player1_left=False, player1_right=False, player1_jump=False,
                player2_left=False, player2_right=False, player2_jump=False):
@@ -96,18 +203,18 @@ class LavaSurvivalSystem:
             return
         
         # Timer de survie
-        self.survival_timer += 1/60  # Incrémenter chaque frame (60 FPS)
+        self.survival_timer += TICK_DT  # Incrémenter à chaque tick de simulation
         
-        # Faire DESCENDRE toutes les plateformes (vers le bas)
-        self.platforms = [(x, y + self.scroll_speed, w) for x, y, w in self.platforms]
+        # Faire DESCENDRE toutes les plateformes (vers le bas) : seul le décalage avance
+        self.scrolling.scroll(self.scroll_speed)
         
         # Ajouter de nouvelles plateformes en haut si nécessaire (elles descendent)
-        if self.platforms and min(y for _, y, _ in self.platforms) > 50:
+        if self.scrolling and self.scrolling.top() > self.platform_gap - 50:
             x = random.randint(50, SCREEN_WIDTH - 150)
-            self.platforms.append((x, -50, self.platform_width))
+            self.scrolling.add(x, -50, self.platform_width)
         
         # Supprimer les plateformes qui sont sorties en bas (trop bas)
-        self.platforms = [(x, y, w) for x, y, w in self.platforms if y < SCREEN_HEIGHT + 100]
+        self.scrolling.drop_below(SCREEN_HEIGHT + 100)
         
         # Mouvement joueur 1
         if player1_left:
@@ -199,29 +306,26 @@ class LavaSurvivalSystem:
     def _update_bot(self):
         """IA du bot : se comporte comme un joueur - se déplace et saute pour survivre"""
         # Le bot doit toujours essayer de monter pour éviter de tomber
-        # Trouver la plateforme la plus proche au-dessus du bot (priorité aux plateformes hautes)
+        # Trouver la plateforme la plus proche au-dessus du bot (priorité aux plateformes hautes) :
+        # la plus haute, puis la plus proche horizontalement, puis la première ajoutée
         nearest_platform_above = None
-        min_distance_above = float('inf')
-        nearest_y_above = float('inf')
-        
-        for px, py, pw in self.platforms:
+        best = None
+        for rank, px, py, pw in self.scrolling.above(self.bot_y - 50):
             # Plateforme au-dessus du bot (avec une marge pour éviter de sauter trop tôt)
-            if py < self.bot_y - 50:
-                distance_x = abs(px + pw/2 - self.bot_x)
-                # Prioriser les plateformes les plus hautes et les plus proches horizontalement
-                if py < nearest_y_above or (py == nearest_y_above and distance_x < min_distance_above):
-                    min_distance_above = distance_x
-                    nearest_y_above = py
-                    nearest_platform_above = (px, py, pw)
+            if best is not None and py > best[0]:
+                break  # Index trié par hauteur : les suivantes sont plus basses
+            key = (py, abs(px + pw/2 - self.bot_x), rank)
+            if best is None or key < best:
+                best = key
+                nearest_platform_above = (px, py, pw)
         
         # Si aucune plateforme au-dessus, chercher la plus proche horizontalement
         if not nearest_platform_above:
-            for px, py, pw in self.platforms:
-                if py < self.bot_y - 20:  # Plateforme accessible
-                    distance_x = abs(px + pw/2 - self.bot_x)
-                    if distance_x < min_distance_above:
-                        min_distance_above = distance_x
-                        nearest_platform_above = (px, py, pw)
+            for rank, px, py, pw in self.scrolling.above(self.bot_y - 20):  # Plateforme accessible
+                key = (abs(px + pw/2 - self.bot_x), rank)
+                if best is None or key < best:
+                    best = key
+                    nearest_platform_above = (px, py, pw)
         
         # Se déplacer vers la plateforme cible
         if nearest_platform_above:
@@ -238,8 +342,8 @@ class LavaSurvivalSystem:
             # Sauter si on est sur une plateforme et qu'il y a une plateforme au-dessus à portée
             if self.bot_on_platform and abs(self.bot_x - target_x) < 60:
                 # Vérifier s'il y a une plateforme au-dessus à portée de saut
-                for px2, py2, pw2 in self.platforms:
-                    if py2 < self.bot_y - 30 and abs((px2 + pw2/2) - self.bot_x) < 80:
+                for rank, px2, py2, pw2 in self.scrolling.above(self.bot_y - 30):
+                    if abs((px2 + pw2/2) - self.bot_x) < 80:
                         if self.bot_jump_count < 2:  # Max 2 sauts
                             self.bot_velocity_y = -15  # Même force de saut que le joueur
                             self.bot_jump_count += 1
@@ -253,60 +357,49 @@ class LavaSurvivalSystem:
         
         # Si le bot est trop bas, essayer de sauter désespérément
         if self.bot_y > SCREEN_HEIGHT - 100 and self.bot_jump_count < 2:
-            # Chercher n'importe quelle plateforme au-dessus
-            for px, py, pw in self.platforms:
-                if py < self.bot_y - 20:
-                    if self.bot_jump_count < 2:
-                        self.bot_velocity_y = -15
-                        self.bot_jump_count += 1
-                        break
+            # Chercher n'importe quelle plateforme au-dessus (la plus haute suffit)
+            top = self.scrolling.top()
+            if top is not None and top < self.bot_y - 20:
+                self.bot_velocity_y = -15
+                self.bot_jump_count += 1
     
     def _check_platform_collisions(self):
-        """Vérifie les collisions avec les plateformes"""
+        """Vérifie les collisions avec les plateformes (seules celles à hauteur de chaque personnage)"""
         # Joueur 1
         player1_rect = pygame.Rect(self.player1_x - 15, self.player1_y, 30, 30)
         self.player1_on_platform = False
-        for px, py, pw in self.platforms:
-            platform_rect = pygame.Rect(px, py, pw, self.platform_height)
-            if player1_rect.colliderect(platform_rect):
-                # Si le joueur tombe sur la plateforme
-                if self.player1_velocity_y >= 0 and self.player1_y < py + self.platform_height:
-                    self.player1_y = py - 30
-                    self.player1_velocity_y = 0
-                    self.player1_on_platform = True
-                    # Réinitialiser le compteur de sauts quand on atterrit sur une plateforme
-                    self.player1_jump_count = 0
-                    break
+        py = self.scrolling.landing(player1_rect, self.player1_velocity_y, self.player1_y)
+        if py is not None:
+            # Le joueur tombe sur la plateforme
+            self.player1_y = py - 30
+            self.player1_velocity_y = 0
+            self.player1_on_platform = True
+            # Réinitialiser le compteur de sauts quand on atterrit sur une plateforme
+            self.player1_jump_count = 0
         
         # Joueur 2 (si PvP)
         if self.match_manager.game_mode == "pvp":
             player2_rect = pygame.Rect(self.player2_x - 15, self.player2_y, 30, 30)
             self.player2_on_platform = False
-            for px, py, pw in self.platforms:
-                platform_rect = pygame.Rect(px, py, pw, self.platform_height)
-                if player2_rect.colliderect(platform_rect):
-                    if self.player2_velocity_y >= 0 and self.player2_y < py + self.platform_height:
-                        self.player2_y = py - 30
-                        self.player2_velocity_y = 0
-                        self.player2_on_platform = True
-                        # Réinitialiser le compteur de sauts quand on atterrit sur une plateforme
-                        self.player2_jump_count = 0
-                        break
+            py = self.scrolling.landing(player2_rect, self.player2_velocity_y, self.player2_y)
+            if py is not None:
+                self.player2_y = py - 30
+                self.player2_velocity_y = 0
+                self.player2_on_platform = True
+                # Réinitialiser le compteur de sauts quand on atterrit sur une plateforme
+                self.player2_jump_count = 0
         
         # Bot (si mode 1v1 ou 2v1)
         if self.match_manager.game_mode != "pvp":
             bot_rect = pygame.Rect(self.bot_x - 15, self.bot_y, 30, 30)
             self.bot_on_platform = False
-            for px, py, pw in self.platforms:
-                platform_rect = pygame.Rect(px, py, pw, self.platform_height)
-                if bot_rect.colliderect(platform_rect):
-                    if self.bot_velocity_y >= 0 and self.bot_y < py + self.platform_height:
-                        self.bot_y = py - 30
-                        self.bot_velocity_y = 0
-                        self.bot_on_platform = True
-                        # Réinitialiser le compteur de sauts quand on atterrit sur une plateforme
-                        self.bot_jump_count = 0
-                        break
+            py = self.scrolling.landing(bot_rect, self.bot_velocity_y, self.bot_y)
+            if py is not None:
+                self.bot_y = py - 30
+                self.bot_velocity_y = 0
+                self.bot_on_platform = True
+                # Réinitialiser le compteur de sauts quand on atterrit sur une plateforme
+                self.bot_jump_count = 0
     
     def get_winner_for_match(self):
         """Retourne le gagnant pour le match_manager"""
@@ -320,26 +413,19 @@ class LavaSurvivalSystem:
         if not self.game_active:
             return
         
-        # Fond (lave en bas)
-        screen.fill((139, 0, 0))  # Rouge foncé (lave)
-        # Dégradé vers le haut
-        for y in range(SCREEN_HEIGHT):
-            ratio = y / SCREEN_HEIGHT
-            r = int(139 * (1 - ratio) + 25 * ratio)
-            g = int(0 * (1 - ratio) + 25 * ratio)
-            b = int(0 * (1 - ratio) + 112 * ratio)
-            pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        # Fond : dégradé lave (rouge foncé) vers le bleu nuit
+        draw_gradient(screen, (139, 0, 0), (25, 25, 112))
         
         # Titre
-        font_large = pygame.font.Font(None, 56)
+        font_large = get_font(56)
         title = font_large.render("🔥 LE SOL EST EN LAVE 🔥", True, RED)
         screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 20))
-        subtitle = pygame.font.Font(None, 28).render("5 points pour le dernier survivant!", True, YELLOW)
+        subtitle = get_font(28).render("5 points pour le dernier survivant!", True, YELLOW)
         screen.blit(subtitle, (SCREEN_WIDTH // 2 - subtitle.get_width() // 2, 70))
         
         # Instructions détaillées
-        font_small = pygame.font.Font(None, 24)
-        font_tiny = pygame.font.Font(None, 20)
+        font_small = get_font(24)
+        font_tiny = get_font(20)
         
         # Instructions simplifiées
         if self.match_manager.game_mode == "pvp":
@@ -359,7 +445,7 @@ class LavaSurvivalSystem:
             screen.blit(timer_text, (SCREEN_WIDTH // 2 - timer_text.get_width() // 2, 155))
         
         # Dessiner les plateformes
-        for px, py, pw in self.platforms:
+        for px, py, pw in self.scrolling:
             if -50 < py < SCREEN_HEIGHT + 50:
                 pygame.draw.rect(screen, GREEN, (px, py, pw, self.platform_height))
                 pygame.draw.rect(screen, BLACK, (px, py, pw, self.platform_height), 2)
@@ -381,7 +467,7 @@ class LavaSurvivalSystem:
         
         # Message de fin
         if self.game_over:
-            font_medium = pygame.font.Font(None, 48)
+            font_medium = get_font(48)
             if self.winner == 'player1':
                 msg = "Joueur 1 survit! +5 points"
                 color = RED
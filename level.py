@@ -1,47 +1,219 @@
 """
 Gestion des niveaux - Génération depuis fichier texte
 """
+import os
+import threading
+from collections import OrderedDict
 import pygame
 from platform import Platform
 from enemy import Enemy
-from collectible import Collectible
-from boss import Boss
+from enemy_pool import EnemyPool
+from collectible import Collectible, CollectibleSet
+from level_file import load_level_file
+import level_cache
+from boss import Boss, minion_pool
+from static_layer import StaticLayer
+from particles import ParticleSystem
+from spatial_index import CheckpointIndex, IntervalIndex, SpatialHash, rect_extent
 from config import *
+from timestep import sim_clock
+from render_cache import get_font
+
+
+def _patrol_extent(enemy):
+    """Zone horizontale qu'un ennemi peut parcourir : sa patrouille, élargie d'une largeur"""
+    return (min(enemy.rect.left, enemy.platform_left) - ENEMY_WIDTH,
+            max(enemy.rect.right, enemy.platform_right) + ENEMY_WIDTH)
+
+
+class LevelTemplate:
+    """Partie statique d'un niveau, partagée par tous les Level construits dessus
+    (manches et essais successifs sur le même niveau, les deux joueurs du PvP) :
+    plateformes et leur grille de collision, checkpoints et leur index, fin du niveau,
+    limites (niveau boss), décor en colonnes, et l'image compilée (voir level_cache.py)
+    qui donne les apparitions : ennemis, étoiles, position du boss.
+    Rien n'y change pendant une partie : l'état mobile vit dans Level (voir Level.reset)."""
+
+    _cache = OrderedDict()  # Clé du cache sur disque -> LevelTemplate (dernier utilisé à la fin)
+    _lock = threading.Lock()  # Un préchargement peut construire un modèle en même temps
+
+    def __init__(self, image):
+        self.image = image
+        self.level_type = image.level_type
+        self.end_x = image.end_x
+        self.bounds_x = image.bounds_x
+        self.platforms = [Platform(x, y, width) for x, y, width in image.platforms]
+        self.platform_index = SpatialHash(self.platforms)
+        self.checkpoints = list(image.checkpoints)
+        self.checkpoint_index = (CheckpointIndex(self.checkpoints), self.checkpoints, len(self.checkpoints))
+        # Colonnes rendues au premier dessin qui les montre, sur le thread principal : jamais
+        # dans le thread de préchargement (ni les polices ni le cache de textes n'y sont sûrs)
+        self.static_layer = StaticLayer(self)
+
+    @classmethod
+    def get(cls, level_file=None, level_id=0, use_cache=True):
+        """Modèle du niveau : déjà en mémoire, sinon lu dans le cache sur disque, sinon
+        compilé depuis sa source. use_cache=False : recompilé, ni lu ni gardé."""
+        source = level_file if level_file and os.path.exists(level_file) else None
+        if not use_cache:
+            return cls(Level.compile(source, level_id))
+        try:
+            key = level_cache.cache_name(source, level_id)  # Change avec le contenu de la source
+        except OSError:
+            return cls(Level.compile(source, level_id))
+        with cls._lock:
+            template = cls._cache.get(key)
+            if template is not None:
+                cls._cache.move_to_end(key)
+                return template
+            image = level_cache.load(source, level_id, key)
+            if image is None:
+                image = Level.compile(source, level_id)
+                level_cache.store(image, source, level_id, key)
+            template = cls._cache[key] = cls(image)
+            while len(cls._cache) > LEVEL_TEMPLATE_CACHE:
+                cls._cache.popitem(last=False)
+            return template
+
+    @classmethod
+    def clear(cls):
+        """Oublie les modèles gardés en mémoire"""
+        with cls._lock:
+            cls._cache.clear()
+
+    def draw_checkpoints(self, screen, camera_x=0, checkpoints=None):
+        """Dessine les checkpoints (petits drapeaux verts)"""
+        for cx, cy in (self.checkpoints if checkpoints is None else checkpoints):
+            cp_x = cx - camera_x
+            pygame.draw.circle(screen, GREEN, (int(cp_x), int(cy)), 15)
+            pygame.draw.circle(screen, BLACK, (int(cp_x), int(cy)), 15, 2)
+
+    def draw_goal(self, screen, camera_x=0):
+        """Dessine la zone de fin (drapeau)"""
+        flag_pole_x = self.end_x - camera_x
+        flag_pole_y = SCREEN_HEIGHT - 150
+        flag_pole_height = 100
+
+        pygame.draw.line(screen, (139, 69, 19),  # Marron
+                         (flag_pole_x, flag_pole_y),
+                         (flag_pole_x, flag_pole_y + flag_pole_height), 5)
+
+        flag_width = 40
+        flag_height = 30
+        flag_rect = pygame.Rect(flag_pole_x + 5, flag_pole_y, flag_width, flag_height)
+
+        for i in range(2):
+            for j in range(2):
+                cell_rect = pygame.Rect(
+                    flag_rect.x + i * flag_width // 2,
+                    flag_rect.y + j * flag_height // 2,
+                    flag_width // 2,
+                    flag_height // 2
+                )
+                if (i + j) % 2 == 0:
+                    pygame.draw.rect(screen, YELLOW, cell_rect)
+                else:
+                    pygame.draw.rect(screen, RED, cell_rect)
+                pygame.draw.rect(screen, BLACK, cell_rect, 1)
+
+        font = get_font(24)
+        text = font.render("GOAL", True, BLACK)
+        text_rect = text.get_rect(center=(flag_rect.centerx, flag_rect.centery))
+        screen.blit(text, text_rect)
 
 class Level:
-    def __init__(self, level_file=None, level_id=0):
-        self.platforms = []
-        self.enemies = []
-        self.collectibles = []
-        self.boss = None  # Boss pour le niveau final
-        self.checkpoints = []  # Liste de (x, y) pour les points de respawn
-        self.end_x = SCREEN_WIDTH - 100  # Position de fin du niveau
+    def __init__(self, level_file=None, level_id=0, use_cache=True):
+        self.level_file = level_file
         self.level_id = level_id
-        self.level_type = "parkour"  # parkour ou boss
-        
-        # Vérifier si le fichier existe avant de l'utiliser
-        file_exists = False
-        if level_file:
-            import os
-            file_exists = os.path.exists(level_file)
+        # Partie statique, partagée avec les autres niveaux construits sur le même modèle
+        template = self.template = LevelTemplate.get(level_file, level_id, use_cache)
+        self.level_type = template.level_type  # parkour ou boss
+        self.platforms = template.platforms
+        # Grille de collision des plateformes (Player, Enemy et Boss interrogent query(rect))
+        self.platform_index = template.platform_index
+        self.checkpoints = template.checkpoints  # Liste de (x, y) pour les points de respawn
+        self._checkpoint_index = template.checkpoint_index  # (CheckpointIndex, liste indexée, taille)
+        self.end_x = template.end_x  # Position de fin du niveau
+        if template.bounds_x is not None:
+            self.bounds_x = template.bounds_x  # Limites pour ne pas tomber sur les côtés
+        self.static_layer = template.static_layer  # Décor statique pré-rendu en colonnes
         
-        if level_file and file_exists:
+        # État mobile : créé une fois ici, remis à zéro sur place par reset()
+        # Éclats des étoiles ramassées (gravité 0.3, rétrécissent, s'estompent en 15 frames)
+        self.particles = ParticleSystem(COLLECT_PARTICLE_CAPACITY, gravity=0.3, growth=-0.3,
+                                        min_size=1, fade_frames=15)
+        # Données des ennemis en colonnes, mises à jour en bloc
+        self.enemy_pool = EnemyPool()
+        image = template.image
+        self._spawns = [Enemy(x, y, left, right, is_1v1, flying, pool=self.enemy_pool)
+                        for x, y, left, right, is_1v1, flying in image.enemies]
+        self._stars = [Collectible(x, y, collect_type) for x, y, collect_type in image.collectibles]
+        self.boss = Boss(*image.boss) if image.boss is not None else None  # Boss pour le niveau final
+        self.enemies = []
+        # Étoiles réparties en restantes / en cours de collecte / retirées
+        self.collectibles = CollectibleSet(emitter=self.particles)
+        # Index de culling : nom -> (index, liste indexée, taille de la liste)
+        self._cull_indexes = {}
+        # Broad phase des collisions : paires (élément, joueur) testées vs toutes les paires,
+        # cumulées depuis le départ (divisées par "ticks" = moyenne par tick)
+        self.collision_stats = dict.fromkeys(("ticks", "enemies_pairs", "enemies_all",
+                                              "collectibles_pairs", "collectibles_all"), 0)
+        self.reset()
+    
+    def reset(self):
+        """Remet le niveau dans son état de départ, sur place (nouvel essai, même niveau à la
+        manche suivante) : ennemis à leur position d'apparition, étoiles à ramasser, boss en
+        phase 1 (ses sbires rendus à la réserve), particules effacées. Le décor ne change pas."""
+        for enemy in self.enemies:
+            if enemy.owner is not None:
+                minion_pool.release(enemy)
+        for enemy, spawn in zip(self._spawns, self.template.image.enemies):
+            enemy.respawn(*spawn)
+        self.enemies[:] = self._spawns
+        self.enemy_pool.sync(self.enemies, changed=True)
+        self.collectibles.reset(self._stars)
+        self.particles.clear()
+        if self.boss is not None:
+            self.boss.reset()
+            # IMPORTANT: Ne pas initialiser boss_start_time ici
+            # Le timer sera initialisé seulement quand l'animation "Manche X" est terminée
+            self.boss_start_time = None
+            self.red_stars_added = False  # Étoiles rouges ajoutées en phase 1
+            self.blue_stars_added = False  # Étoiles bleues ajoutées en phase 2
+        self._cull_indexes.clear()
+        for key in self.collision_stats:
+            self.collision_stats[key] = 0
+    
+    @classmethod
+    def compile(cls, source=None, level_id=0):
+        """Image compilée d'un niveau (voir level_cache.py), construite depuis sa source :
+        le fichier texte s'il y en a un, sinon le niveau prédéfini level_id"""
+        builder = cls.__new__(cls)
+        builder.platforms = []
+        builder.enemies = []
+        builder.collectibles = []
+        builder.boss = None
+        builder.checkpoints = []
+        builder.end_x = SCREEN_WIDTH - 100
+        builder.level_type = "parkour"
+        if source:
             # Charger depuis le fichier si il existe
-            self.load_from_file(level_file)
+            builder.load_from_file(source)
         else:
             # Créer le niveau basé sur level_id
             if level_id == 0:
-                self.create_parkour_level_1()
+                builder.create_parkour_level_1()
             elif level_id == 1:
-                self.create_parkour_level_2()
+                builder.create_parkour_level_2()
             elif level_id == 2:
-                self.create_parkour_level_3()
+                builder.create_parkour_level_3()
             elif level_id == 3:
-                self.create_parkour_level_4()
+                builder.create_parkour_level_4()
             elif level_id == 4:
-                self.create_boss_level()
+                builder.create_boss_level()
             else:
-                self.create_default_level()
+                builder.create_default_level()
+        return level_cache.LevelImage.from_level(builder)
     
     def create_parkour_level_1(self):
         """Niveau Parkour 1 - Sauts et plateformes (FACILE mais PLUS LONG)"""
@@ -122,9 +294,6 @@ class Level:
         """Niveau Boss Final - Le boss reste au fond et tire des ennemis au sol et en l'air"""
         self.level_type = "boss"
         extended_width = SCREEN_WIDTH * 2  # Niveau plus long
-        # IMPORTANT: Ne pas initialiser boss_start_time ici
-        # Le timer sera initialisé seulement quand l'animation "Manche X" est terminée
-        self.boss_start_time = None  # Sera initialisé quand le jeu commence vraiment
         self.platforms = [
             Platform(0, SCREEN_HEIGHT - 50, extended_width),
         ]
@@ -163,8 +332,6 @@ class Level:
         # Pas d'étoiles jaunes en manche 5 - étoiles rouges (phase 1 et 3) et bleues (phase 2 et 3)
         # Les étoiles seront ajoutées dynamiquement selon la phase du boss
         self.collectibles = []
-        self.red_stars_added = False  # Étoiles rouges ajoutées en phase 1
-        self.blue_stars_added = False  # Étoiles bleues ajoutées en phase 2
         self.bounds_x = (0, extended_width)  # Limites pour ne pas tomber sur les côtés
         self.checkpoints = []  # Pas de checkpoints en manche 5
         self.end_x = extended_width - 50
@@ -421,60 +588,39 @@ class Level:
     
     def load_from_file(self, filename):
         """Charge un niveau depuis un fichier texte"""
+        # Format (voir level_file.py) : chaque ligne représente une rangée du niveau,
+        # '1' = plateforme, '0' = vide, 'E' = ennemi (posé sur la plateforme du dessous),
+        # 'C' = collectible, 'F' = fin du niveau
         try:
-            with open(filename, 'r') as f:
-                lines = f.readlines()
-            
-            # Format: chaque ligne représente une ligne du niveau
-            # '1' = plateforme, '0' = vide, 'E' = ennemi, 'C' = collectible, 'P' = position joueur
-            cell_size = 40  # Taille de chaque cellule
-            
-            for y, line in enumerate(lines):
-                for x, char in enumerate(line.strip()):
-                    px = x * cell_size
-                    py = y * cell_size
-                    
-                    if char == '1':  # Plateforme
-                        # Vérifier si une plateforme continue existe déjà
-                        found = False
-                        for platform in self.platforms:
-                            if platform.rect.y == py and platform.rect.right == px:
-                                platform.rect.width += cell_size
-                                found = True
-                                break
-                        if not found:
-                            self.platforms.append(Platform(px, py, cell_size))
-                    
-                    elif char == 'E':  # Ennemi
-                        # Trouver la plateforme sous l'ennemi
-                        platform_left = px
-                        platform_right = px + cell_size
-                        for platform in self.platforms:
-                            if platform.rect.y == py + cell_size:
-                                platform_left = platform.rect.left
-                                platform_right = platform.rect.right
-                                break
-                        self.enemies.append(Enemy(px, py, platform_left, platform_right))
-                    
-                    elif char == 'C':  # Collectible
-                        self.collectibles.append(Collectible(px, py))
-                    
-                    elif char == 'F':  # Fin du niveau
-                        self.end_x = px
-        
+            data = load_level_file(filename)
         except FileNotFoundError:
             print(f"Fichier {filename} non trouvé, utilisation du niveau par défaut")
             self.create_default_level()
+            return
+        
+        self.platforms.extend(Platform(x, y, width) for x, y, width in data.platforms)
+        self.enemies.extend(Enemy(x, y, left, right) for x, y, left, right in data.enemies)
+        self.collectibles.extend(Collectible(x, y) for x, y in data.collectibles)
+        if data.end_x is not None:
+            self.end_x = data.end_x
     
     def update(self, player):
         """Met à jour tous les éléments du niveau"""
-        # Mettre à jour les ennemis
-        for enemy in self.enemies:
-            enemy.update(self.platforms, player)
+        self.collision_stats["ticks"] += 1
+        # Mettre à jour les ennemis (en bloc ; la liste a pu changer : spawns du boss, morts retirées)
+        self.enemy_pool.sync(self.enemies)
+        self.enemy_pool.update(self.platform_index)
+        # Un ennemi sorti de sa zone indexée invalide l'index de culling
+        enemy_index = self._cull_indexes.get("enemies")
+        if enemy_index and self.enemy_pool.escaped:
+            for enemy in self.enemies:
+                if not enemy_index[0].covers(enemy, enemy.rect.left, enemy.rect.right):
+                    self._cull_indexes.pop("enemies", None)
+                    break
         
         # Mettre à jour le boss si présent
         if self.boss:
-            self.boss.update(self.platforms, player, self)
+            self.boss.update(self.platform_index, player, self)
             
             # Ajouter les étoiles selon les phases du boss
             if self.level_type == "boss" and self.boss:
@@ -486,7 +632,7 @@ class Level:
                         self.red_stars_added = True
                         self.blue_stars_added = False  # Réinitialiser pour la phase suivante
                         # Retirer toutes les étoiles bleues si présentes
-                        self.collectibles = [c for c in self.collectibles if c.collect_type != "kill_flying"]
+                        self.collectibles.discard_type("kill_flying")
                         # Ajouter les étoiles rouges
                         red_positions = [
                             # Sur plateformes basses
@@ -500,8 +646,8 @@ class Level:
                             (1100, SCREEN_HEIGHT - 390), (1400, SCREEN_HEIGHT - 370), (1700, SCREEN_HEIGHT - 410),
                             (2000, SCREEN_HEIGHT - 380), (2300, SCREEN_HEIGHT - 400),
                         ]
-                        for px, py in red_positions:
-                            self.collectibles.append(Collectible(px, py, collect_type="kill_ground"))
+                        self.collectibles.extend(Collectible(px, py, collect_type="kill_ground")
+                                                 for px, py in red_positions)
                 
                 # Phase 2 : seulement étoiles bleues
                 elif current_phase == 2:
@@ -509,7 +655,7 @@ class Level:
                         self.blue_stars_added = True
                         self.red_stars_added = False  # Réinitialiser pour la phase suivante
                         # Retirer toutes les étoiles rouges de la phase 1
-                        self.collectibles = [c for c in self.collectibles if c.collect_type != "kill_ground"]
+                        self.collectibles.discard_type("kill_ground")
                         # Ajouter les étoiles bleues
                         blue_positions = [
                             # Sur plateformes hautes
@@ -528,15 +674,16 @@ class Level:
                             (1150, SCREEN_HEIGHT - 400), (1450, SCREEN_HEIGHT - 380), (1750, SCREEN_HEIGHT - 420),
                             (2050, SCREEN_HEIGHT - 390),
                         ]
-                        for px, py in blue_positions:
-                            self.collectibles.append(Collectible(px, py, collect_type="kill_flying"))
+                        self.collectibles.extend(Collectible(px, py, collect_type="kill_flying")
+                                                 for px, py in blue_positions)
                 
                 # Phase 3 : les deux types d'étoiles (rouges + bleues)
                 elif current_phase == 3:
                     # Réinitialiser les flags pour réajouter les étoiles
                     if not self.red_stars_added or not self.blue_stars_added:
                         # Retirer toutes les étoiles existantes
-                        self.collectibles = [c for c in self.collectibles if c.collect_type not in ["kill_ground", "kill_flying"]]
+                        self.collectibles.discard_type("kill_ground")
+                        self.collectibles.discard_type("kill_flying")
                         self.red_stars_added = False
                         self.blue_stars_added = False
                     
@@ -554,8 +701,8 @@ class Level:
                             (1100, SCREEN_HEIGHT - 390), (1400, SCREEN_HEIGHT - 370), (1700, SCREEN_HEIGHT - 410),
                             (2000, SCREEN_HEIGHT - 380), (2300, SCREEN_HEIGHT - 400),
                         ]
-                        for px, py in red_positions:
-                            self.collectibles.append(Collectible(px, py, collect_type="kill_ground"))
+                        self.collectibles.extend(Collectible(px, py, collect_type="kill_ground")
+                                                 for px, py in red_positions)
                     
                     if not self.blue_stars_added:
                         self.blue_stars_added = True
@@ -576,97 +723,93 @@ class Level:
                             (1150, SCREEN_HEIGHT - 400), (1450, SCREEN_HEIGHT - 380), (1750, SCREEN_HEIGHT - 420),
                             (2050, SCREEN_HEIGHT - 390),
                         ]
-                        for px, py in blue_positions:
-                            self.collectibles.append(Collectible(px, py, collect_type="kill_flying"))
+                        self.collectibles.extend(Collectible(px, py, collect_type="kill_flying")
+                                                 for px, py in blue_positions)
         
-        # Mettre à jour les collectibles
-        for collectible in self.collectibles:
-            collectible.update()
+        # Mettre à jour les collectibles (restants et en cours de collecte seulement)
+        self.collectibles.update()
+        self.particles.update()
     
-    def draw(self, screen, camera_x=0):
+    def draw(self, screen, camera_x=0, alpha=1.0):
         """Dessine tous les éléments du niveau avec décalage de caméra"""
         view_w = screen.get_width()
-        # Dessiner les plateformes avec décalage de caméra
-        for platform in self.platforms:
-            if platform.rect.right - camera_x > 0 and platform.rect.left - camera_x < view_w:
-                # Sauvegarder la position originale
-                old_x = platform.rect.x
-                platform.rect.x -= camera_x
-                platform.draw(screen)
-                platform.rect.x = old_x  # Restaurer
+        # Décor statique pré-rendu (plateformes, checkpoints, drapeau)
+        self.static_layer.draw(screen, camera_x)
         
-        # Dessiner les collectibles avec décalage de caméra (ou animation de collecte)
-        for collectible in self.collectibles:
-            in_view = collectible.rect.right - camera_x > 0 and collectible.rect.left - camera_x < view_w
-            has_anim = collectible.collected and collectible.collect_particles
-            if in_view or has_anim:
-                old_x = collectible.rect.x
-                collectible.rect.x -= camera_x
-                collectible.draw(screen, camera_x)
-                collectible.rect.x = old_x
+        # Collectibles et ennemis visibles (recherche dans les index triés par x)
+        for collectible in self.visible_collectibles(camera_x, camera_x + view_w):
+            collectible.draw(screen, camera_x)
+        self.particles.draw(screen, camera_x)
         
-        # Dessiner les ennemis avec décalage de caméra
-        for enemy in self.enemies:
-            if enemy.rect.right - camera_x > 0 and enemy.rect.left - camera_x < view_w:
-                old_x = enemy.rect.x
-                enemy.rect.x -= camera_x
-                enemy.draw(screen)
-                enemy.rect.x = old_x
+        for enemy in self.visible_enemies(camera_x, camera_x + view_w):
+            enemy.draw(screen, camera_x, alpha)
         
         # Dessiner le boss si présent - TOUJOURS en haut à droite de l'écran (fixe)
         if self.boss and self.level_type == "boss":
-            # Le boss reste en haut à droite, visible tout le temps
-            old_x, old_y = self.boss.rect.x, self.boss.rect.y
-            self.boss.rect.x = view_w - 120
-            self.boss.rect.y = 60
-            self.boss.draw(screen)
-            self.boss.rect.x, self.boss.rect.y = old_x, old_y
-        
-        # Dessiner les checkpoints (petits drapeaux verts)
-        if self.checkpoints:
-            for cx, cy in self.checkpoints:
-                cp_x = cx - camera_x
-                if -50 < cp_x < view_w + 50:
-                    pygame.draw.circle(screen, GREEN, (int(cp_x), int(cy)), 15)
-                    pygame.draw.circle(screen, BLACK, (int(cp_x), int(cy)), 15, 2)
-        
-        # Dessiner la zone de fin (drapeau) - PAS pour le niveau boss (manche 5)
-        if self.level_type != "boss":
-            flag_pole_x = self.end_x - camera_x
-            flag_pole_y = SCREEN_HEIGHT - 150
-            flag_pole_height = 100
-            
-            pygame.draw.line(screen, (139, 69, 19),  # Marron
-                             (flag_pole_x, flag_pole_y),
-                             (flag_pole_x, flag_pole_y + flag_pole_height), 5)
-            
-            flag_width = 40
-            flag_height = 30
-            flag_rect = pygame.Rect(flag_pole_x + 5, flag_pole_y, flag_width, flag_height)
-            
-            for i in range(2):
-                for j in range(2):
-                    cell_rect = pygame.Rect(
-                        flag_rect.x + i * flag_width // 2,
-                        flag_rect.y + j * flag_height // 2,
-                        flag_width // 2,
-                        flag_height // 2
-                    )
-                    if (i + j) % 2 == 0:
-                        pygame.draw.rect(screen, YELLOW, cell_rect)
-                    else:
-                        pygame.draw.rect(screen, RED, cell_rect)
-                    pygame.draw.rect(screen, BLACK, cell_rect, 1)
-            
-            font = pygame.font.Font(None, 24)
-            text = font.render("GOAL", True, BLACK)
-            text_rect = text.get_rect(center=(flag_rect.centerx, flag_rect.centery))
-            screen.blit(text, text_rect)
+            # Décalage qui amène le boss en (view_w - 120, 60) quelle que soit sa position
+            self.boss.draw(screen, self.boss.rect.x - (view_w - 120), self.boss.rect.y - 60)
+    
+    def _cull_index(self, name, items, extent=rect_extent):
+        """Index de culling de la liste items (reconstruit si la liste a changé)"""
+        entry = self._cull_indexes.get(name)
+        if entry is None or entry[1] is not items or entry[2] != len(items):
+            entry = (IntervalIndex(items, extent), items, len(items))
+            self._cull_indexes[name] = entry
+        return entry[0]
+    
+    def visible_collectibles(self, left, right):
+        """Collectibles dont le rect recoupe ]left, right[ (coordonnées monde)"""
+        candidates = self._cull_index("collectibles", self.collectibles.live).query(left, right)
+        return [c for c in candidates if c.rect.right > left and c.rect.left < right]
+    
+    def visible_enemies(self, left, right):
+        """Ennemis dont le rect recoupe ]left, right[ (coordonnées monde)"""
+        candidates = self._cull_index("enemies", self.enemies, _patrol_extent).query(left, right)
+        return [e for e in candidates if e.rect.right > left and e.rect.left < right]
+    
+    def contact_candidates(self, name, players, margin=0):
+        """Broad phase des collisions : éléments de la liste name ("enemies" ou "collectibles")
+        dont le rect recoupe en x celui d'un des joueurs (élargi de margin), dans l'ordre de
+        la liste. Les tests précis restent ceux des éléments (écrasement, boucliers...).
+        Si un joueur est déplacé pendant le parcours (retour au checkpoint), les candidats
+        restants sont recalculés depuis sa nouvelle position."""
+        if name == "enemies":
+            items, extent = self.enemies, _patrol_extent
+        else:
+            items, extent = self.collectibles.live, rect_extent
+        stats = self.collision_stats
+        stats[name + "_all"] += len(items) * len(players)
+        after = -1
+        while True:
+            positions = [player.rect.topleft for player in players]
+            index = self._cull_index(name, items, extent)
+            found = {}
+            for player in players:
+                left, right = player.rect.left - margin, player.rect.right + margin
+                near = [(order, item) for order, item in index.query_ordered(left, right)
+                        if order > after and item.rect.right > left and item.rect.left < right]
+                stats[name + "_pairs"] += len(near)
+                found.update(near)
+            for order in sorted(found):
+                yield found[order]
+                after = order
+                if [player.rect.topleft for player in players] != positions:
+                    break
+            else:
+                return
+    
+    def draw_checkpoints(self, screen, camera_x=0, checkpoints=None):
+        """Dessine les checkpoints (petits drapeaux verts)"""
+        self.template.draw_checkpoints(screen, camera_x, checkpoints)
+    
+    def draw_goal(self, screen, camera_x=0):
+        """Dessine la zone de fin (drapeau)"""
+        self.template.draw_goal(screen, camera_x)
     
     def check_boss_timeout(self):
         """Vérifie si le timer du boss (3min15) est écoulé"""
         if self.level_type == "boss" and hasattr(self, 'boss_start_time') and self.boss_start_time is not None:
-            elapsed_ms = pygame.time.get_ticks() - self.boss_start_time
+            elapsed_ms = sim_clock.get_ticks() - self.boss_start_time
             elapsed_seconds = elapsed_ms / 1000.0
             # 3min15 = 195 secondes
             if elapsed_seconds >= 195:
@@ -692,8 +835,7 @@ class Level:
             # Vérifier si toutes les phases sont terminées (phase > 3 signifie que les 3 phases sont complètes)
             if self.boss.phase > 3:
                 # Toutes les phases terminées : vérifier qu'il n'y a plus d'ennemis
-                alive_enemies = [e for e in self.enemies if e.alive]
-                if len(alive_enemies) == 0:
+                if self.boss.minions_alive == 0:
                     return True  # Toutes les phases terminées ET tous les ennemis tués = victoire
             
             # Le timeout est géré par check_boss_timeout() dans game.py
@@ -701,16 +843,28 @@ class Level:
         else:
             return player.rect.right >= self.end_x
     
+    def checkpoint_index(self):
+        """Index des checkpoints triés par x (reconstruit si la liste a changé)"""
+        entry = self._checkpoint_index
+        if entry is None or entry[1] is not self.checkpoints or entry[2] != len(self.checkpoints):
+            entry = (CheckpointIndex(self.checkpoints), self.checkpoints, len(self.checkpoints))
+            self._checkpoint_index = entry
+        return entry[0]
+    
     def check_checkpoint(self, player):
         """Vérifie si le joueur touche un checkpoint et met à jour last_checkpoint"""
         if not self.checkpoints:
             return
-        for i, (cx, cy) in enumerate(self.checkpoints):
-            if i in player.checkpoints_reached:
-                continue
-            if (player.rect.centerx >= cx - 40 and player.rect.centerx <= cx + 40 and
-                abs(player.rect.centery - cy) < 80):
-                player.checkpoints_reached.append(i)
-                player.last_checkpoint = (cx, cy)
-                break
+        index = self.checkpoint_index()
+        i = index.touching(player.rect.centerx, player.rect.centery, player.checkpoints_reached)
+        if i is not None:
+            player.checkpoints_reached |= 1 << i
+            player.last_checkpoint = self.checkpoints[i]
+    
+    def next_checkpoint(self, player):
+        """Prochain checkpoint non franchi à droite du joueur : (x, y), ou None"""
+        if not self.checkpoints:
+            return None
+        i = self.checkpoint_index().next_after(player.rect.centerx, player.checkpoints_reached)
+        return None if i is None else self.checkpoints[i]
 
@@ -0,0 +1,333 @@
+"""
+Niveaux compilés : cache binaire sur disque
+Un niveau (prédéfini ou fichier texte) est compilé une fois en tableaux de nombres
+(plateformes, ennemis, collectibles, checkpoints, fin du niveau, limites, boss),
+écrits dans LEVEL_CACHE_DIR sous un nom qui contient le hash de sa source. Les
+constructions suivantes lisent ce fichier projeté en mémoire (mmap) au lieu de
+réexécuter create_parkour_level_* ou de relire le texte : chaque section en est
+copiée d'un bloc, puis convertie en tuples à l'usage seulement. Une source modifiée
+change le hash : l'ancien fichier compilé est remplacé.
+Usage :
+    python level_cache.py                # précompile les niveaux prédéfinis
+    python level_cache.py course.txt     # ... et des niveaux en fichier texte
+"""
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+import pygame
+from config import *
+
+FORMAT_VERSION = 1
+_MAGIC = b"CJLV"
+# En-tête : magic, version, nombres de plateformes / ennemis / collectibles / checkpoints,
+# drapeaux, type de niveau, fin du niveau, position du boss, limites horizontales
+_HEADER = struct.Struct("<4sIIIIII8sddddd4x")
+# Valeurs par élément des sections (tableaux de doubles, dans cet ordre après l'en-tête)
+_PLATFORM_VALUES = 3     # x, y, largeur
+_ENEMY_VALUES = 5        # x, y, gauche, droite, drapeaux
+_COLLECTIBLE_VALUES = 3  # x, y, type
+_CHECKPOINT_VALUES = 2   # x, y
+
+# Drapeaux de l'en-tête
+_HAS_BOSS = 1
+_HAS_BOUNDS = 2
+_END_X_FLOAT = 4   # end_x était un float (les niveaux prédéfinis en ont des deux sortes)
+_BOUNDS_FLOAT = 8
+# Drapeaux d'un ennemi
+_ENEMY_FLYING = 1
+_ENEMY_1V1 = 2
+
+COLLECT_TYPES = ("speed", "jump", "kill_ground", "kill_flying")
+
+# Le code dont dépend une image compilée : niveaux prédéfinis, lecture des fichiers texte
+# (et pose des ennemis), valeurs d'apparition des ennemis, étoiles et boss, configuration
+_SOURCES = ("level.py", "level_file.py", "enemy.py", "collectible.py", "boss.py", "config.py")
+_source_hash = None
+_names = {}  # Signature de la source -> résultat de cache_name
+
+
+def _number(value):
+    """Entier si la valeur est entière (les coordonnées des niveaux le sont presque toujours)"""
+    return int(value) if value == int(value) else value
+
+
+def _scalar(value, is_float):
+    return float(value) if is_float else int(value)
+
+
+class _Section:
+    """Section d'une LevelImage (liste de tuples). Une image lue sur disque garde la section
+    en tableau de doubles, converti en tuples au premier accès seulement."""
+
+    def __init__(self, decode):
+        self.decode = decode
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, image, owner=None):
+        if image is None:
+            return self
+        values = image._raw.pop(self.name, None)
+        if values is not None:
+            image.__dict__[self.name] = self.decode(values)
+        return image.__dict__[self.name]
+
+    def __set__(self, image, value):
+        image._raw.pop(self.name, None)
+        image.__dict__[self.name] = value
+
+
+def _decode_platforms(values):
+    return list(zip(map(int, values[0::3]), map(int, values[1::3]), map(int, values[2::3])))
+
+
+def _decode_enemies(values):
+    return [(x, y, left, right, bool(flags & _ENEMY_1V1), bool(flags & _ENEMY_FLYING))
+            for x, y, left, right, flags in zip(values[0::5], values[1::5], values[2::5],
+                                                 values[3::5], map(int, values[4::5]))]
+
+
+def _decode_collectibles(values):
+    return [(x, y, COLLECT_TYPES[collect_type])
+            for x, y, collect_type in zip(map(int, values[0::3]), map(int, values[1::3]),
+                                          map(int, values[2::3]))]
+
+
+def _decode_checkpoints(values):
+    return list(zip(map(_number, values[0::2]), map(_number, values[1::2])))
+
+
+class LevelImage:
+    """Contenu compilé d'un niveau, en tuples (coordonnées monde) :
+    - platforms : (x, y, largeur)
+    - enemies : (x, y, gauche, droite, is_1v1, flying)
+    - collectibles : (x, y, type)
+    - checkpoints : (x, y)
+    - end_x, level_type, bounds_x (limites du niveau boss, ou None), boss ((x, y) ou None)"""
+
+    platforms = _Section(_decode_platforms)
+    enemies = _Section(_decode_enemies)
+    collectibles = _Section(_decode_collectibles)
+    checkpoints = _Section(_decode_checkpoints)
+
+    def __init__(self, level_type="parkour", end_x=0):
+        self._raw = {}  # Sections lues sur disque pas encore décodées : nom -> array("d")
+        self.level_type = level_type
+        self.platforms = []
+        self.enemies = []
+        self.collectibles = []
+        self.checkpoints = []
+        self.end_x = end_x
+        self.bounds_x = None
+        self.boss = None
+
+    @classmethod
+    def from_level(cls, level):
+        """Image d'un niveau tout juste construit (avant la première mise à jour)"""
+        image = cls(level.level_type, level.end_x)
+        image.platforms = [(p.rect.x, p.rect.y, p.rect.width) for p in level.platforms]
+        for enemy in level.enemies:
+            values = enemy._pool.values(enemy._slot)
+            image.enemies.append((values["x"], values["y"], values["left"], values["right"],
+                                  bool(values["is_1v1"]), bool(values["flying"])))
+        image.collectibles = [(c.rect.x, c.rect.y, c.collect_type) for c in level.collectibles]
+        image.checkpoints = [tuple(checkpoint) for checkpoint in level.checkpoints]
+        image.bounds_x = getattr(level, "bounds_x", None)
+        if level.boss is not None:
+            image.boss = (level.boss.rect.x, level.boss.rect.y)
+        return image
+
+    def to_bytes(self):
+        flags = 0
+        boss_x, boss_y = self.boss if self.boss is not None else (0, 0)
+        bounds = self.bounds_x if self.bounds_x is not None else (0, 0)
+        if self.boss is not None:
+            flags |= _HAS_BOSS
+        if self.bounds_x is not None:
+            flags |= _HAS_BOUNDS
+            if any(isinstance(v, float) for v in bounds):
+                flags |= _BOUNDS_FLOAT
+        if isinstance(self.end_x, float):
+            flags |= _END_X_FLOAT
+        header = _HEADER.pack(_MAGIC, FORMAT_VERSION, len(self.platforms), len(self.enemies),
+                              len(self.collectibles), len(self.checkpoints), flags,
+                              self.level_type.encode("ascii"), self.end_x, boss_x, boss_y,
+                              bounds[0], bounds[1])
+        values = array("d")
+        for platform in self.platforms:
+            values.extend(platform)
+        for x, y, left, right, is_1v1, flying in self.enemies:
+            values.extend((x, y, left, right,
+                           (_ENEMY_FLYING if flying else 0) | (_ENEMY_1V1 if is_1v1 else 0)))
+        for x, y, collect_type in self.collectibles:
+            values.extend((x, y, COLLECT_TYPES.index(collect_type)))
+        for checkpoint in self.checkpoints:
+            values.extend(checkpoint)
+        return header + values.tobytes()
+
+    @classmethod
+    def from_buffer(cls, buffer):
+        """Lit une image (bytes, mmap...) ; ValueError si le format n'est pas reconnu"""
+        if len(buffer) < _HEADER.size:
+            raise ValueError("Niveau compilé tronqué")
+        (magic, version, n_platforms, n_enemies, n_collectibles, n_checkpoints, flags,
+         level_type, end_x, boss_x, boss_y, bound_left, bound_right) = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC or version != FORMAT_VERSION:
+            raise ValueError("Niveau compilé d'un autre format")
+        sizes = (n_platforms * _PLATFORM_VALUES, n_enemies * _ENEMY_VALUES,
+                 n_collectibles * _COLLECTIBLE_VALUES, n_checkpoints * _CHECKPOINT_VALUES)
+        if len(buffer) != _HEADER.size + 8 * sum(sizes):
+            raise ValueError("Niveau compilé tronqué")
+        image = cls(level_type.rstrip(b"\0").decode("ascii"),
+                    _scalar(end_x, flags & _END_X_FLOAT))
+        # Chaque section est copiée d'un bloc hors du fichier projeté, sans créer un objet
+        # Python par valeur : les tuples ne sont construits qu'à l'usage (voir _Section)
+        start = _HEADER.size
+        with memoryview(buffer) as view:
+            for name, size in zip(("platforms", "enemies", "collectibles", "checkpoints"), sizes):
+                values = array("d")
+                with view[start:start + 8 * size] as section:
+                    values.frombytes(section)
+                image._raw[name] = values
+                start += 8 * size
+        if flags & _HAS_BOUNDS:
+            is_float = flags & _BOUNDS_FLOAT
+            image.bounds_x = (_scalar(bound_left, is_float), _scalar(bound_right, is_float))
+        if flags & _HAS_BOSS:
+            image.boss = (int(boss_x), int(boss_y))
+        return image
+
+
+# --- Cache sur disque ------------------------------------------------------
+
+def _hash_sources(digest):
+    """Ajoute au hash le code des niveaux prédéfinis et la configuration (lus une fois)"""
+    global _source_hash
+    if _source_hash is None:
+        sources = hashlib.sha1(str(FORMAT_VERSION).encode())
+        folder = os.path.dirname(os.path.abspath(__file__))
+        for name in _SOURCES:
+            with open(os.path.join(folder, name), "rb") as f:
+                sources.update(f.read())
+        _source_hash = sources.digest()
+    digest.update(_source_hash)
+
+
+def cache_name(level_file=None, level_id=0):
+    """Nom du fichier compilé : source lisible + hash de son contenu. Un fichier texte
+    n'est relu et hashé que s'il a changé (chemin, date de modification, taille)."""
+    if level_file is None:
+        signature = level_id
+    else:
+        path = os.path.abspath(level_file)
+        status = os.stat(path)
+        signature = (path, status.st_mtime_ns, status.st_size)
+    name = _names.get(signature)
+    if name is None:
+        name = _names[signature] = _cache_name(level_file, level_id)
+    return name
+
+
+def _cache_name(level_file, level_id):
+    digest = hashlib.sha1()
+    _hash_sources(digest)
+    if level_file is None:
+        name = f"niveau_{level_id}"
+        digest.update(str(level_id).encode())
+    else:
+        path = os.path.abspath(level_file)
+        stem = os.path.splitext(os.path.basename(path))[0]
+        name = f"{stem}_{hashlib.sha1(path.encode()).hexdigest()[:8]}"
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    return name, digest.hexdigest()[:16]
+
+
+def _path(name, key):
+    return os.path.join(LEVEL_CACHE_DIR, f"{name}-{key}.lvl")
+
+
+def load(level_file=None, level_id=0, name=None):
+    """Image compilée du niveau si elle est en cache et à jour, sinon None
+    (name : résultat de cache_name, s'il vient d'être calculé)"""
+    try:
+        path = _path(*(name or cache_name(level_file, level_id)))
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return LevelImage.from_buffer(mapped)
+    except (OSError, ValueError):
+        return None
+
+
+def store(image, level_file=None, level_id=0, name=None):
+    """Écrit l'image compilée (remplace celle d'une ancienne version de la source).
+    Un dossier de cache impossible à écrire n'empêche pas de jouer : rien n'est écrit."""
+    temporary = None
+    try:
+        name, key = name or cache_name(level_file, level_id)
+        os.makedirs(LEVEL_CACHE_DIR, exist_ok=True)
+        path = _path(name, key)
+        # Nom temporaire propre au thread : un préchargement peut compiler en même temps
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, "wb") as f:
+            f.write(image.to_bytes())
+        os.replace(temporary, path)
+    except OSError:
+        if temporary is not None:
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+        return None
+    # L'image est écrite : une ancienne version impossible à supprimer (encore ouverte,
+    # déjà retirée par un autre processus) est simplement laissée
+    try:
+        entries = os.listdir(LEVEL_CACHE_DIR)
+    except OSError:
+        entries = []
+    for entry in entries:
+        if entry.startswith(name + "-") and entry.endswith(".lvl") and entry != os.path.basename(path):
+            try:
+                os.remove(os.path.join(LEVEL_CACHE_DIR, entry))
+            except OSError:
+                pass
+    return path
+
+
+def precompile(level_files=(), level_ids=range(5)):
+    """(Re)compile les niveaux prédéfinis et les fichiers donnés ; retourne [(source, chemin)]"""
+    from level import Level
+    compiled = []
+    sources = [(None, level_id) for level_id in level_ids] + [(path, 0) for path in level_files]
+    for level_file, level_id in sources:
+        path = store(Level.compile(level_file, level_id), level_file, level_id)
+        compiled.append((level_file or f"niveau {level_id}", path))
+    return compiled
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Précompile les niveaux de Cyber Jump")
+    parser.add_argument("files", nargs="*", help="niveaux en fichier texte à compiler aussi")
+    args = parser.parse_args(argv)
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    missing = [path for path in args.files if not os.path.exists(path)]
+    if missing:
+        print(f"Fichier introuvable : {', '.join(missing)}")
+        return 1
+    for source, path in precompile(args.files):
+        print(f"{source} -> {path or 'non écrit (dossier de cache inaccessible)'}")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
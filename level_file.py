@@ -0,0 +1,85 @@
+"""
+Format texte des niveaux : une ligne du fichier = une rangée de cellules
+'1' = plateforme, '0' = vide, 'E' = ennemi, 'C' = collectible, 'F' = fin du niveau
+('P' et les autres caractères sont ignorés).
+Le fichier est lu en flux, rangée par rangée : les suites de '1' d'une rangée
+deviennent directement une plateforme, et les ennemis d'une rangée sont posés
+sur la plateforme de la rangée suivante dès qu'elle est lue (index des suites
+de la rangée par bisect). Le coût est linéaire en nombre de cellules, quelle
+que soit la longueur des rangées (niveaux de course de 100 000 colonnes et plus).
+"""
+from bisect import bisect_right
+import re
+from config import *
+
+# Suites de plateformes et cellules utiles ; les '0' sont sautés par la regex
+_CELLS = re.compile(r"1+|[ECF]")
+
+
+class LevelData:
+    """Contenu d'un fichier de niveau, en tuples (coordonnées monde) :
+    - platforms : (x, y, largeur), dans l'ordre de lecture
+    - enemies : (x, y, gauche, droite) : position et zone de patrouille
+    - collectibles : (x, y)
+    - end_x : position de la fin du niveau (None si le fichier n'a pas de 'F')"""
+
+    def __init__(self):
+        self.platforms = []
+        self.enemies = []
+        self.collectibles = []
+        self.end_x = None
+        self.rows = 0
+        self.columns = 0
+
+
+def _land_enemies(columns, row_y, lefts, rights, enemies, cell_size):
+    """Pose les ennemis de la rangée du dessus sur les suites de la rangée row_y
+    (sans plateforme dessous : l'ennemi reste dans sa cellule et patrouille sur sa largeur)"""
+    for px in columns:
+        i = bisect_right(lefts, px) - 1
+        if i >= 0 and px < rights[i]:
+            enemies.append((px, row_y - ENEMY_HEIGHT, lefts[i], rights[i]))
+        else:
+            enemies.append((px, row_y - cell_size, px, px + cell_size))
+
+
+def parse_level(lines, cell_size=LEVEL_CELL_SIZE):
+    """Lit les rangées d'un niveau (fichier ouvert ou liste de lignes) et retourne un LevelData"""
+    data = LevelData()
+    platforms = data.platforms
+    collectibles = data.collectibles
+    pending = []  # Colonnes (px) des ennemis de la rangée précédente
+    py = 0
+    for row, line in enumerate(lines):
+        line = line.strip()
+        py = row * cell_size
+        data.rows = row + 1
+        data.columns = max(data.columns, len(line))
+        lefts = []   # Suites de '1' de la rangée, triées par x
+        rights = []
+        enemy_columns = []
+        for match in _CELLS.finditer(line):
+            cell = match.group()
+            px = match.start() * cell_size
+            if cell[0] == '1':
+                width = len(cell) * cell_size
+                platforms.append((px, py, width))
+                lefts.append(px)
+                rights.append(px + width)
+            elif cell == 'E':
+                enemy_columns.append(px)
+            elif cell == 'C':
+                collectibles.append((px, py))
+            else:
+                data.end_x = px
+        _land_enemies(pending, py, lefts, rights, data.enemies, cell_size)
+        pending = enemy_columns
+    # Ennemis de la dernière rangée : aucune plateforme dessous
+    _land_enemies(pending, py + cell_size, [], [], data.enemies, cell_size)
+    return data
+
+
+def load_level_file(filename, cell_size=LEVEL_CELL_SIZE):
+    """Lit un fichier de niveau en flux (FileNotFoundError s'il n'existe pas)"""
+    with open(filename, 'r') as f:
+        return parse_level(f, cell_size)
@@ -0,0 +1,296 @@
+"""
+Générateur procédural de niveaux (format texte, voir level_file.py)
+Les sauts sont calculés avec la physique du joueur (PLAYER_JUMP_STRENGTH, GRAVITY,
+MAX_FALL_SPEED, PLAYER_SPEED freiné par FRICTION, double saut) tick par tick,
+arrondis compris : chaque écart entre deux plateformes est choisi dans la portée
+réelle d'un saut ou d'un double saut, puis le niveau relu par parse_level est
+revalidé. Même graine + même difficulté = même niveau.
+Usage :
+    python level_generator.py -o course.txt                  # un niveau (graine aléatoire)
+    python level_generator.py --seed 42 --difficulty difficile -o course.txt
+    python level_generator.py --batch 5000 --out tournoi     # lot, sur tous les cœurs
+    python level_generator.py --check course.txt tournoi/*.txt
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+# config importe pygame : pas de bannière dans chaque processus de travail du lot
+# (relancés avec « spawn » sous Windows, qui réimportent ce module)
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from config import *
+from level_file import load_level_file, parse_level
+
+# Réglages de difficulté (écarts et hauteurs en cellules de LEVEL_CELL_SIZE) :
+# - reach : part de la portée maximale d'un saut utilisée pour les écarts (1.0 = au pixel près)
+# - widths : largeur des plateformes (min, max)
+# - climb / drop : montée / descente maximale d'une plateforme à la suivante
+# - enemies / stars : probabilité d'un ennemi / d'une étoile sur une plateforme
+DIFFICULTIES = {
+    "facile": {"reach": 0.55, "widths": (4, 8), "climb": 2, "drop": 3, "enemies": 0.15, "stars": 0.8},
+    "moyen": {"reach": 0.75, "widths": (3, 6), "climb": 3, "drop": 4, "enemies": 0.3, "stars": 0.6},
+    "difficile": {"reach": 0.9, "widths": (1, 4), "climb": 5, "drop": 5, "enemies": 0.5, "stars": 0.5},
+}
+DEFAULT_COLUMNS = 90  # 3600 px, la longueur des niveaux prédéfinis
+BATCH_ROUNDS = 10     # Lots : tours de remplacement des graines rejetées au plus
+
+ROWS = SCREEN_HEIGHT // LEVEL_CELL_SIZE
+TOP_ROW = 4             # Plateforme la plus haute (place pour sauter au-dessus)
+BOTTOM_ROW = ROWS - 2   # Plateforme la plus basse (au-dessus du vide mortel)
+START_ROW = ROWS - 5
+START_WIDTH = 5         # Le joueur apparaît en (50, 100) et tombe sur la plateforme de départ
+END_WIDTH = 4           # Plateforme d'arrivée (au moins), précédée d'un écart de END_GAP
+END_GAP = 2
+
+# Déplacement horizontal par tick, touche maintenue (vitesse de base, sans étoiles)
+RUN_SPEED = int(PLAYER_SPEED * FRICTION)
+# Le joueur doit avoir au moins la moitié du corps sur la plateforme d'arrivée
+LANDING_OVERLAP = PLAYER_WIDTH // 2
+
+
+# --- Physique des sauts ------------------------------------------------------
+
+def jump_heights(second_jump=None, max_drop=SCREEN_HEIGHT):
+    """Hauteur des pieds (px au-dessus du point de départ) après chaque tick d'un saut,
+    comme Player.update : vitesse + gravité, chute plafonnée, position arrondie par int().
+    second_jump : tick du double saut (None = saut simple). S'arrête max_drop px plus bas."""
+    velocity_y = PLAYER_JUMP_STRENGTH
+    y = 0
+    heights = []
+    tick = 0
+    while y <= max_drop:
+        tick += 1
+        if tick == second_jump:
+            velocity_y = PLAYER_JUMP_STRENGTH
+        velocity_y = min(velocity_y + GRAVITY, MAX_FALL_SPEED)
+        y += int(velocity_y)
+        heights.append(-y)
+    return heights
+
+
+_TRAJECTORIES = None
+_reach_cache = {}
+
+
+def _trajectories():
+    """Saut simple et double sauts à chaque tick possible de la montée et de la chute"""
+    global _TRAJECTORIES
+    if _TRAJECTORIES is None:
+        single = jump_heights()
+        _TRAJECTORIES = [single] + [jump_heights(tick) for tick in range(2, len(single))]
+    return _TRAJECTORIES
+
+
+def max_gap(rise):
+    """Écart horizontal maximal (px, entre le bord droit d'une plateforme et le bord gauche
+    de la suivante) franchissable pour une arrivée rise px plus haut (négatif = plus bas) ;
+    -1 si aucune arrivée n'est possible. Le joueur part du bord, court pendant tout le saut
+    et ne dépasse le bord de l'arrivée qu'une fois ses pieds au-dessus (sinon il s'y cogne)."""
+    gap = _reach_cache.get(rise)
+    if gap is None:
+        gap = -1
+        for heights in _trajectories():
+            previous = 0
+            for tick, height in enumerate(heights, 1):
+                if height <= rise < previous:
+                    # Arrivée : les pieds passent le dessus de la plateforme en descendant
+                    gap = max(gap, tick * RUN_SPEED - LANDING_OVERLAP)
+                    break
+                previous = height
+        _reach_cache[rise] = gap
+    return gap
+
+
+def can_jump(gap, rise):
+    """L'écart (px) vers une plateforme rise px plus haut est-il franchissable ?"""
+    return 0 <= gap <= max_gap(rise)
+
+
+# --- Génération ---------------------------------------------------------------
+
+def generate_level(seed, difficulty="moyen", columns=DEFAULT_COLUMNS, **knobs):
+    """Rangées d'un niveau (chaînes du format texte). knobs remplace des réglages du
+    niveau de difficulté (reach, widths, climb, drop, enemies, stars).
+    ValueError si la difficulté ou un réglage est inconnu, ou si les réglages ne laissent
+    aucun saut possible."""
+    if difficulty not in DIFFICULTIES:
+        raise ValueError(f"Difficulté inconnue : {difficulty}")
+    unknown = sorted(set(knobs) - set(DIFFICULTIES[difficulty]))
+    if unknown:
+        raise ValueError(f"Réglage inconnu : {', '.join(unknown)}")
+    settings = dict(DIFFICULTIES[difficulty], **knobs)
+    if columns < START_WIDTH + END_GAP + END_WIDTH:
+        raise ValueError(f"Niveau trop court : {columns} colonnes")
+    rng = random.Random(seed)
+    cell = LEVEL_CELL_SIZE
+    grid = [["0"] * columns for _ in range(ROWS)]
+    min_width, max_width = settings["widths"]
+
+    def place(left, row, width):
+        for column in range(left, left + width):
+            grid[row][column] = "1"
+
+    place(0, START_ROW, START_WIDTH)
+    left, row, width = 0, START_ROW, START_WIDTH
+    while True:
+        # Prochaine plateforme : hauteur dans les limites, puis écart dans la portée à cette hauteur
+        rises = [r for r in range(-settings["drop"], settings["climb"] + 1)
+                 if TOP_ROW <= row - r <= BOTTOM_ROW and max_gap(r * cell) * settings["reach"] >= cell]
+        if not rises:
+            raise ValueError(f"Aucun saut possible d'une cellule au moins avec reach={settings['reach']}, "
+                             f"climb={settings['climb']}, drop={settings['drop']}")
+        rise = rng.choice(rises)
+        gap = rng.randint(1, int(max_gap(rise * cell) * settings["reach"]) // cell)
+        next_left = left + width + gap
+        next_width = rng.randint(min_width, max_width)
+        if next_left + next_width + END_GAP + END_WIDTH > columns:
+            break
+        row -= rise
+        left, width = next_left, next_width
+        place(left, row, width)
+        if width >= 3 and rng.random() < settings["enemies"]:
+            grid[row - 1][rng.randrange(left + 1, left + width)] = "E"
+        if rng.random() < settings["stars"]:
+            free = [c for c in range(left, left + width) if grid[row - 1][c] == "0"]
+            if free:
+                grid[row - 1][rng.choice(free)] = "C"
+
+    # Plateforme d'arrivée (jusqu'au bout), drapeau au milieu
+    rise = rng.choice([r for r in (-1, 0, 1) if TOP_ROW <= row - r <= BOTTOM_ROW])
+    left, row = left + width + END_GAP, row - rise
+    width = columns - left
+    place(left, row, width)
+    grid[row - 1][left + width // 2] = "F"
+    return ["".join(cells) for cells in grid]
+
+
+def validate(data):
+    """Problèmes d'un niveau généré (LevelData, voir level_file.py) ; liste vide = jouable :
+    départ sous le point d'apparition, plateformes l'une après l'autre en x, chaque écart
+    franchissable en sautant, drapeau posé sur la dernière plateforme"""
+    problems = []
+    platforms = sorted(data.platforms)
+    if not platforms or not platforms[0][0] <= 50 < platforms[0][0] + platforms[0][2] - PLAYER_WIDTH:
+        return ["pas de plateforme de départ sous le joueur"]
+    for (x, y, width), (next_x, next_y, next_width) in zip(platforms, platforms[1:]):
+        gap = next_x - (x + width)
+        if gap < 0:
+            problems.append(f"plateformes superposées en x={next_x}")
+        elif not can_jump(gap, y - next_y):
+            problems.append(f"saut impossible de x={x + width} vers x={next_x} "
+                            f"({gap} px, {y - next_y:+d} px)")
+    problems += [f"plateforme hors de l'écran en x={x}" for x, y, width in platforms
+                 if y + PLATFORM_HEIGHT >= SCREEN_HEIGHT]
+    last_x, last_y, last_width = platforms[-1]
+    if data.end_x is None:
+        problems.append("pas de fin de niveau ('F')")
+    elif not last_x <= data.end_x < last_x + last_width:
+        problems.append(f"fin du niveau hors de la dernière plateforme (x={data.end_x})")
+    return problems
+
+
+def write_level(rows, path):
+    with open(path, "w") as f:
+        f.write("\n".join(rows) + "\n")
+
+
+# --- Lots ---------------------------------------------------------------------
+
+def _generate_file(job):
+    """Un niveau du lot (dans un processus de travail) : généré, relu, validé, écrit"""
+    level_seed, difficulty, columns, folder = job
+    rows = generate_level(level_seed, difficulty, columns)
+    problems = validate(parse_level(rows))
+    path = os.path.join(folder, f"niveau_{difficulty}_{level_seed}.txt")
+    if not problems:
+        write_level(rows, path)
+    return path, problems
+
+
+def generate_batch(count, folder, difficulty="moyen", seed=0, columns=DEFAULT_COLUMNS, workers=None):
+    """Génère et valide count niveaux dans folder, répartis sur workers processus (tous les
+    cœurs par défaut). Graines seed, seed+1, ... : une graine rejetée est remplacée par la
+    suivante encore inutilisée, jusqu'à count niveaux écrits (BATCH_ROUNDS tours au plus).
+    Retourne (écrits, [(chemin, problèmes)] des graines rejetées)."""
+    os.makedirs(folder, exist_ok=True)
+    written, rejected = [], []
+    workers = workers or os.cpu_count() or 1
+    pool = multiprocessing.Pool(workers) if workers > 1 else None
+    next_seed = seed
+    try:
+        for _ in range(BATCH_ROUNDS):
+            missing = count - len(written)
+            if missing <= 0:
+                break
+            jobs = [(level_seed, difficulty, columns, folder)
+                    for level_seed in range(next_seed, next_seed + missing)]
+            next_seed += missing
+            if pool is None:
+                results = map(_generate_file, jobs)
+            else:
+                results = pool.imap_unordered(_generate_file, jobs,
+                                              chunksize=max(1, missing // (workers * 8)))
+            for path, problems in results:
+                if problems:
+                    rejected.append((path, problems))
+                else:
+                    written.append(path)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return written, rejected
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Génère des niveaux jouables pour Cyber Jump")
+    parser.add_argument("--seed", type=int, help="graine (aléatoire par défaut ; premier niveau du lot)")
+    parser.add_argument("--difficulty", choices=sorted(DIFFICULTIES), default="moyen")
+    parser.add_argument("--columns", type=int, default=DEFAULT_COLUMNS, help="longueur en cellules")
+    parser.add_argument("-o", "--output", default="niveau_genere.txt", help="fichier du niveau")
+    parser.add_argument("--batch", type=int, help="nombre de niveaux à générer dans --out")
+    parser.add_argument("--out", default="niveaux_generes", help="dossier du lot")
+    parser.add_argument("--workers", type=int, help="processus du lot (tous les cœurs par défaut)")
+    parser.add_argument("--check", nargs="+", metavar="FICHIER", help="valide des niveaux existants")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        failed = 0
+        for path in args.check:
+            problems = validate(load_level_file(path))
+            failed += bool(problems)
+            print(f"{path} : {'; '.join(problems) if problems else 'OK'}")
+        return 1 if failed else 0
+
+    seed = args.seed if args.seed is not None else random.randrange(1 << 31)
+    if args.batch:
+        start = time.perf_counter()
+        written, rejected = generate_batch(args.batch, args.out, args.difficulty, seed,
+                                           args.columns, args.workers)
+        elapsed = time.perf_counter() - start
+        last_seed = seed + len(written) + len(rejected) - 1
+        print(f"{len(written)} niveaux écrits dans {args.out}/ (graines {seed} à {last_seed}) "
+              f"en {elapsed:.1f} s, {len(rejected)} graines rejetées (remplacées par les suivantes)")
+        for path, problems in rejected:
+            print(f"  {path} : {'; '.join(problems)}")
+        if len(written) < args.batch:
+            print(f"{args.batch - len(written)} niveaux manquants après {BATCH_ROUNDS} tours de remplacement")
+            return 1
+        return 0
+
+    rows = generate_level(seed, args.difficulty, args.columns)
+    problems = validate(parse_level(rows))
+    if problems:
+        print(f"Niveau rejeté (graine {seed}) : {'; '.join(problems)}")
+        return 1
+    write_level(rows, args.output)
+    print(f"{args.output} : niveau {args.difficulty}, graine {seed}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
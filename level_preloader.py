@@ -0,0 +1,98 @@
+"""
+Préchargement du prochain niveau dans un thread
+Le prochain niveau est connu à l'avance (manche suivante, niveau suivant en solo) :
+request() le construit en arrière-plan pendant l'intro de manche, les récompenses
+ou le mini-jeu ; take() le remet au jeu d'un seul coup quand la course démarre.
+Si sa construction est encore en cours, take() l'attend (elle a déjà avancé) au
+lieu d'en lancer une seconde. Si un autre niveau est demandé (ou si la construction
+a échoué), take() remet à zéro le niveau en cours quand c'est le même (nouvel essai,
+voir Level.reset), sinon le construit tout de suite, comme avant. Dans tous les cas,
+le temps passé dans take() sur le thread principal (l'accroc au changement de
+niveau) est compté dans stats.
+Le thread ne fait que construire les données du niveau : les colonnes du décor sont
+rendues au premier dessin, sur le thread principal (pygame.font et le cache de textes
+ne sont pas sûrs entre threads).
+"""
+import threading
+import time
+from level import Level
+
+
+class _Request:
+    """Construction demandée en arrière-plan"""
+
+    def __init__(self, key):
+        self.key = key                   # (level_file, level_id)
+        self.level = None                # Niveau construit
+        self.error = None                # Exception levée par la construction
+        self.done = threading.Event()    # Levé quand la construction est finie (ou a échoué)
+
+
+class LevelPreloader:
+    def __init__(self, build=Level):
+        self.build = build           # build(level_file=..., level_id=...) -> Level
+        self._lock = threading.Lock()
+        self._request = None         # Demande en cours (_Request)
+        # Changements de niveau : nombre, dont préchargés (attendus compris) / attendus /
+        # remis à zéro, accroc cumulé / max / dernier (ms)
+        self.stats = {"handovers": 0, "preloaded": 0, "waited": 0, "reused": 0,
+                      "total_ms": 0.0, "max_ms": 0.0, "last_ms": 0.0}
+
+    def request(self, level_id, level_file=None):
+        """Lance la construction du niveau en arrière-plan (rien à faire s'il est déjà demandé)"""
+        key = (level_file, level_id)
+        with self._lock:
+            if self._request is not None and self._request.key == key:
+                return
+            request = self._request = _Request(key)
+        worker = threading.Thread(target=self._run, args=(request,), name="level-preload", daemon=True)
+        worker.start()
+
+    def _run(self, request):
+        level_file, level_id = request.key
+        try:
+            request.level = self.build(level_file=level_file, level_id=level_id)
+        except Exception as error:
+            request.error = error  # Signalée par take(), qui reconstruit sur le thread principal
+        finally:
+            request.done.set()
+
+    def ready(self, level_id, level_file=None):
+        """Le niveau demandé est-il construit ?"""
+        with self._lock:
+            request = self._request
+            return (request is not None and request.key == (level_file, level_id)
+                    and request.level is not None)
+
+    def take(self, level_id, level_file=None, current=None):
+        """Retourne le niveau : préchargé (attendu si sa construction est en cours), sinon
+        current remis à zéro si c'est le même niveau, sinon construit maintenant"""
+        start = time.perf_counter()
+        level = None
+        waited = False
+        with self._lock:
+            request, self._request = self._request, None
+        if request is not None and request.key == (level_file, level_id):
+            waited = not request.done.is_set()
+            request.done.wait()
+            level = request.level
+            if request.error is not None:
+                print(f"[WARN] Préchargement du niveau {level_id} impossible : {request.error!r}")
+        preloaded = level is not None
+        reused = (not preloaded and current is not None
+                  and (current.level_file, current.level_id) == (level_file, level_id))
+        if reused:
+            current.reset()
+            level = current
+        elif not preloaded:
+            level = self.build(level_file=level_file, level_id=level_id)
+        elapsed = (time.perf_counter() - start) * 1000
+        stats = self.stats
+        stats["handovers"] += 1
+        stats["preloaded"] += preloaded
+        stats["waited"] += preloaded and waited
+        stats["reused"] += reused
+        stats["total_ms"] += elapsed
+        stats["max_ms"] = max(stats["max_ms"], elapsed)
+        stats["last_ms"] = elapsed
+        return level
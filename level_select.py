@@ -3,6 +3,7 @@ Menu de sélection de niveaux
 """
 import pygame
 from config import *
+from render_cache import get_font
 
 class LevelSelectMenu:
     def __init__(self, screen):
@@ -13,9 +14,9 @@ class LevelSelectMenu:
             {"name": "1v1 Combat", "type": "1v1", "description": "Course contre un ennemi"},
             {"name": "Parcours 2", "type": "parkour", "description": "Défi de précision"}
         ]
-        self.font_title = pygame.font.Font(None, 72)
-        self.font_option = pygame.font.Font(None, 48)
-        self.font_small = pygame.font.Font(None, 32)
+        self.font_title = get_font(72)
+        self.font_option = get_font(48)
+        self.font_small = get_font(32)
     
     def handle_event(self, event):
         """Gère les événements du menu de sélection"""
@@ -3,15 +3,16 @@ Gestion du menu principal
 """
 import pygame
 from config import *
+from render_cache import draw_gradient, get_font
 
 class Menu:
     def __init__(self, screen):
         self.screen = screen
         self.selected_option = 0
         self.options = ["Jouer", "Nouvelle partie", "Mode Compétitif", "Scores", "Paramètres", "Quitter"]
-        self.font_title = pygame.font.Font(None, 72)
-        self.font_option = pygame.font.Font(None, 48)
-        self.font_small = pygame.font.Font(None, 32)
+        self.font_title = get_font(72)
+        self.font_option = get_font(48)
+        self.font_small = get_font(32)
     
     def handle_event(self, event):
         """Gère les événements du menu"""
@@ -27,13 +28,7 @@ class Menu:
     def draw(self):
         """Dessine le menu avec fond coloré moderne"""
         # Fond dégradé violet/bleu nuit moderne
-        from config import GRADIENT_START, GRADIENT_END
-        for y in range(SCREEN_HEIGHT):
-            ratio = y / SCREEN_HEIGHT
-            r = int(GRADIENT_START[0] * (1 - ratio) + GRADIENT_END[0] * ratio)
-            g = int(GRADIENT_START[1] * (1 - ratio) + GRADIENT_END[1] * ratio)
-            b = int(GRADIENT_START[2] * (1 - ratio) + GRADIENT_END[2] * ratio)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        draw_gradient(self.screen)
         
         # Ajouter quelques nuages décoratifs
         for i in range(3):
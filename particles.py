@@ -0,0 +1,231 @@
+"""
+Moteur de particules commun (collecte d'étoiles, bulles, confettis, explosion du boss)
+Avec NumPy, les particules sont rangées en colonnes (x, y, vx, vy, taille, vie,
+couleur) dans des tableaux de capacité fixe : l'intégration se fait en un seul
+passage sur les tableaux, et une particule morte est remplacée par la dernière
+vivante (swap-remove) au lieu d'être retirée d'une liste.
+Sans NumPy, chaque particule reste une petite liste [x, y, vx, vy, taille, vie,
+couleur] et les survivantes sont recopiées dans une nouvelle liste à chaque frame
+(en pur Python, plus rapide que les colonnes array indexées une à une).
+"""
+import math
+import random
+import pygame
+from config import *
+from effect_pool import effect_pool
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+FIELDS = ("x", "y", "vx", "vy", "size", "life", "color")
+
+# Formes de dessin
+SQUARE = "square"   # Carré plein de côté 2*taille (alpha de surface)
+BUBBLE = "bubble"   # Disque semi-transparent + contour blanc
+CIRCLE = "circle"   # Disque opaque
+
+
+class ParticleSystem:
+    """Ensemble de particules de même comportement.
+    - gravity : ajoutée à vy à chaque frame (négative = les particules montent)
+    - growth : ajoutée à la taille à chaque frame (min_size en plancher)
+    - drag : vx et vy multipliées à chaque frame (1 = pas de freinage)
+    - fade_frames : l'alpha vaut 255 * vie / fade_frames (plafonné), sinon alpha fixe
+    - kill_below : une particule plus bas que cette ordonnée disparaît
+    Une vie négative (None à l'émission) signifie « immortelle »."""
+
+    def __init__(self, capacity, shape=SQUARE, gravity=0.0, growth=0.0, min_size=1.0,
+                 drag=1.0, fade_frames=None, alpha=255, kill_below=None, use_numpy=HAS_NUMPY):
+        self.capacity = capacity
+        self.shape = shape
+        self.gravity = gravity
+        self.growth = growth
+        self.min_size = min_size
+        self.drag = drag
+        self.fade_frames = fade_frames
+        self.alpha = alpha
+        self.kill_below = kill_below
+        self.use_numpy = use_numpy
+        self.count = 0
+        self.palette = []          # Index de couleur -> (r, g, b)
+        self._color_index = {}
+        if use_numpy:
+            self._data = {name: np.zeros(capacity, dtype=np.float64) for name in FIELDS}
+        else:
+            self._particles = []   # Une liste [x, y, vx, vy, taille, vie, couleur] par particule
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+        if not self.use_numpy:
+            self._particles.clear()
+
+    def _palette_index(self, color):
+        color = tuple(color[:3])
+        index = self._color_index.get(color)
+        if index is None:
+            index = len(self.palette)
+            self.palette.append(color)
+            self._color_index[color] = index
+        return index
+
+    def emit(self, x, y, vx, vy, size, life=None, color=WHITE):
+        """Ajoute une particule (ignorée si le pool est plein)"""
+        if self.count >= self.capacity:
+            return False
+        if not self.use_numpy:
+            self._particles.append([x, y, vx, vy, size, -1 if life is None else life,
+                                    self._palette_index(color)])
+            self.count += 1
+            return True
+        i = self.count
+        data = self._data
+        data["x"][i] = x
+        data["y"][i] = y
+        data["vx"][i] = vx
+        data["vy"][i] = vy
+        data["size"][i] = size
+        data["life"][i] = -1 if life is None else life
+        data["color"][i] = self._palette_index(color)
+        self.count += 1
+        return True
+
+    # --- Intégration -------------------------------------------------------
+
+    def update(self):
+        """Avance toutes les particules d'une frame puis retire les mortes"""
+        if self.count == 0:
+            return
+        if self.use_numpy:
+            self._update_numpy()
+        else:
+            self._update_objects()
+
+    def _update_numpy(self):
+        n = self.count
+        d = {name: column[:n] for name, column in self._data.items()}
+        d["x"] += d["vx"]
+        d["y"] += d["vy"]
+        d["vy"] += self.gravity
+        if self.drag != 1.0:
+            d["vx"] *= self.drag
+            d["vy"] *= self.drag
+        if self.growth:
+            np.maximum(d["size"] + self.growth, self.min_size, out=d["size"])
+        mortal = d["life"] > 0
+        d["life"][mortal] -= 1
+        dead = mortal & (d["life"] <= 0)
+        if self.kill_below is not None:
+            dead |= d["y"] > self.kill_below
+        dead_count = int(np.count_nonzero(dead))
+        if dead_count == 0:
+            return
+        # Swap-remove par lot : les trous avant la nouvelle fin reçoivent les
+        # particules vivantes situées après
+        alive = n - dead_count
+        holes = np.flatnonzero(dead[:alive])
+        if len(holes):
+            fillers = alive + np.flatnonzero(~dead[alive:])
+            for column in self._data.values():
+                column[holes] = column[fillers]
+        self.count = alive
+
+    def _update_objects(self):
+        gravity, growth, min_size, drag = self.gravity, self.growth, self.min_size, self.drag
+        kill_below = self.kill_below
+        alive = []
+        for p in self._particles:
+            p[0] += p[2]
+            p[1] += p[3]
+            p[3] += gravity
+            if drag != 1.0:
+                p[2] *= drag
+                p[3] *= drag
+            if growth:
+                size = p[4] + growth
+                p[4] = size if size > min_size else min_size
+            if p[5] > 0:
+                p[5] -= 1
+                if p[5] <= 0:
+                    continue
+            if kill_below is not None and p[1] > kill_below:
+                continue
+            alive.append(p)
+        self._particles = alive
+        self.count = len(alive)
+
+    # --- Dessin ------------------------------------------------------------
+
+    def __iter__(self):
+        """(x, y, taille, vie, couleur) de chaque particule vivante"""
+        palette = self.palette
+        if not self.use_numpy:
+            for x, y, vx, vy, size, life, color in self._particles:
+                yield x, y, size, life, palette[color]
+            return
+        data = self._data
+        n = self.count
+        columns = [data[name][:n].tolist() for name in ("x", "y", "size", "life", "color")]
+        for x, y, size, life, color in zip(*columns):
+            yield x, y, size, life, palette[int(color)]
+
+    def draw(self, screen, camera_x=0, camera_y=0):
+        """Dessine les particules (coordonnées monde - caméra)"""
+        for x, y, size, life, color in self:
+            x -= camera_x
+            y -= camera_y
+            if self.fade_frames:
+                alpha = min(255, int(255 * life / self.fade_frames))
+            else:
+                alpha = self.alpha
+            if self.shape == SQUARE:
+                surface = effect_pool.fill((size * 2, size * 2), color, alpha)
+                screen.blit(surface, (int(x - size), int(y - size)))
+            elif self.shape == BUBBLE:
+                screen.blit(effect_pool.disc(size, color, alpha), (int(x - size), int(y - size)))
+                pygame.draw.circle(screen, (255, 255, 255, alpha), (int(x), int(y)), int(size), 1)
+            else:
+                pygame.draw.circle(screen, color, (int(x), int(y)), int(size))
+
+
+# ---------------------------------------------------------------------------
+# Émetteurs des différents effets
+# ---------------------------------------------------------------------------
+
+def emit_collect_burst(system, center_x, center_y, colors, count=16):
+    """Éclats d'une étoile ramassée"""
+    for _ in range(count):
+        angle = random.uniform(0, 2 * math.pi)
+        speed = random.uniform(2, 6)
+        system.emit(center_x, center_y, math.cos(angle) * speed, math.sin(angle) * speed - 4,
+                    random.randint(4, 10), random.randint(15, 25), random.choice(colors))
+
+
+def emit_bubble(system, center_x, center_y):
+    """Une bulle autour du joueur"""
+    angle = random.uniform(0, 2 * math.pi)
+    speed = random.uniform(1, 2)
+    system.emit(center_x + random.randint(-20, 20), center_y + random.randint(-20, 20),
+                math.cos(angle) * speed, -random.uniform(2, 4),
+                random.randint(5, 12), random.randint(30, 60), (200, 230, 255))
+
+
+def emit_confetti(system, colors, count=80):
+    """Confettis tombant du haut de l'écran (taille = demi-côté du carré)"""
+    for _ in range(count):
+        system.emit(random.randint(0, SCREEN_WIDTH), random.randint(-SCREEN_HEIGHT, 0),
+                    random.uniform(-3, 3), random.uniform(2, 8),
+                    random.randint(4, 12) / 2, None, random.choice(colors))
+
+
+def emit_explosion(system, center_x, center_y, count=30):
+    """Éclats d'explosion projetés en anneau autour du centre"""
+    for i in range(count):
+        angle = (i + random.random()) / count * 2 * math.pi
+        speed = random.uniform(4, 8)
+        system.emit(center_x, center_y, math.cos(angle) * speed, math.sin(angle) * speed,
+                    random.randint(3, 8), random.randint(40, 70), random.choice([RED, ORANGE, YELLOW]))
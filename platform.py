@@ -8,21 +8,24 @@ class Platform:
     def __init__(self, x, y, width):
         self.rect = pygame.Rect(x, y, width, PLATFORM_HEIGHT)
         
-    def draw(self, screen):
+    def draw(self, screen, camera_x=0):
         """Dessine la plateforme style pixel art orange/vert"""
+        rect = self.rect.move(-camera_x, 0)
         # Corps principal orange
-        pygame.draw.rect(screen, ORANGE, self.rect)
-        pygame.draw.rect(screen, BLACK, self.rect, 2)
+        pygame.draw.rect(screen, ORANGE, rect)
+        pygame.draw.rect(screen, BLACK, rect, 2)
         
         # Sommet vert (comme dans l'image)
         top_height = 4
-        top_rect = pygame.Rect(self.rect.x, self.rect.y, self.rect.width, top_height)
+        top_rect = pygame.Rect(rect.x, rect.y, rect.width, top_height)
         pygame.draw.rect(screen, PLATFORM_GREEN, top_rect)
         pygame.draw.rect(screen, BLACK, top_rect, 1)
         
-        # Détails pixel art (petits carrés pour texture)
-        for i in range(0, self.rect.width, 8):
-            if i % 16 == 0:
-                detail_rect = pygame.Rect(self.rect.x + i, self.rect.y + top_height + 2, 4, 2)
-                pygame.draw.rect(screen, (200, 100, 0), detail_rect)
+        # Détails pixel art (petits carrés pour texture), seulement la partie visible
+        view_w = screen.get_width()
+        first = max(0, -rect.x // 16 * 16)
+        last = min(rect.width, view_w - rect.x)
+        for i in range(first, last, 16):
+            detail_rect = pygame.Rect(rect.x + i, rect.y + top_height + 2, 4, 2)
+            pygame.draw.rect(screen, (200, 100, 0), detail_rect)
 
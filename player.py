@@ -2,11 +2,19 @@
 Classe du joueur (Robot Cyber)
 """
 import pygame
+import math
 from config import *
+from particles import ParticleSystem, BUBBLE, emit_bubble
+from sprite_cache import SpriteCache, bake_aura
+from timestep import interpolate
+
+# Marge autour du sprite (antennes et flèche de double saut dépassent du rect)
+SPRITE_PADDING = 16
 
 class Player:
     def __init__(self, x, y, player_id=1):
         self.rect = pygame.Rect(x, y, PLAYER_WIDTH, PLAYER_HEIGHT)
+        self.prev_x, self.prev_y = x, y  # Position au tick précédent (interpolation du dessin)
         self.velocity_x = 0
         self.velocity_y = 0
         self.on_ground = False
@@ -16,14 +24,16 @@ class Player:
         self.jump_count = 0
         self.max_jumps = 2
         self.last_checkpoint = (x, y)  # Point de respawn
-        self.checkpoints_reached = []   # Indices des checkpoints franchis
+        self.checkpoints_reached = 0    # Checkpoints franchis (bit i = checkpoint i du niveau)
         self.stars_collected = 0        # Étoiles collectées (tous les 5 = +vitesse)
         self.jump_bonus_timer = 0      # Timer pour le bonus de saut (15 secondes = 900 frames)
         self.ground_shield_timer = 0   # Timer pour le bouclier rouge (tuer ennemis au sol) - 3 secondes = 180 frames
         self.flying_shield_timer = 0   # Timer pour le bouclier bleu (tuer ennemis volants) - 3 secondes = 180 frames
         self.boss_level_speed_boost = False  # Boost de vitesse en manche 5
         self.bubbles_timer = 0  # Timer pour l'effet de bulles (3 secondes = 180 frames)
-        self.bubbles = []  # Liste des bulles pour l'effet visuel
+        # Bulles pour l'effet visuel (montent, grossissent, s'estompent en 60 frames)
+        self.bubbles = ParticleSystem(BUBBLE_PARTICLE_CAPACITY, shape=BUBBLE, gravity=-0.3,
+                                      growth=0.2, fade_frames=60)
         
     def get_speed(self):
         """Vitesse actuelle : +2 tous les 5 étoiles, +50% en manche 5"""
@@ -33,7 +43,9 @@ class Player:
         return base_speed
         
     def update(self, platforms):
-        """Met à jour la position du joueur avec la physique améliorée"""
+        """Met à jour la position du joueur avec la physique améliorée.
+        platforms : liste de plateformes ou index spatial du niveau (objet avec query(rect))"""
+        self.prev_x, self.prev_y = self.rect.x, self.rect.y
         # Mettre à jour les timers
         if self.jump_bonus_timer > 0:
             self.jump_bonus_timer -= 1
@@ -45,33 +57,15 @@ class Player:
         if self.bubbles_timer > 0:
             self.bubbles_timer -= 1
             # Mettre à jour les bulles existantes
-            import random
-            import math
-            for bubble in self.bubbles[:]:
-                bubble['x'] += bubble['vx']
-                bubble['y'] += bubble['vy']
-                bubble['vy'] -= 0.3  # Les bulles montent
-                bubble['life'] -= 1
-                bubble['size'] += 0.2  # Les bulles grossissent
-                if bubble['life'] <= 0:
-                    self.bubbles.remove(bubble)
+            self.bubbles.update()
             # Ajouter de nouvelles bulles seulement au début (premières frames)
-            if self.bubbles_timer > 150:  # Seulement pendant les premières 0.5 secondes
+            if self.bubbles_timer > SHIELD_DURATION - TICK_RATE // 2:  # Seulement pendant les premières 0.5 secondes
+                import random
                 if len(self.bubbles) < 8 and random.random() < 0.3:  # Moins de bulles
-                    angle = random.uniform(0, 2 * math.pi)
-                    speed = random.uniform(1, 2)
-                    self.bubbles.append({
-                        'x': self.rect.centerx + random.randint(-20, 20),
-                        'y': self.rect.centery + random.randint(-20, 20),
-                        'vx': math.cos(angle) * speed,
-                        'vy': -random.uniform(2, 4),
-                        'size': random.randint(5, 12),
-                        'life': random.randint(30, 60),
-                        'alpha': random.randint(150, 255)
-                    })
+                    emit_bubble(self.bubbles, self.rect.centerx, self.rect.centery)
             # Quand le timer arrive à 0, nettoyer toutes les bulles
             if self.bubbles_timer == 0:
-                self.bubbles = []
+                self.bubbles.clear()
         
         # Appliquer la gravité
         self.velocity_y += GRAVITY
@@ -89,6 +83,12 @@ class Player:
         old_x = self.rect.x
         old_y = self.rect.y
         
+        # Index spatial : seules les plateformes proches du déplacement de cette frame
+        # (marge pour les corrections de position et la tolérance au sol)
+        if hasattr(platforms, "query"):
+            swept = self.rect.union(self.rect.move(int(self.velocity_x), int(self.velocity_y)))
+            platforms = platforms.query(swept.inflate(2 * PLATFORM_HEIGHT, 2 * PLATFORM_HEIGHT))
+        
         # Déplacer horizontalement d'abord
         self.rect.x += int(self.velocity_x)
         
@@ -155,6 +155,7 @@ class Player:
         """Réinitialise la position du joueur"""
         self.rect.x = x
         self.rect.y = y
+        self.prev_x, self.prev_y = x, y
         self.velocity_x = 0
         self.velocity_y = 0
         self.jump_count = 0
@@ -181,115 +182,128 @@ class Player:
             self.jump_count = 2
             self.on_ground = False
     
-    def draw(self, screen):
-        """Dessine le joueur comme un personnage mignon style pixel art"""
-        x, y = self.rect.x, self.rect.y
+    def render_pos(self, alpha=1.0):
+        """Position (x, y) à l'écran entre les deux derniers ticks"""
+        return (int(interpolate(self.prev_x, self.rect.x, alpha)),
+                int(interpolate(self.prev_y, self.rect.y, alpha)))
+    
+    def render_centerx(self, alpha=1.0):
+        """Centre horizontal interpolé (suivi de la caméra)"""
+        return self.render_pos(alpha)[0] + self.rect.width // 2
+    
+    def draw(self, screen, camera_x=0, alpha=1.0):
+        """Dessine le joueur décalé de camera_x (sprite pré-rendu + halos animés)"""
+        x, y = self.render_pos(alpha)
+        x -= camera_x
         w, h = self.rect.width, self.rect.height
-        
-        # Corps principal (forme de blob arrondi)
         body_radius = min(w, h) // 2 - 2
         body_center = (x + w // 2, y + h // 2 + 5)
-        pygame.draw.circle(screen, self.color, body_center, body_radius)
-        pygame.draw.circle(screen, BLACK, body_center, body_radius, 2)
-        
-        # Tête (cercle plus petit au-dessus du corps)
-        head_radius = body_radius - 3
-        head_center = (x + w // 2, y + head_radius + 5)
-        pygame.draw.circle(screen, self.color, head_center, head_radius)
-        pygame.draw.circle(screen, BLACK, head_center, head_radius, 2)
+        show_arrow = self.jump_count < self.max_jumps
+        has_aura = self.jump_bonus_timer > 0 or self.ground_shield_timer > 0 or self.flying_shield_timer > 0
         
-        # Antennes vertes (comme dans l'image)
-        antenna_length = 8
-        antenna_y_start = head_center[1] - head_radius
-        # Antenne gauche
-        pygame.draw.line(screen, GREEN, 
-                        (head_center[0] - 5, antenna_y_start),
-                        (head_center[0] - 5, antenna_y_start - antenna_length), 2)
-        pygame.draw.circle(screen, GREEN, 
-                          (head_center[0] - 5, antenna_y_start - antenna_length), 2)
-        # Antenne droite
-        pygame.draw.line(screen, GREEN,
-                        (head_center[0] + 5, antenna_y_start),
-                        (head_center[0] + 5, antenna_y_start - antenna_length), 2)
-        pygame.draw.circle(screen, GREEN,
-                          (head_center[0] + 5, antenna_y_start - antenna_length), 2)
-        
-        # Yeux mignons (2 cercles)
-        eye_size = 4
-        eye_y = head_center[1] - 2
-        pygame.draw.circle(screen, WHITE, (head_center[0] - 4, eye_y), eye_size)
-        pygame.draw.circle(screen, WHITE, (head_center[0] + 4, eye_y), eye_size)
-        # Pupilles noires
-        pygame.draw.circle(screen, BLACK, (head_center[0] - 4, eye_y), 2)
-        pygame.draw.circle(screen, BLACK, (head_center[0] + 4, eye_y), 2)
-        
-        # Sourire (arc)
-        smile_y = head_center[1] + 3
-        pygame.draw.arc(screen, BLACK,
-                       (head_center[0] - 6, smile_y - 3, 12, 8),
-                       0, 3.14, 2)
-        
-        # Petites jambes (2 cercles en bas)
-        leg_y = y + h - 5
-        pygame.draw.circle(screen, self.color, (x + w // 2 - 4, leg_y), 3)
-        pygame.draw.circle(screen, self.color, (x + w // 2 + 4, leg_y), 3)
-        pygame.draw.circle(screen, BLACK, (x + w // 2 - 4, leg_y), 3, 1)
-        pygame.draw.circle(screen, BLACK, (x + w // 2 + 4, leg_y), 3, 1)
+        # Robot pré-rendu ; la flèche passe au-dessus des halos, on la dessine après eux
+        sprite = _BODY_SPRITES.get(self.color, w, h, show_arrow and not has_aura)
+        screen.blit(sprite, (x - SPRITE_PADDING, y - SPRITE_PADDING))
         
         # Effet visuel du bonus de saut (halo cyan pulsant)
         if self.jump_bonus_timer > 0:
-            import math
             pulse = 1 + 0.3 * math.sin(self.jump_bonus_timer * 0.2)
-            halo_radius = int(body_radius * pulse + 8)
-            # Halo cyan semi-transparent
-            halo_surf = pygame.Surface((halo_radius * 2, halo_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(halo_surf, (0, 255, 255, 100), (halo_radius, halo_radius), halo_radius)
-            screen.blit(halo_surf, (body_center[0] - halo_radius, body_center[1] - halo_radius))
-            # Bordure cyan
-            pygame.draw.circle(screen, CYAN, body_center, halo_radius, 2)
+            self._draw_aura(screen, body_center, int(body_radius * pulse + 8), (0, 255, 255, 100), CYAN)
         
         # Effet visuel des boucliers (halo rouge ou bleu)
         if self.ground_shield_timer > 0:
-            import math
             pulse = 1 + 0.2 * math.sin(self.ground_shield_timer * 0.15)
-            shield_radius = int(body_radius * pulse + 10)
-            # Halo rouge semi-transparent
-            shield_surf = pygame.Surface((shield_radius * 2, shield_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(shield_surf, (255, 100, 100, 120), (shield_radius, shield_radius), shield_radius)
-            screen.blit(shield_surf, (body_center[0] - shield_radius, body_center[1] - shield_radius))
-            # Bordure rouge
-            pygame.draw.circle(screen, RED, body_center, shield_radius, 2)
+            self._draw_aura(screen, body_center, int(body_radius * pulse + 10), (255, 100, 100, 120), RED)
         
         if self.flying_shield_timer > 0:
-            import math
             pulse = 1 + 0.2 * math.sin(self.flying_shield_timer * 0.15)
-            shield_radius = int(body_radius * pulse + 10)
-            # Halo bleu semi-transparent
-            shield_surf = pygame.Surface((shield_radius * 2, shield_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(shield_surf, (100, 150, 255, 120), (shield_radius, shield_radius), shield_radius)
-            screen.blit(shield_surf, (body_center[0] - shield_radius, body_center[1] - shield_radius))
-            # Bordure bleue
-            pygame.draw.circle(screen, BLUE, body_center, shield_radius, 2)
+            self._draw_aura(screen, body_center, int(body_radius * pulse + 10), (100, 150, 255, 120), BLUE)
         
         # Effet de bulles pendant 3 secondes maximum
         if self.bubbles_timer > 0:
-            import math
-            for bubble in self.bubbles:
-                alpha = min(255, int(255 * bubble['life'] / 60))
-                bubble_surf = pygame.Surface((int(bubble['size'] * 2), int(bubble['size'] * 2)), pygame.SRCALPHA)
-                pygame.draw.circle(bubble_surf, (200, 230, 255, alpha), 
-                                 (int(bubble['size']), int(bubble['size'])), int(bubble['size']))
-                screen.blit(bubble_surf, (int(bubble['x'] - bubble['size']), int(bubble['y'] - bubble['size'])))
-                # Bordure blanche
-                pygame.draw.circle(screen, (255, 255, 255, alpha), 
-                                  (int(bubble['x']), int(bubble['y'])), int(bubble['size']), 1)
+            self.bubbles.draw(screen, camera_x)
         
-        # Indicateur de double saut (petite flèche verte)
-        if self.jump_count < self.max_jumps:
-            arrow_points = [
-                (x + w + 3, y - 5),
-                (x + w + 8, y - 10),
-                (x + w + 13, y - 5)
-            ]
-            pygame.draw.polygon(screen, GREEN, arrow_points)
+        # Indicateur de double saut (petite flèche verte) au-dessus des halos
+        if show_arrow and has_aura:
+            _draw_jump_arrow(screen, x, y, w)
+    
+    def _draw_aura(self, screen, center, radius, fill_rgba, border_color):
+        """Blitte un halo pré-rendu centré sur center"""
+        aura = _AURA_LAYERS.get(radius, fill_rgba, border_color)
+        screen.blit(aura, (center[0] - radius - 1, center[1] - radius - 1))
+
+
+def _draw_jump_arrow(surface, x, y, w):
+    """Indicateur de double saut (petite flèche verte)"""
+    arrow_points = [
+        (x + w + 3, y - 5),
+        (x + w + 8, y - 10),
+        (x + w + 13, y - 5)
+    ]
+    pygame.draw.polygon(surface, GREEN, arrow_points)
+
+
+def _bake_body(color, w, h, show_arrow):
+    """Dessine le robot (style pixel art mignon) une fois sur une surface transparente"""
+    surface = pygame.Surface((w + 2 * SPRITE_PADDING, h + 2 * SPRITE_PADDING), pygame.SRCALPHA)
+    x, y = SPRITE_PADDING, SPRITE_PADDING
+    
+    # Corps principal (forme de blob arrondi)
+    body_radius = min(w, h) // 2 - 2
+    body_center = (x + w // 2, y + h // 2 + 5)
+    pygame.draw.circle(surface, color, body_center, body_radius)
+    pygame.draw.circle(surface, BLACK, body_center, body_radius, 2)
+    
+    # Tête (cercle plus petit au-dessus du corps)
+    head_radius = body_radius - 3
+    head_center = (x + w // 2, y + head_radius + 5)
+    pygame.draw.circle(surface, color, head_center, head_radius)
+    pygame.draw.circle(surface, BLACK, head_center, head_radius, 2)
+    
+    # Antennes vertes (comme dans l'image)
+    antenna_length = 8
+    antenna_y_start = head_center[1] - head_radius
+    # Antenne gauche
+    pygame.draw.line(surface, GREEN, 
+                    (head_center[0] - 5, antenna_y_start),
+                    (head_center[0] - 5, antenna_y_start - antenna_length), 2)
+    pygame.draw.circle(surface, GREEN, 
+                      (head_center[0] - 5, antenna_y_start - antenna_length), 2)
+    # Antenne droite
+    pygame.draw.line(surface, GREEN,
+                    (head_center[0] + 5, antenna_y_start),
+                    (head_center[0] + 5, antenna_y_start - antenna_length), 2)
+    pygame.draw.circle(surface, GREEN,
+                      (head_center[0] + 5, antenna_y_start - antenna_length), 2)
+    
+    # Yeux mignons (2 cercles)
+    eye_size = 4
+    eye_y = head_center[1] - 2
+    pygame.draw.circle(surface, WHITE, (head_center[0] - 4, eye_y), eye_size)
+    pygame.draw.circle(surface, WHITE, (head_center[0] + 4, eye_y), eye_size)
+    # Pupilles noires
+    pygame.draw.circle(surface, BLACK, (head_center[0] - 4, eye_y), 2)
+    pygame.draw.circle(surface, BLACK, (head_center[0] + 4, eye_y), 2)
+    
+    # Sourire (arc)
+    smile_y = head_center[1] + 3
+    pygame.draw.arc(surface, BLACK,
+                   (head_center[0] - 6, smile_y - 3, 12, 8),
+                   0, 3.14, 2)
+    
+    # Petites jambes (2 cercles en bas)
+    leg_y = y + h - 5
+    pygame.draw.circle(surface, color, (x + w // 2 - 4, leg_y), 3)
+    pygame.draw.circle(surface, color, (x + w // 2 + 4, leg_y), 3)
+    pygame.draw.circle(surface, BLACK, (x + w // 2 - 4, leg_y), 3, 1)
+    pygame.draw.circle(surface, BLACK, (x + w // 2 + 4, leg_y), 3, 1)
+    
+    if show_arrow:
+        _draw_jump_arrow(surface, x, y, w)
+    return surface
+
+# Sprites du robot : clé = (couleur, largeur, hauteur, flèche de double saut)
+_BODY_SPRITES = SpriteCache(_bake_body)
+# Halos (bonus de saut, boucliers) : clé = (rayon, couleur RGBA, bordure)
+_AURA_LAYERS = SpriteCache(bake_aura)
 
@@ -4,6 +4,7 @@ Avec 2 manettes : chaque joueur appuie sur X (J1) ou Cercle (J2) pour choisir.
 """
 import pygame
 from config import *
+from render_cache import draw_gradient, get_font
 
 # Valeurs spéciales : -1 = pas encore choisi, None = clavier, 0/1 = manette
 UNASSIGNED = -1
@@ -16,9 +17,9 @@ class PlayerSelection:
         self.num_joysticks = num_joysticks
         self.player1_joy_id = UNASSIGNED   # -1, None (clavier), 0, ou 1
         self.player2_joy_id = UNASSIGNED
-        self.font_large = pygame.font.Font(None, 56)
-        self.font_medium = pygame.font.Font(None, 36)
-        self.font_small = pygame.font.Font(None, 28)
+        self.font_large = get_font(56)
+        self.font_medium = get_font(36)
+        self.font_small = get_font(28)
     
     def handle_event(self, event):
         """
@@ -104,14 +105,8 @@ class PlayerSelection:
     
     def draw(self):
         """Dessine l'écran de sélection"""
-        from config import GRADIENT_START, GRADIENT_END
         # Fond dégradé
-        for y in range(SCREEN_HEIGHT):
-            ratio = y / SCREEN_HEIGHT
-            r = int(GRADIENT_START[0] * (1 - ratio) + GRADIENT_END[0] * ratio)
-            g = int(GRADIENT_START[1] * (1 - ratio) + GRADIENT_END[1] * ratio)
-            b = int(GRADIENT_START[2] * (1 - ratio) + GRADIENT_END[2] * ratio)
-            self.screen.fill((r, g, b), (0, y, SCREEN_WIDTH, 1))
+        draw_gradient(self.screen)
         
         # Titre
         title = self.font_large.render("CHOISISSEZ VOTRE JOUEUR", True, YELLOW)
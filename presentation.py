@@ -0,0 +1,233 @@
+"""
+Présentation de la surface de rendu (1200x800) sur l'écran réel
+Sur les écrans statiques (menus...), la frame n'est redessinée que si son
+contenu a changé, et seules les zones modifiées sont envoyées à l'écran avec
+pygame.display.update(rects).
+"""
+import pygame
+from config import *
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+def changed_rects(previous, current, tile=DIRTY_TILE_SIZE):
+    """Zones (alignées sur une grille de tile px) où current diffère de previous.
+    Retourne None si la comparaison n'est pas possible (numpy absent, format de pixels)."""
+    if not HAS_NUMPY or previous.get_size() != current.get_size():
+        return None
+    try:
+        diff = pygame.surfarray.pixels2d(previous) != pygame.surfarray.pixels2d(current)
+    except ValueError:
+        return None
+    width, height = current.get_size()
+    # Une case de la grille est "sale" si au moins un de ses pixels a changé
+    tiles = np.logical_or.reduceat(diff, np.arange(0, width, tile), axis=0)
+    tiles = np.logical_or.reduceat(tiles, np.arange(0, height, tile), axis=1)
+
+    rects = []
+    open_runs = {}  # (x_debut, x_fin) -> Rect en cours d'extension vers le bas
+    for row in range(tiles.shape[1]):
+        runs = {}
+        col = 0
+        columns = tiles[:, row]
+        while col < len(columns):
+            if columns[col]:
+                start = col
+                while col < len(columns) and columns[col]:
+                    col += 1
+                span = (start, col)
+                rect = open_runs.get(span)
+                if rect is None:
+                    rect = pygame.Rect(start * tile, row * tile, (col - start) * tile, tile)
+                    rects.append(rect)
+                else:
+                    rect.height += tile
+                runs[span] = rect
+            col += 1
+        open_runs = runs
+    return [rect.clip(current.get_rect()) for rect in rects]
+
+
+class Presenter:
+    """Met à l'échelle la surface de rendu vers la fenêtre selon le mode choisi :
+    - "smoothscale" : filtrage bilinéaire, étiré plein écran
+    - "scale"       : plus proche voisin, étiré plein écran
+    - "integer"     : facteur entier (net), centré avec bandes noires
+    - "sdl2"        : texture + renderer SDL2 (GPU si disponible, sinon logiciel)
+    """
+
+    def __init__(self, mode=UPSCALE_MODE):
+        self.mode = mode if mode in UPSCALE_MODES else "smoothscale"
+        self.display = None         # Surface de la fenêtre (None en mode sdl2)
+        self.size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.flags = 0
+        self._dest = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)  # Zone de l'image dans la fenêtre
+        self._target = None         # Subsurface de la fenêtre correspondant à _dest
+        self._window = None
+        self._renderer = None
+        self._texture = None
+        self._static_key = None     # Clé de l'écran statique actuellement affiché
+        self._previous = None       # Copie de la dernière frame statique présentée
+        self._idle_frames = 0
+        self.stats = {"full": 0, "partial": 0, "skipped": 0}
+
+    # --- Fenêtre -----------------------------------------------------------
+
+    def open_display(self, size, flags=0):
+        """(Ré)ouvre la fenêtre à la taille donnée et retourne sa taille réelle"""
+        self.size, self.flags = tuple(size), flags
+        if self.mode == "sdl2" and not self._open_sdl2():
+            print("[WARN] Renderer SDL2 indisponible, retour à smoothscale")
+            self.mode = "smoothscale"
+        if self.mode != "sdl2":
+            self._close_sdl2()
+            self.display = pygame.display.set_mode(self.size, flags)
+            self.size = self.display.get_size()
+            self.display.fill(BLACK)
+        self._dest = self._compute_dest()
+        self._target = self.display.subsurface(self._dest) if self.display is not None else None
+        self.invalidate()
+        return self.size
+
+    def set_mode(self, mode):
+        """Change de mode de mise à l'échelle (rouvre la fenêtre si nécessaire)"""
+        if mode not in UPSCALE_MODES or mode == self.mode:
+            return
+        if mode == "sdl2" and self.display is not None:
+            # Une fenêtre ne peut pas avoir à la fois une surface et un renderer
+            pygame.display.quit()
+            pygame.display.init()
+            self.display = None
+        self.mode = mode
+        self.open_display(self.size, self.flags)
+
+    def next_mode(self):
+        """Passe au mode suivant (touche F10) et retourne son nom"""
+        self.set_mode(UPSCALE_MODES[(UPSCALE_MODES.index(self.mode) + 1) % len(UPSCALE_MODES)])
+        return self.mode
+
+    def _open_sdl2(self):
+        try:
+            from pygame._sdl2.video import Window, Renderer, Texture
+        except ImportError:
+            return False
+        if self._window is None:
+            caption = pygame.display.get_caption()
+            self._window = Window(caption[0] if caption else "Cyber Jump", size=self.size,
+                                  borderless=bool(self.flags & pygame.NOFRAME))
+            self._renderer = Renderer(self._window, accelerated=-1)
+            self._texture = Texture(self._renderer, (SCREEN_WIDTH, SCREEN_HEIGHT), streaming=True)
+        else:
+            self._window.size = self.size
+            self._window.borderless = bool(self.flags & pygame.NOFRAME)
+        self.size = self._window.size
+        return True
+
+    def _close_sdl2(self):
+        if self._window is not None:
+            self._texture = None
+            self._renderer = None
+            self._window.destroy()
+            self._window = None
+
+    def _compute_dest(self):
+        """Zone de la fenêtre occupée par l'image"""
+        width, height = self.size
+        if self.mode != "integer":
+            return pygame.Rect(0, 0, width, height)
+        factor = min(width // SCREEN_WIDTH, height // SCREEN_HEIGHT)
+        if factor >= 1:
+            dest_w, dest_h = SCREEN_WIDTH * factor, SCREEN_HEIGHT * factor
+        else:
+            # Fenêtre plus petite que le jeu : réduction en gardant les proportions
+            ratio = min(width / SCREEN_WIDTH, height / SCREEN_HEIGHT)
+            dest_w, dest_h = int(SCREEN_WIDTH * ratio), int(SCREEN_HEIGHT * ratio)
+        return pygame.Rect((width - dest_w) // 2, (height - dest_h) // 2, dest_w, dest_h)
+
+    def snapshot(self):
+        """Copie de l'image affichée (captures d'écran)"""
+        if self._renderer is not None:
+            return self._renderer.to_surface()
+        return self.display.copy()
+
+    # --- Écrans statiques --------------------------------------------------
+
+    def invalidate(self):
+        """Force une présentation complète à la prochaine frame"""
+        self._static_key = None
+        self._previous = None
+
+    def needs_redraw(self, static_key):
+        """Écran statique : faut-il redessiner la frame ?
+        Un rafraîchissement de sécurité a lieu toutes les STATIC_REFRESH_FRAMES frames."""
+        if static_key == self._static_key and self._idle_frames < STATIC_REFRESH_FRAMES:
+            self._idle_frames += 1
+            self.stats["skipped"] += 1
+            return False
+        return True
+
+    # --- Présentation ------------------------------------------------------
+
+    def present(self, screen):
+        """Présentation complète (écrans animés)"""
+        self._static_key = None
+        self._previous = None
+        self._present_full(screen)
+
+    def present_static(self, screen, static_key):
+        """Présente un écran statique en n'envoyant que les zones modifiées"""
+        rects = None
+        if self._previous is not None and self._renderer is None:
+            rects = changed_rects(self._previous, screen)
+        if rects is None or sum(r.width * r.height for r in rects) > screen.get_width() * screen.get_height() // 2:
+            self._present_full(screen)
+        elif rects:
+            self._present_rects(screen, rects)
+        self._static_key = static_key
+        self._idle_frames = 0
+        if self._previous is None:
+            self._previous = screen.copy()
+        elif rects is None or rects:
+            self._previous.blit(screen, (0, 0))
+
+    def _scale(self, screen):
+        """Met à l'échelle screen dans la zone cible de la fenêtre (sans allocation)"""
+        if self.mode == "smoothscale":
+            pygame.transform.smoothscale(screen, self._dest.size, self._target)
+        elif self._dest.size == screen.get_size():
+            self._target.blit(screen, (0, 0))
+        else:
+            pygame.transform.scale(screen, self._dest.size, self._target)
+
+    def _present_full(self, screen):
+        if self._renderer is not None:
+            self._texture.update(screen)
+            self._renderer.clear()
+            self._renderer.blit(self._texture, self._dest)
+            self._renderer.present()
+        else:
+            self._scale(screen)
+            pygame.display.flip()
+        self.stats["full"] += 1
+
+    def _present_rects(self, screen, rects):
+        """Met à jour la frame puis n'envoie à l'écran que les zones modifiées"""
+        # Toute la frame est remise à l'échelle : le filtrage bilinéaire de pygame
+        # ne donne pas exactement le même résultat sur une sous-zone
+        self._scale(screen)
+        src_w, src_h = screen.get_size()
+        dest = self._dest
+        updated = []
+        for rect in rects:
+            # 1px de marge : le filtrage bilinéaire déborde légèrement des zones modifiées
+            area = rect.inflate(2, 2)
+            x0 = dest.x + area.left * dest.width // src_w
+            y0 = dest.y + area.top * dest.height // src_h
+            x1 = dest.x - (-area.right * dest.width // src_w)
+            y1 = dest.y - (-area.bottom * dest.height // src_h)
+            updated.append(pygame.Rect(x0, y0, x1 - x0, y1 - y0))
+        pygame.display.update(updated)
+        self.stats["partial"] += 1
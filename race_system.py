@@ -1,8 +1,10 @@
 """
 Système de course chronométré
 """
-import pygame
 from config import *
+from timestep import sim_clock
+from render_cache import get_font
+from effect_pool import effect_pool
 
 class RaceSystem:
     def __init__(self):
@@ -23,7 +25,7 @@ class RaceSystem:
         """Démarre la course"""
         self.race_started = True
         self.race_finished = False
-        self.start_time = pygame.time.get_ticks() / 1000  # Temps en secondes
+        self.start_time = sim_clock.seconds()  # Temps de simulation en secondes
         self.current_time = 0
         self.player1_time = 0
         self.player2_time = 0
@@ -34,7 +36,7 @@ class RaceSystem:
     def update(self):
         """Met à jour le chronomètre"""
         if self.race_started and not self.race_finished:
-            self.current_time = (pygame.time.get_ticks() / 1000) - self.start_time
+            self.current_time = sim_clock.seconds() - self.start_time
     
     def finish_race(self, player_id="player1"):
         """Termine la course pour un joueur"""
@@ -54,7 +56,7 @@ class RaceSystem:
     
     def draw_timer(self, screen, x, y, color=WHITE):
         """Dessine le chronomètre"""
-        font = pygame.font.Font(None, 48)
+        font = get_font(48)
         time_str = self.get_time_string(self.current_time)
         text = font.render(time_str, True, color)
         screen.blit(text, (x, y))
@@ -62,8 +64,8 @@ class RaceSystem:
     
     def draw_race_hud(self, screen, match_manager, player=None, level=None):
         """Dessine l'interface de course"""
-        font = pygame.font.Font(None, 32)
-        font_small = pygame.font.Font(None, 24)
+        font = get_font(32)
+        font_small = get_font(24)
         
         # Titre de la manche et niveau
         level_id = min(match_manager.current_round - 1, 4)
@@ -79,8 +81,8 @@ class RaceSystem:
             # Vérifier si le boss explose (victoire)
             if level.boss and level.boss.exploding:
                 # Message de victoire quand le boss explose avec le score
-                victory_font = pygame.font.Font(None, 56)
-                score_font = pygame.font.Font(None, 36)
+                victory_font = get_font(56)
+                score_font = get_font(36)
                 victory_text = victory_font.render("🎉 VOUS AVEZ GAGNÉ ! 🎉", True, YELLOW)
                 victory_rect = victory_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 60))
                 
@@ -108,13 +110,11 @@ class RaceSystem:
                 score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
                 
                 # Fond semi-transparent
-                overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, 200))
-                screen.blit(overlay, (0, 0))
+                screen.blit(effect_pool.fill((SCREEN_WIDTH, SCREEN_HEIGHT), BLACK, 200), (0, 0))
                 screen.blit(victory_text, victory_rect)
                 screen.blit(score_text, score_rect)
             else:
-                elapsed_ms = pygame.time.get_ticks() - level.boss_start_time
+                elapsed_ms = sim_clock.get_ticks() - level.boss_start_time
                 elapsed_seconds = elapsed_ms / 1000.0
                 remaining_seconds = max(0, 195 - elapsed_seconds)  # 3min15 = 195 secondes
                 minutes = int(remaining_seconds // 60)
@@ -127,7 +127,7 @@ class RaceSystem:
         
         # Indicateur du bonus de saut (étoiles bleues)
         if player and getattr(player, 'jump_bonus_timer', 0) > 0:
-            bonus_seconds = int(player.jump_bonus_timer / 60) + 1
+            bonus_seconds = int(player.jump_bonus_timer / TICK_RATE) + 1
             bonus_text = font_small.render(
                 f"⭐ Bonus Saut Actif: {bonus_seconds}s - Tuez les ennemis en l'air!",
                 True, CYAN
@@ -138,7 +138,16 @@ class RaceSystem:
         timer_y = 60
         timer_label = font_small.render("Temps:", True, WHITE)
         screen.blit(timer_label, (20, timer_y))
-        self.draw_timer(screen, 20, timer_y + 30, YELLOW)
+        timer_w = self.draw_timer(screen, 20, timer_y + 30, YELLOW)
+        
+        # Distance jusqu'au prochain checkpoint (index des checkpoints du niveau),
+        # arrondie à 10 px pour réutiliser les textes en cache
+        if player and level:
+            checkpoint = level.next_checkpoint(player)
+            if checkpoint is not None:
+                distance = (checkpoint[0] - player.rect.centerx) // 10 * 10
+                checkpoint_text = font_small.render(f"🚩 Checkpoint dans {distance} px", True, GREEN)
+                screen.blit(checkpoint_text, (40 + timer_w, timer_y + 42))
         
         # Points (course + combat)
         y_offset = 150
@@ -0,0 +1,135 @@
+"""
+Caches de rendu partagés entre les écrans
+Les surfaces coûteuses à produire (dégradés plein écran...) sont calculées une
+seule fois puis simplement blittées à chaque frame.
+Les polices sont chargées une seule fois par taille, et les textes rendus sont
+gardés dans un cache LRU partagé.
+"""
+from collections import OrderedDict
+import pygame
+from config import *
+
+# Cache des dégradés : clé = ((largeur, hauteur), couleur_debut, couleur_fin)
+_gradient_cache = {}
+
+
+def get_gradient(size, start=GRADIENT_START, end=GRADIENT_END):
+    """Retourne la surface du dégradé vertical start -> end (construite une seule fois)"""
+    key = ((int(size[0]), int(size[1])), tuple(start), tuple(end))
+    surface = _gradient_cache.get(key)
+    if surface is None:
+        width, height = key[0]
+        surface = pygame.Surface((width, height))
+        for y in range(height):
+            ratio = y / height
+            r = int(start[0] * (1 - ratio) + end[0] * ratio)
+            g = int(start[1] * (1 - ratio) + end[1] * ratio)
+            b = int(start[2] * (1 - ratio) + end[2] * ratio)
+            surface.fill((r, g, b), (0, y, width, 1))
+        _gradient_cache[key] = surface
+    return surface
+
+
+def draw_gradient(screen, start=GRADIENT_START, end=GRADIENT_END):
+    """Dessine le dégradé sur screen.
+    Si screen est une subsurface (moitié d'écran en split-screen), on blitte la
+    portion correspondante du dégradé de la surface parente : les deux moitiés
+    partagent ainsi la même surface en cache."""
+    parent = screen.get_abs_parent()
+    gradient = get_gradient(parent.get_size(), start, end)
+    if parent is screen:
+        screen.blit(gradient, (0, 0))
+    else:
+        area = pygame.Rect(screen.get_abs_offset(), screen.get_size())
+        screen.blit(gradient, (0, 0), area)
+
+
+def clear_gradient_cache():
+    """Vide le cache des dégradés (changement de résolution...)"""
+    _gradient_cache.clear()
+
+
+class TextCache:
+    """Cache LRU des textes rendus : clé = (police, texte, couleur, antialias, fond)"""
+
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        self.max_size = max_size
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, size, text, antialias, color, background=None):
+        """Retourne la surface du texte (rendue au premier appel).
+        La surface est partagée : elle ne doit pas être modifiée par l'appelant."""
+        key = (size, text, tuple(color), bool(antialias),
+               tuple(background) if background is not None else None)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def stats(self):
+        """Compteurs du cache (affichage debug / benchmark)"""
+        total = self.hits + self.misses
+        return {"size": len(self._surfaces), "hits": self.hits, "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0}
+
+    def __len__(self):
+        return len(self._surfaces)
+
+
+class CachedFont:
+    """Police par défaut d'une taille donnée ; render() passe par le cache de textes.
+    Les autres méthodes (size, get_linesize...) sont celles de pygame.font.Font."""
+
+    def __init__(self, point_size, text_cache):
+        self.point_size = point_size
+        self.font = pygame.font.Font(None, point_size)
+        self._text_cache = text_cache
+
+    def render(self, text, antialias, color, background=None):
+        return self._text_cache.render(self.font, self.point_size, text, antialias, color, background)
+
+    def __getattr__(self, name):
+        return getattr(self.font, name)
+
+
+class FontCache:
+    """Polices partagées par taille (chargées une seule fois depuis le disque)"""
+
+    def __init__(self, text_cache):
+        self.text_cache = text_cache
+        self._fonts = {}
+
+    def get(self, size):
+        font = self._fonts.get(size)
+        if font is None:
+            font = CachedFont(size, self.text_cache)
+            self._fonts[size] = font
+        return font
+
+    def clear(self):
+        self._fonts.clear()
+        self.text_cache.clear()
+
+
+text_cache = TextCache()
+font_cache = FontCache(text_cache)
+
+
+def get_font(size):
+    """Police par défaut (Font(None, size)) partagée, avec rendu des textes en cache"""
+    return font_cache.get(int(size))
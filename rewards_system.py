@@ -1,9 +1,10 @@
 """
 Système de récompenses - Affiche et gère les récompenses après chaque course
 """
-import pygame
-import random
 from config import *
+from render_cache import draw_gradient, get_font
+from effect_pool import effect_pool
+from particles import ParticleSystem, emit_confetti
 
 class RewardsSystem:
     def __init__(self, match_manager, on_transition_to_combat=None):
@@ -12,7 +13,9 @@ class RewardsSystem:
         self.showing_rewards = False
         self.display_timer = 0
         self.display_duration = 3
-        self.victory_particles = []
+        # Confettis : tombent (gravité 0.15) et disparaissent sous l'écran
+        self.victory_particles = ParticleSystem(CONFETTI_PARTICLE_CAPACITY, gravity=0.15,
+                                                alpha=230, kill_below=SCREEN_HEIGHT + 20)
         
     def show_rewards(self):
         """Affiche les récompenses (animation victoire UNIQUEMENT après manche 5)"""
@@ -23,31 +26,16 @@ class RewardsSystem:
         
     def _create_confetti(self):
         """Crée des particules de confetti pour l'animation victoire"""
-        self.victory_particles = []
-        colors = [YELLOW, ORANGE, GREEN, BLUE, PINK, RED, PURPLE]
-        for _ in range(80):
-            self.victory_particles.append({
-                "x": random.randint(0, SCREEN_WIDTH),
-                "y": random.randint(-SCREEN_HEIGHT, 0),
-                "vx": random.uniform(-3, 3),
-                "vy": random.uniform(2, 8),
-                "size": random.randint(4, 12),
-                "color": random.choice(colors),
-                "rot": random.uniform(0, 360),
-                "rot_speed": random.uniform(-15, 15),
-            })
+        self.victory_particles.clear()
+        emit_confetti(self.victory_particles, [YELLOW, ORANGE, GREEN, BLUE, PINK, RED, PURPLE])
         
     def update(self):
         """Met à jour l'affichage des récompenses"""
         if self.showing_rewards:
-            self.display_timer += 1/60
+            self.display_timer += TICK_DT
             # Mettre à jour les particules de confetti (manche 5 uniquement)
             if self.match_manager.current_round == self.match_manager.num_rounds:
-                for p in self.victory_particles:
-                    p["x"] += p["vx"]
-                    p["y"] += p["vy"]
-                    p["vy"] += 0.15
-                    p["rot"] += p["rot_speed"]
+                self.victory_particles.update()
             
             if self.display_timer >= self.display_duration:
                 # Si manche 4, passer directement à la manche 5 (round_intro)
@@ -85,34 +73,19 @@ class RewardsSystem:
         # Fond : dégradé violet (manches 1-4) ou overlay sombre (manche 5 avec confettis)
         is_last_round = self.match_manager.current_round == self.match_manager.num_rounds
         if is_last_round:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.set_alpha(220)
-            overlay.fill(BLACK)
-            screen.blit(overlay, (0, 0))
+            screen.blit(effect_pool.fill((SCREEN_WIDTH, SCREEN_HEIGHT), BLACK, 220), (0, 0))
         else:
-            from config import GRADIENT_START, GRADIENT_END
-            for y in range(SCREEN_HEIGHT):
-                ratio = y / SCREEN_HEIGHT
-                r = int(GRADIENT_START[0] * (1 - ratio) + GRADIENT_END[0] * ratio)
-                g = int(GRADIENT_START[1] * (1 - ratio) + GRADIENT_END[1] * ratio)
-                b = int(GRADIENT_START[2] * (1 - ratio) + GRADIENT_END[2] * ratio)
-                screen.fill((r, g, b), (0, y, SCREEN_WIDTH, 1))
+            draw_gradient(screen)
         
         # Animation victoire : confetti + "VOUS AVEZ GAGNÉ!" UNIQUEMENT après manche 5
         is_last_round = self.match_manager.current_round == self.match_manager.num_rounds
         if is_last_round and self.display_timer < 2.5:
-            for p in self.victory_particles:
-                if p["y"] < SCREEN_HEIGHT + 20:
-                    s = pygame.Surface((p["size"], p["size"]))
-                    s.fill(p["color"])
-                    s.set_alpha(230)
-                    rect = s.get_rect(center=(int(p["x"]), int(p["y"])))
-                    screen.blit(s, rect)
+            self.victory_particles.draw(screen)
             
             # "VOUS AVEZ GAGNÉ!" avec effet bounce/zoom
             bounce = abs(((self.display_timer * 4) % 2) - 1) * 8 + 1
             font_size = int(48 + 20 * bounce)
-            font_victory = pygame.font.Font(None, font_size)
+            font_victory = get_font(font_size)
             victory_text = font_victory.render("🎉 VOUS AVEZ GAGNÉ ! 🎉", True, YELLOW)
             victory_rect = victory_text.get_rect(center=(SCREEN_WIDTH // 2, 120))
             # Ombre
@@ -120,17 +93,17 @@ class RewardsSystem:
             screen.blit(shadow, (victory_rect.x + 3, victory_rect.y + 3))
             screen.blit(victory_text, victory_rect)
             # Sous-titre animé
-            sub = pygame.font.Font(None, 28).render("Course terminée !", True, GREEN)
+            sub = get_font(28).render("Course terminée !", True, GREEN)
             screen.blit(sub, (SCREEN_WIDTH // 2 - sub.get_width() // 2, 170))
         
         # Titre récompenses (position selon si victoire affichée)
-        font_large = pygame.font.Font(None, 56)
+        font_large = get_font(56)
         title = font_large.render("🎁 RÉCOMPENSES 🎁", True, YELLOW)
         title_y = 100 if (not is_last_round or self.display_timer >= 2.5) else 220
         screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, title_y))
         
         # Informations de la manche
-        font_medium = pygame.font.Font(None, 32)
+        font_medium = get_font(32)
         round_text = font_medium.render(
             f"Manche {self.match_manager.current_round}/{self.match_manager.num_rounds}",
             True, WHITE
@@ -151,7 +124,7 @@ class RewardsSystem:
                                      SCREEN_WIDTH // 2 + 200, y_start, GREEN)
         
         # Instructions (manche 5 = pas de combat)
-        font_small = pygame.font.Font(None, 24)
+        font_small = get_font(24)
         if is_last_round:
             instruction = font_small.render("Match terminé ! Bravo !", True, GREEN)
             hint = font_small.render("Espace/Entrée : Résultats  |  ESC : Menu", True, GRAY)
@@ -163,7 +136,7 @@ class RewardsSystem:
     
     def _draw_player_rewards(self, screen, player_name, rewards, x, y, color):
         """Dessine les récompenses d'un joueur"""
-        font = pygame.font.Font(None, 28)
+        font = get_font(28)
         
         # Nom du joueur
         name_text = font.render(player_name, True, color)
@@ -3,12 +3,14 @@ Gestion des paramètres du jeu avec sauvegarde
 """
 import json
 import os
+from config import UPSCALE_MODE
 
 SETTINGS_FILE = "settings.json"
 
 class Settings:
     def __init__(self):
         self.joystick_enabled = True  # Par défaut activé si manette détectée
+        self.upscale_mode = UPSCALE_MODE  # Mise à l'échelle de l'image vers l'écran
         self.load_settings()
     
     def load_settings(self):
@@ -18,6 +20,7 @@ class Settings:
                 with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     self.joystick_enabled = data.get("joystick_enabled", True)
+                    self.upscale_mode = data.get("upscale_mode", UPSCALE_MODE)
             except (json.JSONDecodeError, IOError):
                 self.joystick_enabled = True
         else:
@@ -27,13 +30,19 @@ class Settings:
         """Sauvegarde les paramètres dans le fichier JSON"""
         try:
             data = {
-                "joystick_enabled": self.joystick_enabled
+                "joystick_enabled": self.joystick_enabled,
+                "upscale_mode": self.upscale_mode
             }
             with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2)
         except IOError:
             print("Erreur lors de la sauvegarde des paramètres")
     
+    def set_upscale_mode(self, mode):
+        """Change le mode de mise à l'échelle et le sauvegarde"""
+        self.upscale_mode = mode
+        self.save_settings()
+    
     def toggle_joystick(self):
         """Active/désactive la manette"""
         self.joystick_enabled = not self.joystick_enabled
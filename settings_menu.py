@@ -3,6 +3,7 @@ Menu des paramètres
 """
 import pygame
 from config import *
+from render_cache import get_font
 
 class SettingsMenu:
     def __init__(self, screen, settings):
@@ -10,9 +11,9 @@ class SettingsMenu:
         self.settings = settings
         self.selected_option = 0
         self.options = ["Manette PS4", "Retour"]
-        self.font_title = pygame.font.Font(None, 72)
-        self.font_option = pygame.font.Font(None, 48)
-        self.font_small = pygame.font.Font(None, 32)
+        self.font_title = get_font(72)
+        self.font_option = get_font(48)
+        self.font_small = get_font(32)
     
     def handle_event(self, event):
         """Gère les événements du menu paramètres"""
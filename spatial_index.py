@@ -0,0 +1,150 @@
+"""
+Index spatiaux (culling de la vue, collisions avec les plateformes)
+- IntervalIndex : éléments triés par bord gauche de leur étendue ; ceux qui
+  recouvrent un intervalle [left, right] (la vue de la caméra) sont trouvés par
+  recherche dichotomique (bisect) au lieu de tester tout le niveau.
+- SpatialHash : grille uniforme de cases pour les collisions avec les plateformes.
+- CheckpointIndex : checkpoints triés par x (contact et prochain checkpoint par bisect).
+"""
+from bisect import bisect_left, bisect_right
+import pygame
+from config import *
+
+
+def rect_extent(item):
+    """Étendue horizontale par défaut : celle du rect de l'élément"""
+    return item.rect.left, item.rect.right
+
+
+class IntervalIndex:
+    """Éléments indexés par leur étendue horizontale (left, right).
+    extent(item) peut être plus large que le rect (zone de patrouille d'un ennemi) :
+    tant que le rect reste dans l'étendue indexée, l'index reste valide."""
+
+    def __init__(self, items=(), extent=rect_extent):
+        self.extent = extent
+        self.rebuild(items)
+
+    def rebuild(self, items):
+        """Reconstruit l'index (à appeler quand la liste d'éléments change)"""
+        entries = []
+        for order, item in enumerate(items):
+            left, right = self.extent(item)
+            entries.append((left, order, right, item))
+        entries.sort(key=lambda entry: (entry[0], entry[1]))
+        self._lefts = [entry[0] for entry in entries]
+        self._entries = entries
+        self._extents = {id(entry[3]): (entry[0], entry[2]) for entry in entries}
+        self._max_width = max([entry[2] - entry[0] for entry in entries] + [0])
+
+    def __len__(self):
+        return len(self._entries)
+
+    def covers(self, item, left, right):
+        """L'étendue indexée de item contient-elle [left, right] ?"""
+        extent = self._extents.get(id(item))
+        return extent is not None and extent[0] <= left and right <= extent[1]
+
+    def query(self, left, right):
+        """Éléments dont l'étendue recoupe [left, right], dans l'ordre de la liste d'origine"""
+        return [item for order, item in self.query_ordered(left, right)]
+
+    def query_ordered(self, left, right):
+        """Comme query, avec le rang de chaque élément dans la liste d'origine : [(rang, élément)]"""
+        lo = bisect_left(self._lefts, left - self._max_width)
+        hi = bisect_right(self._lefts, right)
+        found = [(order, item) for extent_left, order, extent_right, item in self._entries[lo:hi]
+                 if extent_right >= left]
+        found.sort(key=lambda entry: entry[0])
+        return found
+
+
+class SpatialHash:
+    """Grille uniforme : chaque case (colonne, rangée) liste les éléments qui la recouvrent.
+    Construite une fois (les plateformes ne bougent pas) ; query(rect) ne regarde que
+    les cases recouvertes par rect au lieu de tout le niveau."""
+
+    def __init__(self, items, cell_size=SPATIAL_CELL_SIZE):
+        self.cell_size = cell_size
+        self._items = list(items)
+        self._buckets = {}  # (colonne, rangée) -> indices des éléments (ordre de la liste)
+        self.bounds = None  # Rect englobant tous les éléments
+        for order, item in enumerate(self._items):
+            rect = item.rect
+            self.bounds = rect.copy() if self.bounds is None else self.bounds.union(rect)
+            for cell in self._cells(rect):
+                self._buckets.setdefault(cell, []).append(order)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def _cells(self, rect):
+        """Cases recouvertes par rect, bords inclus (un contact compte)"""
+        size = self.cell_size
+        for col in range(rect.left // size, rect.right // size + 1):
+            for row in range(rect.top // size, rect.bottom // size + 1):
+                yield col, row
+
+    def column(self, left, right):
+        """Rect couvrant [left, right] sur toute la hauteur indexée"""
+        if self.bounds is None:
+            return pygame.Rect(left, 0, right - left, 0)
+        return pygame.Rect(left, self.bounds.top, right - left, self.bounds.height)
+
+    def query(self, rect):
+        """Éléments candidats au contact avec rect, dans l'ordre de la liste d'origine"""
+        return [item for order, item in self.query_ordered(rect)]
+
+    def query_ordered(self, rect):
+        """Comme query, avec le rang de chaque élément dans la liste d'origine : [(rang, élément)]"""
+        if self.bounds is None:
+            return []
+        limits = self.bounds.inflate(2, 2)
+        if not limits.colliderect(rect):
+            return []
+        area = rect.clip(limits)
+        found = set()
+        buckets = self._buckets
+        for cell in self._cells(area):
+            bucket = buckets.get(cell)
+            if bucket:
+                found.update(bucket)
+        items = self._items
+        return [(order, items[order]) for order in sorted(found)]
+
+
+class CheckpointIndex:
+    """Checkpoints (x, y) triés par x. Les checkpoints franchis par un joueur sont un
+    masque de bits : le bit i correspond à checkpoints[i] (ordre de la liste d'origine)."""
+
+    def __init__(self, checkpoints=()):
+        self.checkpoints = list(checkpoints)
+        entries = sorted((cx, order) for order, (cx, cy) in enumerate(self.checkpoints))
+        self._xs = [entry[0] for entry in entries]
+        self._orders = [entry[1] for entry in entries]
+
+    def __len__(self):
+        return len(self.checkpoints)
+
+    def touching(self, x, y, reached=0):
+        """Rang du premier checkpoint (ordre de la liste) non franchi à portée de (x, y), ou None"""
+        lo = bisect_left(self._xs, x - CHECKPOINT_REACH_X)
+        hi = bisect_right(self._xs, x + CHECKPOINT_REACH_X)
+        found = None
+        for order in self._orders[lo:hi]:
+            if reached >> order & 1 or abs(y - self.checkpoints[order][1]) >= CHECKPOINT_REACH_Y:
+                continue
+            if found is None or order < found:
+                found = order
+        return found
+
+    def next_after(self, x, reached=0):
+        """Rang du premier checkpoint non franchi strictement à droite de x, ou None"""
+        orders = self._orders
+        for i in range(bisect_right(self._xs, x), len(orders)):
+            if not reached >> orders[i] & 1:
+                return orders[i]
+        return None
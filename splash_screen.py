@@ -5,15 +5,17 @@ import pygame
 import math
 import random
 from config import *
+from render_cache import draw_gradient, get_font
+from effect_pool import effect_pool
 
 class SplashScreen:
     def __init__(self, screen):
         self.screen = screen
         self.timer = 0
         self.finished = False
-        self.font_title = pygame.font.Font(None, 96)
-        self.font_subtitle = pygame.font.Font(None, 36)
-        self.font_press = pygame.font.Font(None, 28)
+        self.font_title = get_font(96)
+        self.font_subtitle = get_font(36)
+        self.font_press = get_font(28)
         
         # Animation du titre
         self.title_scale = 0.0
@@ -33,7 +35,7 @@ class SplashScreen:
     
     def update(self):
         """Met à jour l'animation"""
-        self.timer += 1/60  # 60 FPS
+        self.timer += TICK_DT  # Un tick de simulation
         
         # Animation du titre (apparition et zoom)
         if self.timer < 1.5:
@@ -68,19 +70,12 @@ class SplashScreen:
     def draw(self):
         """Dessine l'écran d'accueil"""
         # Fond dégradé violet/bleu nuit
-        for y in range(SCREEN_HEIGHT):
-            ratio = y / SCREEN_HEIGHT
-            r = int(GRADIENT_START[0] * (1 - ratio) + GRADIENT_END[0] * ratio)
-            g = int(GRADIENT_START[1] * (1 - ratio) + GRADIENT_END[1] * ratio)
-            b = int(GRADIENT_START[2] * (1 - ratio) + GRADIENT_END[2] * ratio)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        draw_gradient(self.screen)
         
         # Dessiner les étoiles
         for star in self.stars:
             alpha = int(128 + 127 * math.sin(star['twinkle']))
-            star_surface = pygame.Surface((star['size'] * 2, star['size'] * 2), pygame.SRCALPHA)
-            pygame.draw.circle(star_surface, (*STAR_COLOR[:3], alpha), 
-                             (star['size'], star['size']), star['size'])
+            star_surface = effect_pool.disc(star['size'], STAR_COLOR, alpha)
             self.screen.blit(star_surface, (int(star['x']) - star['size'], 
                                            int(star['y']) - star['size']))
         
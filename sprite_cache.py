@@ -0,0 +1,75 @@
+"""
+Cache de sprites pré-rendus ("baking")
+Un sprite composé de nombreuses primitives est dessiné une seule fois sur une
+Surface, puis simplement blitté à chaque frame.
+"""
+import pygame
+
+
+class SpriteCache:
+    """Cache générique : clé -> Surface produite par la fonction bake(*clé)"""
+
+    def __init__(self, bake):
+        self._bake = bake
+        self._sprites = {}
+
+    def get(self, *key):
+        """Retourne le sprite associé à la clé (le construit au premier appel)"""
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._bake(*key)
+            self._sprites[key] = sprite
+        return sprite
+
+    def clear(self):
+        """Oublie tous les sprites (ils seront reconstruits à la demande)"""
+        self._sprites.clear()
+
+    def __len__(self):
+        return len(self._sprites)
+
+
+def bake_aura(radius, fill_rgba, border_color, border_width=2):
+    """Halo circulaire : disque semi-transparent + bordure opaque.
+    La surface fait 2*radius+2 de côté, le centre est en (radius+1, radius+1)."""
+    size = radius * 2 + 2
+    center = (radius + 1, radius + 1)
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    disc = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(disc, fill_rgba, (radius, radius), radius)
+    surface.blit(disc, (1, 1))
+    pygame.draw.circle(surface, border_color, center, radius, border_width)
+    return surface
+
+
+class SpriteAtlas:
+    """Atlas d'animation : toutes les frames d'un sprite rangées sur une seule surface.
+    L'atlas est construit au premier dessin ; dessiner une frame = un seul blit."""
+
+    def __init__(self, frame_size, keys, draw_frame, columns=8):
+        self.frame_size = frame_size
+        self.surface = None
+        self._keys = list(keys)
+        self._draw_frame = draw_frame
+        self._columns = columns
+        self._rects = {}
+
+    def build(self):
+        """Dessine toutes les frames (draw_frame(frame, *clé)) dans l'atlas"""
+        frame_w, frame_h = self.frame_size
+        columns = min(self._columns, len(self._keys))
+        rows = (len(self._keys) + columns - 1) // columns
+        self.surface = pygame.Surface((columns * frame_w, rows * frame_h), pygame.SRCALPHA)
+        for i, key in enumerate(self._keys):
+            rect = pygame.Rect((i % columns) * frame_w, (i // columns) * frame_h, frame_w, frame_h)
+            self._draw_frame(self.surface.subsurface(rect), *key)
+            self._rects[key] = rect
+
+    def blit(self, screen, key, pos):
+        """Blitte la frame key avec son coin haut-gauche en pos"""
+        if self.surface is None:
+            self.build()
+        screen.blit(self.surface, pos, self._rects[key])
+
+    def __len__(self):
+        return len(self._keys)
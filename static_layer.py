@@ -0,0 +1,84 @@
+"""
+Couche statique d'un niveau : plateformes, checkpoints et drapeau d'arrivée
+pré-rendus dans des colonnes (chunks) de largeur fixe.
+Dessiner le décor revient à blitter les 3-4 colonnes qui recouvrent la caméra ;
+une colonne est rendue la première fois qu'elle est visible.
+"""
+from collections import OrderedDict
+import pygame
+from config import *
+
+
+class StaticLayer:
+    def __init__(self, level, chunk_width=STATIC_CHUNK_WIDTH, max_chunks=STATIC_CHUNK_CACHE):
+        self.level = level
+        self.chunk_width = chunk_width
+        self.max_chunks = max_chunks
+        self.chunk_height = SCREEN_HEIGHT
+        self._chunks = OrderedDict()  # index -> Surface (ordre = dernier usage)
+        self._index_contents()
+
+    def _index_contents(self):
+        """Répartit les éléments statiques par colonne (un élément large va dans plusieurs colonnes)"""
+        level = self.level
+        spans = [(p.rect.left, p.rect.right) for p in level.platforms]
+        spans += [(cx - 16, cx + 16) for cx, cy in level.checkpoints]
+        if level.level_type != "boss":
+            spans.append((level.end_x - 10, level.end_x + 60))  # Drapeau + texte "GOAL"
+        self.origin_x = int(min([0] + [left for left, right in spans]))
+        right = max([SCREEN_WIDTH] + [right for left, right in spans])
+        self.num_chunks = int(right - self.origin_x) // self.chunk_width + 1
+
+        self._platforms = [[] for _ in range(self.num_chunks)]
+        for platform in level.platforms:
+            for i in self._chunk_range(platform.rect.left, platform.rect.right):
+                self._platforms[i].append(platform)
+        self._checkpoints = [[] for _ in range(self.num_chunks)]
+        for cx, cy in level.checkpoints:
+            for i in self._chunk_range(cx - 16, cx + 16):
+                self._checkpoints[i].append((cx, cy))
+        self._goal_chunks = set()
+        if level.level_type != "boss":
+            self._goal_chunks.update(self._chunk_range(level.end_x - 10, level.end_x + 60))
+
+    def _chunk_range(self, left, right):
+        """Indices des colonnes recouvertes par l'intervalle [left, right["""
+        first = max(0, int(left - self.origin_x) // self.chunk_width)
+        last = min(self.num_chunks - 1, int(right - self.origin_x) // self.chunk_width)
+        return range(first, last + 1)
+
+    def invalidate(self):
+        """À appeler si le décor statique du niveau a changé"""
+        self._chunks.clear()
+        self._index_contents()
+
+    def _get_chunk(self, i):
+        chunk = self._chunks.get(i)
+        if chunk is None:
+            chunk = self._render_chunk(i)
+            self._chunks[i] = chunk
+            if len(self._chunks) > self.max_chunks:
+                self._chunks.popitem(last=False)
+        else:
+            self._chunks.move_to_end(i)
+        return chunk
+
+    def _render_chunk(self, i):
+        """Dessine le décor statique de la colonne i sur une surface transparente"""
+        chunk = pygame.Surface((self.chunk_width, self.chunk_height), pygame.SRCALPHA)
+        chunk_x = self.origin_x + i * self.chunk_width
+        for platform in self._platforms[i]:
+            platform.draw(chunk, chunk_x)
+        self.level.draw_checkpoints(chunk, chunk_x, self._checkpoints[i])
+        if i in self._goal_chunks:
+            self.level.draw_goal(chunk, chunk_x)
+        # Surface surtout transparente : l'encodage RLE rend le blit quasi gratuit
+        chunk.set_alpha(255, pygame.RLEACCEL)
+        return chunk
+
+    def draw(self, screen, camera_x=0):
+        """Blitte les colonnes visibles"""
+        view_w = screen.get_width()
+        for i in self._chunk_range(camera_x, camera_x + view_w - 1):
+            chunk_x = self.origin_x + i * self.chunk_width
+            screen.blit(self._get_chunk(i), (int(chunk_x - camera_x), 0))
@@ -5,6 +5,8 @@ Le gagnant remporte 5 points
 import pygame
 import random
 from config import *
+from render_cache import get_font
+from effect_pool import effect_pool
 
 class TicTacToeSystem:
     def __init__(self, match_manager):
@@ -194,21 +196,18 @@ class TicTacToeSystem:
             return
         
         # Fond
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill(BLACK)
-        screen.blit(overlay, (0, 0))
+        screen.blit(effect_pool.fill((SCREEN_WIDTH, SCREEN_HEIGHT), BLACK, 200), (0, 0))
         
         # Titre
-        font_large = pygame.font.Font(None, 56)
+        font_large = get_font(56)
         title = font_large.render("🎮 MORPION 🎮", True, YELLOW)
         screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 50))
-        subtitle = pygame.font.Font(None, 28).render("5 points pour le gagnant!", True, CYAN)
+        subtitle = get_font(28).render("5 points pour le gagnant!", True, CYAN)
         screen.blit(subtitle, (SCREEN_WIDTH // 2 - subtitle.get_width() // 2, 100))
         
         # Instructions détaillées
-        font_small = pygame.font.Font(None, 24)
-        font_tiny = pygame.font.Font(None, 20)
+        font_small = get_font(24)
+        font_tiny = get_font(20)
         
         if self.match_manager.game_mode == "pvp":
             if self.current_player == 'X':
@@ -276,7 +275,7 @@ class TicTacToeSystem:
         
         # Message de fin
         if self.game_over:
-            font_medium = pygame.font.Font(None, 48)
+            font_medium = get_font(48)
             if self.winner == 'X':
                 msg = "Joueur 1 gagne! +5 points"
                 color = RED
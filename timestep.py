@@ -0,0 +1,68 @@
+"""
+Boucle à pas fixe
+La simulation avance par ticks de TICK_DT secondes, quel que soit le temps mis
+à dessiner une image : une image lente est rattrapée par plusieurs ticks (dans
+la limite de MAX_CATCHUP_TICKS), et les chronomètres de jeu lisent l'horloge de
+simulation au lieu de l'horloge murale.
+"""
+from config import *
+
+
+def interpolate(previous, current, alpha):
+    """Position affichée entre le tick précédent et le tick courant (alpha = fraction de tick)"""
+    if abs(current - previous) > MAX_INTERPOLATION_STEP:
+        return current
+    return previous + (current - previous) * alpha
+
+
+class SimulationClock:
+    """Horloge de la simulation : avance d'un tick à chaque mise à jour du jeu"""
+
+    def __init__(self):
+        self.ticks = 0
+
+    def advance(self):
+        self.ticks += 1
+
+    def get_ticks(self):
+        """Temps de simulation écoulé en millisecondes (même usage que pygame.time.get_ticks)"""
+        return self.ticks * 1000 // TICK_RATE
+
+    def seconds(self):
+        """Temps de simulation écoulé en secondes"""
+        return self.ticks * TICK_DT
+
+
+# Horloge partagée par tous les systèmes de jeu (chronomètres, durée des items, timer du boss)
+sim_clock = SimulationClock()
+
+
+class FixedTimestep:
+    """Accumulateur de temps réel converti en ticks de simulation"""
+
+    def __init__(self, tick_rate=TICK_RATE, max_catchup=MAX_CATCHUP_TICKS):
+        self.dt = 1 / tick_rate
+        self.max_catchup = max_catchup
+        self.accumulator = 0.0
+        self.stats = {"ticks": 0, "frames": 0, "dropped_ticks": 0}
+
+    def advance(self, frame_seconds):
+        """Ajoute la durée de la dernière image et retourne le nombre de ticks à exécuter"""
+        self.accumulator += frame_seconds
+        ticks = int(self.accumulator / self.dt)
+        if ticks > self.max_catchup:
+            # Trop de retard (fenêtre déplacée, chargement...) : on abandonne le surplus
+            # plutôt que d'enchaîner des dizaines de ticks sans affichage
+            self.stats["dropped_ticks"] += ticks - self.max_catchup
+            ticks = self.max_catchup
+            self.accumulator = self.accumulator % self.dt
+        else:
+            self.accumulator -= ticks * self.dt
+        self.stats["ticks"] += ticks
+        self.stats["frames"] += 1
+        return ticks
+
+    @property
+    def alpha(self):
+        """Fraction de tick écoulée depuis le dernier tick (0..1), pour interpoler le dessin"""
+        return min(1.0, self.accumulator / self.dt)